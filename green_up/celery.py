@@ -2,6 +2,7 @@
 import os
 from celery import Celery
 from dotenv import load_dotenv
+from kombu import Queue
 
 # Load environment variables from .env before anything else
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -17,6 +18,67 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
 
+# ----------------- QUEUES -----------------
+# Each queue is consumed by its own worker pool (see WORKER_POOLS) so that a
+# long export or document job can never sit in front of a 2FA or reset code.
+TRANSACTIONAL_QUEUE = "transactional"
+NOTIFICATIONS_QUEUE = "notifications"
+DOCUMENTS_QUEUE = "documents"
+EXPORTS_QUEUE = "exports"
+MAINTENANCE_QUEUE = "maintenance"
+
+app.conf.task_queues = (
+    Queue(TRANSACTIONAL_QUEUE),
+    Queue(NOTIFICATIONS_QUEUE),
+    Queue(DOCUMENTS_QUEUE),
+    Queue(EXPORTS_QUEUE),
+    Queue(MAINTENANCE_QUEUE),
+)
+app.conf.task_default_queue = NOTIFICATIONS_QUEUE
+
+
+# ----------------- ROUTING -----------------
+# Explicit task names first, then module-level globs as a safety net for new tasks.
+app.conf.task_routes = {
+    "green_up_apps.users.tasks.auth_email_task.*": {"queue": TRANSACTIONAL_QUEUE},
+    "green_up_apps.admission.tasks.admission_task.notify_admission_pending": {"queue": NOTIFICATIONS_QUEUE},
+    "green_up_apps.admission.tasks.send_admission_emails.send_admission_emails": {"queue": NOTIFICATIONS_QUEUE},
+    "green_up_apps.admission.tasks.admission_digest.send_admin_digest": {"queue": NOTIFICATIONS_QUEUE},
+    "green_up_apps.admission.tasks.bulk_mail.send_bulk_campaign": {"queue": EXPORTS_QUEUE},
+    "green_up_apps.*.tasks.documents.*": {"queue": DOCUMENTS_QUEUE},
+    "green_up_apps.*.tasks.exports.*": {"queue": EXPORTS_QUEUE},
+    "green_up_apps.*.tasks.maintenance.*": {"queue": MAINTENANCE_QUEUE},
+}
+
+
+# ----------------- WORKER POOLS -----------------
+# One worker entry point per queue class (see green_up/workers.py).
+# Short transactional jobs get a prefetch of 1 so an idle process always picks
+# the next code immediately instead of waiting behind a reserved batch.
+WORKER_POOLS = {
+    "transactional": {
+        "queues": [TRANSACTIONAL_QUEUE],
+        "concurrency": int(os.environ.get("CELERY_TRANSACTIONAL_CONCURRENCY", 2)),
+        "prefetch_multiplier": 1,
+    },
+    "notifications": {
+        "queues": [NOTIFICATIONS_QUEUE],
+        "concurrency": int(os.environ.get("CELERY_NOTIFICATIONS_CONCURRENCY", 2)),
+        "prefetch_multiplier": 4,
+    },
+    "bulk": {
+        "queues": [DOCUMENTS_QUEUE, EXPORTS_QUEUE],
+        "concurrency": int(os.environ.get("CELERY_BULK_CONCURRENCY", 1)),
+        "prefetch_multiplier": 1,
+    },
+    "maintenance": {
+        "queues": [MAINTENANCE_QUEUE],
+        "concurrency": int(os.environ.get("CELERY_MAINTENANCE_CONCURRENCY", 1)),
+        "prefetch_multiplier": 1,
+    },
+}
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 from decouple import config
+from celery.schedules import crontab
 import environ
 import os
 import dj_database_url
@@ -50,6 +51,7 @@ INSTALLED_APPS = [
     'green_up_apps.apropos',
     'green_up_apps.formation',
     'formtools',
+    'django_celery_beat',
     "crispy_forms",
     "crispy_tailwind",
 ]
@@ -60,14 +62,20 @@ CRISPY_TEMPLATE_PACK = "tailwind"
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'green_up_apps.global_data.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.locale.LocaleMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
+    'green_up_apps.global_data.middleware.ConditionalPageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
+# Dynamic responses (CompressionMiddleware): brotli 4-6 compresses close to gzip -9 at gzip -6 CPU cost
+RESPONSE_COMPRESSION = {
+    'BROTLI_QUALITY': 5,
+}
 
 ROOT_URLCONF = 'green_up.urls'
 
@@ -78,18 +86,32 @@ TEMPLATES = [
             os.path.join(BASE_DIR, 'templates'),
             os.path.join(BASE_DIR, 'green_up_apps', 'templates'),
         ],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 "django.template.context_processors.debug",
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'green_up_apps.global_data.context_processors.release',
+            ],
+            # Compiled templates are kept per process; in development the autoreloader
+            # resets this cache when a template file changes. Whitespace is stripped
+            # from .html sources before compiling (global_data/template_loaders.py).
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'green_up_apps.global_data.template_loaders.FilesystemLoader',
+                    'green_up_apps.global_data.template_loaders.AppDirectoriesLoader',
+                ]),
             ],
         },
     },
 ]
 
+# Compile every template when a gunicorn worker boots (green_up/wsgi.py)
+TEMPLATE_WARMUP = config("TEMPLATE_WARMUP", cast=bool, default=True)
+# Lifetime of the cached navbar/topbar/footer fragments ({% cache %} in base.html)
+TEMPLATE_FRAGMENT_TIMEOUT = 60 * 60
+
 
 WSGI_APPLICATION = 'green_up.wsgi.application'
 
@@ -127,16 +149,126 @@ EMAIL_USE_SSL = config("EMAIL_USE_SSL", cast=bool)
 EMAIL_HOST_USER = config("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
+
+# Outgoing SMTP budget shared by transactional and bulk mail (see global_data/rate_governor.py)
+EMAIL_RATE_LIMIT_PER_MINUTE = config("EMAIL_RATE_LIMIT_PER_MINUTE", cast=int, default=120)
+# Bulk campaigns: concurrent SMTP sessions and recipients rendered per batch
+BULK_MAIL_CONCURRENCY = config("BULK_MAIL_CONCURRENCY", cast=int, default=4)
+BULK_MAIL_CHUNK_SIZE = config("BULK_MAIL_CHUNK_SIZE", cast=int, default=200)
 SITE_NAME = 'green_up'
 
 REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
 
+# Shared Redis caches; each process falls back to a local cache while Redis is
+# unreachable (see global_data/cache.py). Bump CACHE_VERSION to drop every key,
+# or one entry of CACHE_NAMESPACE_VERSIONS to drop a single app's keys.
+CACHE_VERSION = config("CACHE_VERSION", cast=int, default=1)
+CACHES = {
+    'default': {
+        'BACKEND': 'green_up_apps.global_data.cache.FallbackRedisCache',
+        'LOCATION': REDIS_URL,
+        'KEY_PREFIX': 'green_up',
+        'VERSION': CACHE_VERSION,
+        'TIMEOUT': 300,
+    },
+    # Sessions and authenticated user snapshots
+    'sessions': {
+        'BACKEND': 'green_up_apps.global_data.cache.FallbackRedisCache',
+        'LOCATION': REDIS_URL,
+        'KEY_PREFIX': 'sessions',
+        'TIMEOUT': 60 * 60 * 24 * 14,
+    },
+}
+CACHE_NAMESPACE_VERSIONS = {
+    'users': 1,
+    'admission': 1,
+    'formation': 1,
+    'pages': 1,
+}
+
+# Full-page cache of the anonymous marketing pages (global_data/page_cache.py).
+# RELEASE_VERSION is set per deploy (e.g. the git commit), which drops every cached page.
+RELEASE_VERSION = config("RELEASE_VERSION", default="dev")
+PAGE_CACHE_ENABLED = config("PAGE_CACHE_ENABLED", cast=bool, default=True)
+# À-propos pages written by "manage.py render_static_site" (global_data/prerender.py)
+PRERENDER_ROOT = BASE_DIR / 'build' / 'prerendered'
+PRERENDERED_PAGES_ENABLED = config("PRERENDERED_PAGES_ENABLED", cast=bool, default=True)
+PAGE_CACHE_INVALIDATED_BY = [
+    'users.CompanySettings',
+    'users.Partners',
+    'admission.Program',
+    'admission.Campus',
+    'admission.AdmissionSeason',
+    'formation.Formation',
+    'formation.FormationOption',
+]
+
+# Per-process LRU caches of reference data (global_data/local_cache.py) are evicted
+# across gunicorn and Celery workers through Redis pub/sub (global_data/invalidation.py).
+CACHE_INVALIDATION_BUS = config("CACHE_INVALIDATION_BUS", cast=bool, default=True)
+
+# Sessions are read from Redis and written through to the database
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'sessions'
+
+# Serves request.user from a cached snapshot, see users/backends.py
+AUTHENTICATION_BACKENDS = ['green_up_apps.users.backends.CachedModelBackend']
+USER_SNAPSHOT_TIMEOUT = 60 * 15
+
+# One-time codes (2FA, password reset) stored in Redis, see users/otp.py
+OTP_TTL_SECONDS = 600
+OTP_MAX_ATTEMPTS = 5
+
+# Reverse proxies in front of the app appending to X-Forwarded-For (1 on Render, 0 when
+# exposed directly): the client IP used by the throttles is read at that offset.
+NUM_PROXIES = config("NUM_PROXIES", cast=int, default=1)
+
+# Sliding-window limits for auth endpoints, see global_data/throttling.py.
+# Each dimension maps to (max requests, window in seconds).
+THROTTLE_RATES = {
+    'login': {'ip': (20, 60), 'email': (10, 300), 'global': (600, 60)},
+    'register': {'ip': (5, 600), 'email': (3, 600), 'global': (200, 60)},
+    'verify_2fa': {'ip': (20, 600), 'email': (10, 600), 'global': (600, 60)},
+    'password_reset_request': {'ip': (5, 600), 'email': (3, 600), 'global': (200, 60)},
+    'password_reset_verify': {'ip': (20, 600), 'email': (10, 600), 'global': (600, 60)},
+}
+
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'Africa/Douala'  # Adjust to your timezone
+CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
+
+# Admins in digest mode receive one summary of new applications per interval
+ADMIN_DIGEST_INTERVAL_MINUTES = config("ADMIN_DIGEST_INTERVAL_MINUTES", cast=int, default=60)
+
+# Registrations that never completed 2FA are deleted after this grace period
+UNVERIFIED_USER_GRACE_HOURS = config("UNVERIFIED_USER_GRACE_HOURS", cast=int, default=72)
+USER_REAPER_BATCH_SIZE = 500
+
+CELERY_BEAT_SCHEDULE = {
+    'send-admin-admission-digest': {
+        'task': 'green_up_apps.admission.tasks.admission_digest.send_admin_digest',
+        'schedule': ADMIN_DIGEST_INTERVAL_MINUTES * 60,
+    },
+    'reap-unverified-users': {
+        'task': 'green_up_apps.users.tasks.maintenance.reap_unverified_users',
+        'schedule': crontab(hour=3, minute=30),
+    },
+}
+
+# New passwords use the first hasher. Logins on an older hash or cost are
+# rehashed after the login response (users/password_upgrade.py); measure the options
+# on the target box with `python manage.py benchmark_hashers`.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -193,6 +325,20 @@ STATICFILES_DIRS = [
 
 STATIC_ROOT = BASE_DIR / "staticfiles"   # folder where collectstatic will put all files
 
+# collectstatic also builds AVIF/WebP variants of the images for {% responsive_image %}
+STATICFILES_FINDERS = [
+    'django.contrib.staticfiles.finders.FileSystemFinder',
+    'django.contrib.staticfiles.finders.AppDirectoriesFinder',
+    'green_up_apps.global_data.responsive_images.ResponsiveImageFinder',
+]
+RESPONSIVE_IMAGES = {
+    'SOURCE_PREFIX': 'images/',
+    'WIDTHS': [480, 960, 1600],
+    'FORMATS': ['avif', 'webp'],
+    'QUALITY': {'avif': 50, 'webp': 75},
+    'BUILD_DIR': BASE_DIR / 'build' / 'static',
+}
+
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 MEDIA_URL = "/media/"
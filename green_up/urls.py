@@ -20,6 +20,7 @@ from django.views.i18n import JavaScriptCatalog
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    # Fallback for {% js_catalog %} when compile_js_catalogs has not been run
     path('jsi18n/', JavaScriptCatalog.as_view(), name='javascript_catalog'),
     path('', include('green_up_apps.users.urls', namespace='users')),
     path('admission/', include('green_up_apps.admission.urls', namespace='admission')),
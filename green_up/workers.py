@@ -0,0 +1,44 @@
+"""
+Worker entry point per queue class.
+
+Usage:
+    python -m green_up.workers transactional
+    python -m green_up.workers bulk --loglevel=warning
+
+The pool name selects the queues, concurrency and prefetch settings declared in
+``green_up.celery.WORKER_POOLS``; any extra arguments are passed to the worker.
+"""
+import sys
+
+from green_up.celery import WORKER_POOLS, app
+
+
+def build_worker_argv(pool_name, extra_args=None):
+    """Return the ``celery worker`` argv for the given pool."""
+    try:
+        pool = WORKER_POOLS[pool_name]
+    except KeyError:
+        raise SystemExit(f"Unknown worker pool '{pool_name}'. Choose from: {', '.join(WORKER_POOLS)}")
+
+    argv = [
+        "worker",
+        f"--queues={','.join(pool['queues'])}",
+        f"--concurrency={pool['concurrency']}",
+        f"--prefetch-multiplier={pool['prefetch_multiplier']}",
+        f"--hostname={pool_name}@%h",
+    ]
+    extra_args = list(extra_args or [])
+    if not any(arg.startswith("--loglevel") for arg in extra_args):
+        argv.append("--loglevel=info")
+    return argv + extra_args
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        raise SystemExit(f"Usage: python -m green_up.workers <pool> [celery args]. Pools: {', '.join(WORKER_POOLS)}")
+    app.worker_main(build_worker_argv(argv[0], argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
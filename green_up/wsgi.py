@@ -14,3 +14,11 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'green_up.settings')
 
 application = get_wsgi_application()
+
+# Each gunicorn worker imports this module: compile the templates before serving traffic
+from django.conf import settings  # noqa: E402
+
+if settings.TEMPLATE_WARMUP:
+    from green_up_apps.global_data.template_warmup import warm_template_cache
+
+    warm_template_cache()
@@ -1,10 +1,14 @@
 from django.contrib import admin
+from django.db.models import Count, Q
+from django.utils import timezone
+from green_up_apps.global_data.enums import BulkMailCampaignStatusChoices, BulkMailRecipientStatusChoices
 from .models import (
     Campus,
     Program,
     AdmissionSeason,
     EUAdmissionApplication,
     NonEUAdmissionApplication,
+    BulkMailCampaign,
 )
 
 # ----------------- CAMPUS -----------------
@@ -92,3 +96,61 @@ class EUAdmissionApplicationAdmin(admin.ModelAdmin):
     def get_email(self, obj):
         return obj.user.email
     get_email.short_description = "Email"
+
+
+# ----------------- BULK MAIL -----------------
+@admin.register(BulkMailCampaign)
+class BulkMailCampaignAdmin(admin.ModelAdmin):
+    list_display = ("subject", "season", "application_status", "campaign_status", "get_sent", "get_failed", "get_pending", "started_at", "finished_at")
+    list_filter = ("campaign_status", "season")
+    search_fields = ("subject",)
+    readonly_fields = ("campaign_status", "recipients_loaded", "started_at", "finished_at")
+    actions = ("start_campaign", "retry_failed")
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            sent_count=Count("recipients", filter=Q(recipients__delivery_status=BulkMailRecipientStatusChoices.SENT)),
+            failed_count=Count("recipients", filter=Q(recipients__delivery_status=BulkMailRecipientStatusChoices.FAILED)),
+            pending_count=Count("recipients", filter=Q(recipients__delivery_status=BulkMailRecipientStatusChoices.PENDING)),
+        )
+
+    def get_sent(self, obj):
+        return obj.sent_count
+    get_sent.short_description = "Sent"
+
+    def get_failed(self, obj):
+        return obj.failed_count
+    get_failed.short_description = "Failed"
+
+    def get_pending(self, obj):
+        return obj.pending_count
+    get_pending.short_description = "Pending"
+
+    @admin.action(description="Start or resume sending")
+    def start_campaign(self, request, queryset):
+        from green_up_apps.admission.tasks.bulk_mail import send_bulk_campaign
+
+        # A running campaign is not queued again; the task also refuses to run it twice
+        campaigns = queryset.exclude(
+            campaign_status__in=[BulkMailCampaignStatusChoices.COMPLETED, BulkMailCampaignStatusChoices.RUNNING]
+        )
+        for campaign in campaigns:
+            send_bulk_campaign.delay(str(campaign.id))
+        self.message_user(request, f"{campaigns.count()} campaign(s) queued.")
+
+    @admin.action(description="Retry failed recipients")
+    def retry_failed(self, request, queryset):
+        from green_up_apps.admission.models import BulkMailRecipient
+        from green_up_apps.admission.tasks.bulk_mail import send_bulk_campaign
+
+        reset = BulkMailRecipient.objects.filter(
+            campaign__in=queryset, delivery_status=BulkMailRecipientStatusChoices.FAILED
+        ).update(delivery_status=BulkMailRecipientStatusChoices.PENDING, error="")
+        # A running campaign picks the reset recipients up in its next chunks
+        stopped = queryset.exclude(campaign_status=BulkMailCampaignStatusChoices.RUNNING)
+        stopped.filter(campaign_status=BulkMailCampaignStatusChoices.COMPLETED).update(
+            campaign_status=BulkMailCampaignStatusChoices.INTERRUPTED, modified=timezone.now()
+        )
+        for campaign in stopped:
+            send_bulk_campaign.delay(str(campaign.id))
+        self.message_user(request, f"{reset} failed recipient(s) queued again.")
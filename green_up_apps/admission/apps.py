@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ApropoConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'green_up_apps.admission'
+
+    def ready(self):
+        from . import signals  # noqa: F401
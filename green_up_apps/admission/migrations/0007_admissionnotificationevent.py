@@ -0,0 +1,40 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:31
+
+import django.db.models.deletion
+import django_extensions.db.fields
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0006_program_entry_level'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdmissionNotificationEvent',
+            fields=[
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('status', models.IntegerField(choices=[(0, 'Inactive'), (1, 'Active')], default=1, verbose_name='status')),
+                ('activate_date', models.DateTimeField(blank=True, help_text='keep empty for an immediate activation', null=True)),
+                ('deactivate_date', models.DateTimeField(blank=True, help_text='keep empty for indefinite activation', null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('is_deleted', models.BooleanField(default=False, help_text='Marks the record as deleted without removing it.')),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Stores additional metadata in JSON format.', null=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, help_text='IP address associated with the record creation or update.', null=True)),
+                ('application_id', models.UUIDField(help_text='ID of the submitted application.')),
+                ('application_type', models.CharField(choices=[('eu', 'EU resident'), ('non_eu', 'Non-EU resident')], help_text='Type of the submitted application (EU or non-EU).', max_length=20)),
+                ('applicant_name', models.CharField(help_text='Full name of the applicant at submission time.', max_length=255)),
+                ('campus', models.ForeignKey(help_text='Campus selected in the application.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='admission.campus')),
+                ('program', models.ForeignKey(help_text='Program selected in the application.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='admission.program')),
+            ],
+            options={
+                'verbose_name': 'Admission Notification Event',
+                'verbose_name_plural': 'Admission Notification Events',
+                'ordering': ['created'],
+            },
+        ),
+    ]
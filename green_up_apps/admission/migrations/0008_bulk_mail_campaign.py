@@ -0,0 +1,71 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:33
+
+import django.db.models.deletion
+import django_extensions.db.fields
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0007_admissionnotificationevent'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BulkMailCampaign',
+            fields=[
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('status', models.IntegerField(choices=[(0, 'Inactive'), (1, 'Active')], default=1, verbose_name='status')),
+                ('activate_date', models.DateTimeField(blank=True, help_text='keep empty for an immediate activation', null=True)),
+                ('deactivate_date', models.DateTimeField(blank=True, help_text='keep empty for indefinite activation', null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('is_deleted', models.BooleanField(default=False, help_text='Marks the record as deleted without removing it.')),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Stores additional metadata in JSON format.', null=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, help_text='IP address associated with the record creation or update.', null=True)),
+                ('application_status', models.CharField(blank=True, choices=[('pending', 'Pending'), ('reviewed', 'Reviewed'), ('accepted', 'Accepted'), ('rejected', 'Rejected')], help_text='Only target applications with this status (leave empty for all applicants).', max_length=50)),
+                ('subject', models.CharField(help_text='Email subject.', max_length=255)),
+                ('body', models.TextField(help_text='Email body. Django template syntax is allowed, e.g. {{ first_name }}, {{ program_name }}, {{ campus_name }}.')),
+                ('campaign_status', models.CharField(choices=[('draft', 'Draft'), ('running', 'Running'), ('completed', 'Completed'), ('interrupted', 'Interrupted')], default='draft', help_text='Sending state of the campaign.', max_length=20)),
+                ('recipients_loaded', models.BooleanField(default=False, help_text='Whether the recipient list has been built; a resumed campaign keeps its list.')),
+                ('started_at', models.DateTimeField(blank=True, help_text='When sending started.', null=True)),
+                ('finished_at', models.DateTimeField(blank=True, help_text='When sending finished.', null=True)),
+                ('season', models.ForeignKey(help_text='Season whose applicants receive the campaign.', on_delete=django.db.models.deletion.PROTECT, related_name='bulk_mail_campaigns', to='admission.admissionseason')),
+            ],
+            options={
+                'verbose_name': 'Bulk Mail Campaign',
+                'verbose_name_plural': 'Bulk Mail Campaigns',
+                'ordering': ['-created'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BulkMailRecipient',
+            fields=[
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('status', models.IntegerField(choices=[(0, 'Inactive'), (1, 'Active')], default=1, verbose_name='status')),
+                ('activate_date', models.DateTimeField(blank=True, help_text='keep empty for an immediate activation', null=True)),
+                ('deactivate_date', models.DateTimeField(blank=True, help_text='keep empty for indefinite activation', null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('is_deleted', models.BooleanField(default=False, help_text='Marks the record as deleted without removing it.')),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Stores additional metadata in JSON format.', null=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, help_text='IP address associated with the record creation or update.', null=True)),
+                ('email', models.EmailField(help_text='Address the campaign is sent to.', max_length=254)),
+                ('delivery_status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', help_text='Delivery outcome for this recipient.', max_length=20)),
+                ('error', models.TextField(blank=True, help_text='Last delivery error, if any.')),
+                ('sent_at', models.DateTimeField(blank=True, help_text='When the email was accepted by the SMTP server.', null=True)),
+                ('campaign', models.ForeignKey(help_text='Campaign this recipient belongs to.', on_delete=django.db.models.deletion.CASCADE, related_name='recipients', to='admission.bulkmailcampaign')),
+                ('user', models.ForeignKey(help_text='Recipient user.', on_delete=django.db.models.deletion.CASCADE, related_name='bulk_mail_receipts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Bulk Mail Recipient',
+                'verbose_name_plural': 'Bulk Mail Recipients',
+                'indexes': [models.Index(fields=['campaign', 'delivery_status', 'id'], name='admission_b_campaig_905936_idx')],
+                'constraints': [models.UniqueConstraint(fields=('campaign', 'user'), name='unique_bulk_mail_recipient')],
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:44
+
+import green_up_apps.global_data.identifiers
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0008_bulk_mail_campaign'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='admissionnotificationevent',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='admissionseason',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='bulkmailcampaign',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='bulkmailrecipient',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='campus',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='diploma',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='euadmissionapplication',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='noneuadmissionapplication',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='program',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+    ]
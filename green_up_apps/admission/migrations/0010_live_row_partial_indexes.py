@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0009_uuid7_primary_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campus',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['name'], name='campus_name_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='euadmissionapplication',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['status', '-application_date'], name='eu_app_status_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='euadmissionapplication',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['season', 'program'], name='eu_app_season_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='noneuadmissionapplication',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['status', '-application_date'], name='noneu_app_status_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='noneuadmissionapplication',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['season', 'program'], name='noneu_app_season_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='program',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['level', 'name'], name='program_level_name_live_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0010_live_row_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='admissionnotificationevent',
+            name='claimed_until',
+            field=models.DateTimeField(blank=True, help_text='Set while a digest run is sending this event, so overlapping runs skip it.', null=True),
+        ),
+        migrations.AddField(
+            model_name='admissionnotificationevent',
+            name='sent_to',
+            field=models.JSONField(blank=True, default=list, help_text='Digest admins who already received this event; it is deleted once every one of them has.'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0011_admissionnotificationevent_delivery'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bulkmailrecipient',
+            name='delivery_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', help_text='Delivery outcome for this recipient.', max_length=20),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0012_bulkmailrecipient_sending'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='bulkmailrecipient',
+            name='unique_bulk_mail_recipient',
+        ),
+        migrations.RemoveIndex(
+            model_name='campus',
+            name='campus_name_live_idx',
+        ),
+        migrations.AlterField(
+            model_name='admissionseason',
+            name='name',
+            field=models.CharField(help_text='Name of the season (e.g., October 2025, February 2026).', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='campus',
+            name='name',
+            field=models.CharField(help_text='Name of the campus (e.g., Paris, Reims).', max_length=100),
+        ),
+        migrations.AddConstraint(
+            model_name='admissionseason',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('name',), name='admission_season_name_live_uniq', violation_error_message='An admission season with this name already exists.'),
+        ),
+        migrations.AddConstraint(
+            model_name='bulkmailrecipient',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('campaign', 'user'), name='unique_bulk_mail_recipient_live'),
+        ),
+        migrations.AddConstraint(
+            model_name='campus',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('name',), name='campus_name_live_uniq', violation_error_message='A campus with this name already exists.'),
+        ),
+    ]
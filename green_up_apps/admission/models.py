@@ -12,6 +12,9 @@ from green_up_apps.global_data.enums import (
     ApplicationStatusChoices,
     ApprenticeshipChoices,
     EntryLevelChoices,
+    ApplicationTypeChoices,
+    BulkMailCampaignStatusChoices,
+    BulkMailRecipientStatusChoices,
 )
 
 # ----------------- CAMPUS -----------------
@@ -23,13 +26,20 @@ class Campus(GreenUpBaseModel):
     """
     name = models.CharField(
         max_length=100,
-        unique=True,
         help_text=_("Name of the campus (e.g., Paris, Reims).")
     )
 
     class Meta:
         verbose_name = _("Campus")
         verbose_name_plural = _("Campuses")
+        # Unique among live rows only, like the default manager that validate_unique() uses;
+        # also serves the name lookups the campus_name_live_idx index used to
+        constraints = [
+            models.UniqueConstraint(
+                fields=['name'], condition=models.Q(is_deleted=False), name='campus_name_live_uniq',
+                violation_error_message=_("A campus with this name already exists."),
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -73,6 +83,9 @@ class Program(GreenUpBaseModel):
     class Meta:
         verbose_name = _("Program")
         verbose_name_plural = _("Programs")
+        indexes = [
+            models.Index(fields=['level', 'name'], name='program_level_name_live_idx', condition=models.Q(is_deleted=False)),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.level})"
@@ -123,7 +136,6 @@ class AdmissionSeason(GreenUpBaseModel):
     """
     name = models.CharField(
         max_length=100,
-        unique=True,
         help_text=_("Name of the season (e.g., October 2025, February 2026).")
     )
     academic_year = models.CharField(
@@ -142,6 +154,12 @@ class AdmissionSeason(GreenUpBaseModel):
         verbose_name = _("Admission Season")
         verbose_name_plural = _("Admission Seasons")
         ordering = ["-start_date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['name'], condition=models.Q(is_deleted=False), name='admission_season_name_live_uniq',
+                violation_error_message=_("An admission season with this name already exists."),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.academic_year})"
@@ -271,7 +289,7 @@ class AdmissionApplication(GreenUpBaseModel):
         self.user.email = form_data.get('email', self.user.email)
         self.user.save()
 
-        profile, created = Profile.objects.get_or_create(user=self.user)
+        profile, created = Profile.all_objects.get_or_create(user=self.user)
         profile.phone_number = form_data.get('phone_number', profile.phone_number)
         profile.address = form_data.get('address', profile.address)
         profile.zip_code = form_data.get('zip_code', profile.zip_code)
@@ -312,6 +330,10 @@ class NonEUAdmissionApplication(AdmissionApplication):
     class Meta:
         verbose_name = _("Non-EU Admission Application")
         verbose_name_plural = _("Non-EU Admission Applications")
+        indexes = [
+            models.Index(fields=['status', '-application_date'], name='noneu_app_status_live_idx', condition=models.Q(is_deleted=False)),
+            models.Index(fields=['season', 'program'], name='noneu_app_season_live_idx', condition=models.Q(is_deleted=False)),
+        ]
         
 # ----------------- EU APPLICATION -----------------
 class EUAdmissionApplication(AdmissionApplication):
@@ -343,9 +365,151 @@ class EUAdmissionApplication(AdmissionApplication):
     class Meta:
         verbose_name = _("EU Admission Application")
         verbose_name_plural = _("EU Admission Applications")
+        indexes = [
+            models.Index(fields=['status', '-application_date'], name='eu_app_status_live_idx', condition=models.Q(is_deleted=False)),
+            models.Index(fields=['season', 'program'], name='eu_app_season_live_idx', condition=models.Q(is_deleted=False)),
+        ]
 
     def clean(self):
         """Validate registration fee and season rules."""
         super().clean()
         if self.registration_fee < 0:
-            raise ValidationError({"registration_fee": _("Registration fee cannot be negative.")})
\ No newline at end of file
+            raise ValidationError({"registration_fee": _("Registration fee cannot be negative.")})
+
+
+# ----------------- ADMIN DIGEST BUFFER -----------------
+class AdmissionNotificationEvent(GreenUpBaseModel):
+    """
+    Name: AdmissionNotificationEvent
+    Description: Buffered "new application" event, consumed by the periodic admin digest task and
+                 deleted once every digest admin received it.
+    Author: ayemeleelgol@gmail.com
+    """
+    application_id = models.UUIDField(help_text=_("ID of the submitted application."))
+    application_type = models.CharField(
+        max_length=20,
+        choices=ApplicationTypeChoices.choices,
+        help_text=_("Type of the submitted application (EU or non-EU).")
+    )
+    applicant_name = models.CharField(max_length=255, help_text=_("Full name of the applicant at submission time."))
+    program = models.ForeignKey(
+        Program,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+        help_text=_("Program selected in the application.")
+    )
+    campus = models.ForeignKey(
+        Campus,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+        help_text=_("Campus selected in the application.")
+    )
+    sent_to = models.JSONField(
+        default=list,
+        blank=True,
+        help_text=_("Digest admins who already received this event; it is deleted once every one of them has.")
+    )
+    claimed_until = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_("Set while a digest run is sending this event, so overlapping runs skip it.")
+    )
+
+    class Meta:
+        verbose_name = _("Admission Notification Event")
+        verbose_name_plural = _("Admission Notification Events")
+        ordering = ["created"]
+
+    def __str__(self):
+        return f"{self.applicant_name} - {self.program or 'No program'} ({self.created:%Y-%m-%d %H:%M})"
+
+
+# ----------------- BULK MAIL -----------------
+class BulkMailCampaign(GreenUpBaseModel):
+    """
+    Name: BulkMailCampaign
+    Description: Announcement emailed to every applicant of a season (deadlines, missing documents, results).
+    Author: ayemeleelgol@gmail.com
+    """
+    season = models.ForeignKey(
+        AdmissionSeason,
+        on_delete=models.PROTECT,
+        related_name="bulk_mail_campaigns",
+        help_text=_("Season whose applicants receive the campaign.")
+    )
+    application_status = models.CharField(
+        max_length=50,
+        choices=ApplicationStatusChoices.choices,
+        blank=True,
+        help_text=_("Only target applications with this status (leave empty for all applicants).")
+    )
+    subject = models.CharField(max_length=255, help_text=_("Email subject."))
+    body = models.TextField(
+        help_text=_("Email body. Django template syntax is allowed, e.g. {{ first_name }}, {{ program_name }}, {{ campus_name }}.")
+    )
+    campaign_status = models.CharField(
+        max_length=20,
+        choices=BulkMailCampaignStatusChoices.choices,
+        default=BulkMailCampaignStatusChoices.DRAFT,
+        help_text=_("Sending state of the campaign.")
+    )
+    recipients_loaded = models.BooleanField(
+        default=False,
+        help_text=_("Whether the recipient list has been built; a resumed campaign keeps its list.")
+    )
+    started_at = models.DateTimeField(null=True, blank=True, help_text=_("When sending started."))
+    finished_at = models.DateTimeField(null=True, blank=True, help_text=_("When sending finished."))
+
+    class Meta:
+        verbose_name = _("Bulk Mail Campaign")
+        verbose_name_plural = _("Bulk Mail Campaigns")
+        ordering = ["-created"]
+
+    def __str__(self):
+        return f"{self.subject} ({self.season})"
+
+
+class BulkMailRecipient(GreenUpBaseModel):
+    """
+    Name: BulkMailRecipient
+    Description: Per-recipient delivery outcome of a bulk mail campaign, used to resume interrupted campaigns.
+    Author: ayemeleelgol@gmail.com
+    """
+    campaign = models.ForeignKey(
+        BulkMailCampaign,
+        on_delete=models.CASCADE,
+        related_name="recipients",
+        help_text=_("Campaign this recipient belongs to.")
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="bulk_mail_receipts",
+        help_text=_("Recipient user.")
+    )
+    email = models.EmailField(help_text=_("Address the campaign is sent to."))
+    delivery_status = models.CharField(
+        max_length=20,
+        choices=BulkMailRecipientStatusChoices.choices,
+        default=BulkMailRecipientStatusChoices.PENDING,
+        help_text=_("Delivery outcome for this recipient.")
+    )
+    error = models.TextField(blank=True, help_text=_("Last delivery error, if any."))
+    sent_at = models.DateTimeField(null=True, blank=True, help_text=_("When the email was accepted by the SMTP server."))
+
+    class Meta:
+        verbose_name = _("Bulk Mail Recipient")
+        verbose_name_plural = _("Bulk Mail Recipients")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["campaign", "user"], condition=models.Q(is_deleted=False), name="unique_bulk_mail_recipient_live",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["campaign", "delivery_status", "id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.email} - {self.get_delivery_status_display()}"
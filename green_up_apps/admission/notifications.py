@@ -0,0 +1,95 @@
+import logging
+
+from green_up_apps.global_data.enums import AdminNotificationModeChoices, ApplicationTypeChoices
+
+logger = logging.getLogger(__name__)
+
+
+def get_application_model(application_type: str):
+    """Return the application model class for an ApplicationTypeChoices value."""
+    from green_up_apps.admission.models import EUAdmissionApplication, NonEUAdmissionApplication
+
+    models_by_type = {
+        ApplicationTypeChoices.EU: EUAdmissionApplication,
+        ApplicationTypeChoices.NON_EU: NonEUAdmissionApplication,
+    }
+    try:
+        return models_by_type[application_type]
+    except KeyError:
+        raise ValueError(f"Unknown application type: {application_type}")
+
+
+def load_application(application_id: str, application_type: str):
+    """
+    Load an application with everything the notification emails need
+    (applicant, profile, program, campus, season) in a single query.
+    """
+    model = get_application_model(application_type)
+    return model.objects.select_related(
+        "user", "user__profile", "program", "campus", "season"
+    ).get(id=application_id)
+
+
+def build_application_context(application) -> dict:
+    """Build the template context shared by applicant and admin notification emails."""
+    user = application.user
+    profile = getattr(user, "profile", None)
+    return {
+        "site_name": "Green Up Academy",
+        "application_id": str(application.id),
+        "applicant_name": user.get_full_name,
+        "user_name": f"{user.first_name} {user.last_name}",
+        "program_name": application.program.name if application.program else "N/A",
+        "campus_name": application.campus.name if application.campus else "N/A",
+        "season_name": application.season.name if application.season else "N/A",
+        "application_date": application.application_date.strftime("%Y-%m-%d %H:%M:%S"),
+        "submission_date": application.application_date.strftime("%d %B %Y"),
+        "user_details": {
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "email": user.email,
+            "phone_number": profile.phone_number if profile else "N/A",
+            "nationality": getattr(application, "nationality", "N/A"),
+            "date_of_birth": application.date_of_birth,
+            "place_of_birth": getattr(application, "place_of_birth", "N/A"),
+            "passport_number": getattr(application, "passport_number", "N/A"),
+            "level_of_studies": getattr(application, "level_of_studies", "N/A"),
+            "address": profile.address if profile else "N/A",
+            "zip_code": profile.zip_code if profile else "N/A",
+            "city": profile.city if profile else "N/A",
+            "country": profile.country if profile else "N/A",
+        },
+    }
+
+
+def notify_admins(application, application_type: str, email_util, template: str, context: dict, subject: str, inline_images=None) -> bool:
+    """
+    Notify admins of a new application according to their notification mode:
+    per-event admins get the email now, digest admins get it in the next digest.
+    """
+    from green_up_apps.users.models import User
+    from green_up_apps.admission.models import AdmissionNotificationEvent
+
+    if User.objects.get_admin_emails(AdminNotificationModeChoices.DIGEST):
+        AdmissionNotificationEvent.objects.create(
+            application_id=application.id,
+            application_type=application_type,
+            applicant_name=application.user.get_full_name or application.user.email,
+            program=application.program,
+            campus=application.campus,
+        )
+        logger.debug(f"Application {application.id} buffered for the admin digest")
+
+    admin_emails = User.objects.get_admin_emails(AdminNotificationModeChoices.PER_EVENT)
+    if not admin_emails:
+        return True
+    sent = email_util.send_email_with_template(
+        template=template,
+        context=context,
+        receivers=admin_emails,
+        subject=subject,
+        inline_images=inline_images
+    )
+    if sent:
+        logger.info(f"Notification sent to {len(admin_emails)} admin(s) for application {application.id}")
+    return sent
@@ -0,0 +1,28 @@
+from green_up_apps.admission.models import AdmissionSeason, Campus, Program
+from green_up_apps.global_data.local_cache import LocalLRUCache
+
+# Reference data rendered on every application form. Kept in each process and
+# evicted everywhere by the invalidation bus when an admin edits it (see admission/signals.py).
+REFERENCE_CACHE_NAMESPACE = "admission.reference"
+reference_cache = LocalLRUCache(REFERENCE_CACHE_NAMESPACE, maxsize=16, ttl=900)
+
+
+def get_campuses() -> list:
+    return reference_cache.get_or_set("campuses", lambda: list(Campus.objects.order_by("name")))
+
+
+def get_programs(level: str | None = None) -> list:
+    """All programs, or only those of one ProgramLevelChoices level."""
+    def load():
+        programs = Program.objects.order_by("name")
+        if level is not None:
+            programs = programs.filter(level=level)
+        return list(programs)
+
+    return reference_cache.get_or_set(f"programs:{level or 'all'}", load)
+
+
+def get_open_seasons() -> list:
+    """Active seasons still open today; is_open() is evaluated per call since it depends on the date."""
+    seasons = reference_cache.get_or_set("seasons:active", lambda: list(AdmissionSeason.objects.filter(is_active=True)))
+    return [season for season in seasons if season.is_open()]
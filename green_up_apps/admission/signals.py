@@ -0,0 +1,22 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from green_up_apps.global_data.invalidation import publish_invalidation
+from .models import AdmissionSeason, Campus, Program
+from .reference import REFERENCE_CACHE_NAMESPACE
+
+
+@receiver(post_save, sender=Campus)
+@receiver(post_delete, sender=Campus)
+@receiver(post_save, sender=Program)
+@receiver(post_delete, sender=Program)
+@receiver(post_save, sender=AdmissionSeason)
+@receiver(post_delete, sender=AdmissionSeason)
+@receiver(m2m_changed, sender=Program.campuses.through)
+def invalidate_reference_data(sender, **kwargs):
+    """
+    Drop the cached programs/campuses/seasons in every process.
+    Queryset update()/soft_delete() send no signals: call publish_invalidation() after those.
+    """
+    if kwargs.get("action", "post").startswith("post"):
+        publish_invalidation(REFERENCE_CACHE_NAMESPACE)
@@ -1,3 +1,5 @@
 # green_up_apps/admission/tasks/__init__.py
 from .admission_task import *
 from .send_admission_emails import *
+from .admission_digest import *
+from .bulk_mail import *
@@ -0,0 +1,117 @@
+import logging
+from datetime import timedelta
+from itertools import groupby
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import gettext as _
+from green_up_apps.global_data.email import EmailUtil
+from green_up_apps.global_data.enums import AdminNotificationModeChoices
+
+logger = logging.getLogger(__name__)
+
+# Lease on the claimed events: longer than a run takes, short enough that the
+# events of a killed worker are picked up again
+DIGEST_CLAIM_TIMEOUT = 15 * 60
+
+
+def _group_events(events):
+    """Group buffered events by (program, campus) for the digest template."""
+    def key(event):
+        return (
+            event.program.name if event.program else "N/A",
+            event.campus.name if event.campus else "N/A",
+        )
+
+    groups = []
+    for (program_name, campus_name), items in groupby(sorted(events, key=key), key=key):
+        items = list(items)
+        groups.append({
+            "program_name": program_name,
+            "campus_name": campus_name,
+            "count": len(items),
+            "events": items,
+        })
+    return groups
+
+
+def _claim_events(model):
+    """
+    Lease every buffered event not held by another run, in a short transaction:
+    the emails go out after the commit, without row locks held over SMTP.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        # skip_locked lets an overlapping run pass over rows another run is claiming
+        events = list(
+            model.objects.select_for_update(skip_locked=True, of=("self",))
+            .filter(Q(claimed_until__isnull=True) | Q(claimed_until__lt=now))
+            .select_related("program", "campus")
+            .order_by("created")
+        )
+        model.objects.filter(id__in=[event.id for event in events]).update(
+            claimed_until=now + timedelta(seconds=DIGEST_CLAIM_TIMEOUT), modified=now
+        )
+    return events
+
+
+@shared_task(name="green_up_apps.admission.tasks.admission_digest.send_admin_digest")
+def send_admin_digest():
+    """
+    Periodic task sending one summary email per digest-mode admin with every
+    application buffered since the previous run, grouped by program and campus.
+    Delivery is tracked per admin: an admin whose email failed gets the missed
+    applications on the next run, the others do not get them twice. An event is
+    removed from the buffer once every digest admin received it.
+    """
+    from green_up_apps.users.models import User
+    from green_up_apps.admission.models import AdmissionNotificationEvent
+
+    admin_emails = User.objects.get_admin_emails(AdminNotificationModeChoices.DIGEST)
+    events = _claim_events(AdmissionNotificationEvent)
+    if not events:
+        logger.info("Admin digest: no buffered applications")
+        return 0
+
+    email_util = EmailUtil(prod=True)
+    subject = _("New applications digest - Green Up Academy")
+    failed = []
+    try:
+        for email in admin_emails:
+            missing = [event for event in events if email not in event.sent_to]
+            if not missing:
+                continue
+            sent = email_util.send_email_with_template(
+                template="publics/emails/admin_admission_digest.html",
+                context={
+                    "site_name": "Green Up Academy",
+                    "total": len(missing),
+                    "groups": _group_events(missing),
+                    "period_start": missing[0].created,
+                    "period_end": timezone.now(),
+                },
+                receivers=[email],
+                subject=subject,
+                inline_images={"logo_image": settings.LOGO},
+            )
+            if sent:
+                for event in missing:
+                    event.sent_to = [*event.sent_to, email]
+            else:
+                failed.append(email)
+    finally:
+        delivered = [event.id for event in events if set(admin_emails) <= set(event.sent_to)]
+        pending = [event for event in events if event.id not in delivered]
+        now = timezone.now()
+        for event in pending:
+            event.claimed_until = None
+            event.modified = now
+        AdmissionNotificationEvent.objects.bulk_update(pending, ["sent_to", "claimed_until", "modified"])
+        AdmissionNotificationEvent.objects.filter(id__in=delivered).delete()
+
+    if failed:
+        logger.error(f"Admin digest could not be sent to {', '.join(failed)}; {len(pending)} application(s) kept for them")
+    logger.info(f"Admin digest: {len(delivered)} application(s) delivered to all {len(admin_emails)} admin(s)")
+    return len(delivered)
@@ -3,32 +3,24 @@ from celery import shared_task
 from django.conf import settings
 from django.utils.translation import gettext as _
 from green_up_apps.global_data.email import EmailUtil
+from green_up_apps.global_data.enums import ApplicationTypeChoices
 
 logger = logging.getLogger(__name__)
 
 @shared_task(name="green_up_apps.admission.tasks.admission_task.notify_admission_pending")
-def notify_admission_pending(application_id: str):
+def notify_admission_pending(application_id: str, application_type: str = ApplicationTypeChoices.EU):
     """
-    Task to notify admins and the applicant when an EU admission application is marked 'PENDING'.
+    Task to notify admins and the applicant when an admission application is marked 'PENDING'.
+    Only the application id and type travel through the broker; the context is loaded here.
     """
     # Import models inside the function to prevent circular imports
-    from green_up_apps.users.models import User
-    from green_up_apps.admission.models import EUAdmissionApplication, Program, Campus
+    from green_up_apps.admission.notifications import build_application_context, get_application_model, load_application, notify_admins
 
+    model = get_application_model(application_type)
     try:
-        application = EUAdmissionApplication.objects.get(id=application_id)
+        application = load_application(application_id, application_type)
         applicant = application.user
-        program = application.program
-        campus = application.campus
-
-        # Common context for both emails
-        context = {
-            "applicant_name": applicant.get_full_name,
-            "program_name": program.name if program else "N/A",
-            "campus_name": campus.name if campus else "N/A",
-            "application_id": str(application.id),
-            "application_date": application.application_date.strftime("%Y-%m-%d %H:%M:%S"),
-        }
+        context = build_application_context(application)
 
         # Logo path from settings
         logo_path = settings.LOGO
@@ -37,19 +29,16 @@ def notify_admission_pending(application_id: str):
 
         email_util = EmailUtil(prod=True)
 
-        # Notification to admins
-        admin_emails = list(
-            User.objects.filter(is_admin=True, is_active=True).values_list("email", flat=True)
+        # Notification to admins (immediate or buffered for the digest)
+        notify_admins(
+            application,
+            application_type,
+            email_util,
+            template="publics/emails/admission_notification.html",
+            context={**context, "is_admin": True},
+            subject=_("New EU Admission Application Pending"),
+            inline_images=inline_images
         )
-        if admin_emails:
-            email_util.send_email_with_template(
-                template="publics/emails/admission_notification.html",
-                context={**context, "is_admin": True},
-                receivers=admin_emails,
-                subject=_("New EU Admission Application Pending"),
-                inline_images=inline_images
-            )
-            logger.info(f"Notification sent to {len(admin_emails)} admin(s) for application {application_id}")
 
         # Notification to applicant
         if applicant.email:
@@ -62,7 +51,7 @@ def notify_admission_pending(application_id: str):
             )
             logger.info(f"Confirmation email sent to applicant {applicant.email} for application {application_id}")
 
-    except EUAdmissionApplication.DoesNotExist:
+    except model.DoesNotExist:
         logger.error(f"Application {application_id} not found for notification")
     except Exception as e:
         logger.error(f"Error sending admission notifications: {str(e)}", exc_info=True)
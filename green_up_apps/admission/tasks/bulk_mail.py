@@ -0,0 +1,209 @@
+import logging
+from datetime import timedelta
+from email.mime.image import MIMEImage
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.db import transaction
+from django.db.models import Q
+from django.template import Context, Template
+from django.template.loader import render_to_string
+from django.utils import timezone
+from green_up_apps.global_data.bulk_mailer import AsyncBulkMailer
+from green_up_apps.global_data.enums import BulkMailCampaignStatusChoices, BulkMailRecipientStatusChoices
+
+logger = logging.getLogger(__name__)
+
+# A RUNNING campaign whose heartbeat (modified, touched after every chunk) is older
+# than this belongs to a dead worker and may be taken over
+BULK_MAIL_STALE_AFTER = timedelta(minutes=15)
+
+
+def _load_recipients(campaign, chunk_size: int) -> int:
+    """Build the campaign recipient list from the season's EU and non-EU applications."""
+    from green_up_apps.admission.models import BulkMailRecipient, EUAdmissionApplication, NonEUAdmissionApplication
+
+    created = 0
+    for model in (EUAdmissionApplication, NonEUAdmissionApplication):
+        applications = model.objects.filter(season=campaign.season, is_deleted=False)
+        if campaign.application_status:
+            applications = applications.filter(status=campaign.application_status)
+        batch = []
+        for user_id, email in applications.values_list("user_id", "user__email").iterator(chunk_size=chunk_size):
+            batch.append(BulkMailRecipient(campaign=campaign, user_id=user_id, email=email))
+            if len(batch) >= chunk_size:
+                created += len(BulkMailRecipient.objects.bulk_create(batch, ignore_conflicts=True))
+                batch = []
+        if batch:
+            created += len(BulkMailRecipient.objects.bulk_create(batch, ignore_conflicts=True))
+    return created
+
+
+def _application_details(campaign, user_ids) -> dict:
+    """Map user id -> program/campus names of their application in the campaign season."""
+    from green_up_apps.admission.models import EUAdmissionApplication, NonEUAdmissionApplication
+
+    details = {}
+    for model in (EUAdmissionApplication, NonEUAdmissionApplication):
+        rows = model.objects.filter(season=campaign.season, user_id__in=user_ids).values_list(
+            "user_id", "program__name", "campus__name"
+        )
+        for user_id, program_name, campus_name in rows:
+            details[user_id] = {"program_name": program_name or "N/A", "campus_name": campus_name or "N/A"}
+    return details
+
+
+def _build_message(campaign, body_template: Template, recipient, details: dict, logo: bytes | None) -> EmailMessage:
+    context = {
+        "site_name": "Green Up Academy",
+        "first_name": recipient.user.first_name,
+        "last_name": recipient.user.last_name,
+        "season_name": campaign.season.name,
+        "program_name": "N/A",
+        "campus_name": "N/A",
+        **details.get(recipient.user_id, {}),
+    }
+    content = body_template.render(Context(context))
+    html = render_to_string("publics/emails/bulk_announcement.html", {**context, "subject": campaign.subject, "content": content})
+
+    message = EmailMessage(
+        subject=campaign.subject,
+        body=html,
+        from_email=f"Green Up Academy <{settings.EMAIL_HOST_USER}>",
+        to=[recipient.email],
+    )
+    message.content_subtype = "html"
+    if logo:
+        image = MIMEImage(logo)
+        image.add_header("Content-ID", "<logo_image>")
+        image.add_header("Content-Disposition", "inline", filename="logo.webp")
+        message.attach(image)
+    return message
+
+
+def _claim_campaign(model, campaign_id: str) -> bool:
+    """
+    Mark the campaign RUNNING in one conditional UPDATE; False if it is completed or
+    another worker is sending it, so a campaign never runs twice at once.
+    """
+    now = timezone.now()
+    claimable = ~Q(campaign_status__in=[BulkMailCampaignStatusChoices.RUNNING, BulkMailCampaignStatusChoices.COMPLETED]) | Q(
+        campaign_status=BulkMailCampaignStatusChoices.RUNNING, modified__lt=now - BULK_MAIL_STALE_AFTER
+    )
+    return bool(
+        model.objects.filter(claimable, id=campaign_id).update(campaign_status=BulkMailCampaignStatusChoices.RUNNING, modified=now)
+    )
+
+
+def _claim_chunk(campaign, chunk_size: int) -> list:
+    """Move the next pending recipients to SENDING and return them; rows locked by another transaction are skipped."""
+    with transaction.atomic():
+        chunk = list(
+            campaign.recipients.select_for_update(skip_locked=True, of=("self",))
+            .filter(delivery_status=BulkMailRecipientStatusChoices.PENDING)
+            .select_related("user")
+            .order_by("id")[:chunk_size]
+        )
+        now = timezone.now()
+        campaign.recipients.filter(id__in=[recipient.id for recipient in chunk]).update(
+            delivery_status=BulkMailRecipientStatusChoices.SENDING, modified=now
+        )
+        # Heartbeat: keeps the campaign from being taken over while it progresses
+        type(campaign).objects.filter(id=campaign.id).update(modified=now)
+    return chunk
+
+
+@shared_task(
+    name="green_up_apps.admission.tasks.bulk_mail.send_bulk_campaign",
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def send_bulk_campaign(campaign_id: str):
+    """
+    Task to send a bulk mail campaign to every applicant of its season.
+
+    The campaign is claimed first: a second task for a campaign that is already
+    running exits. Recipients are claimed in chunks (PENDING -> SENDING), rendered
+    per recipient and sent over concurrent SMTP sessions. Outcomes are stored per
+    recipient, so re-running the task resumes where it stopped.
+    """
+    from green_up_apps.admission.models import BulkMailCampaign
+
+    if not _claim_campaign(BulkMailCampaign, campaign_id):
+        logger.info(f"Bulk campaign {campaign_id} already completed or being sent by another worker")
+        return {"sent": 0, "failed": 0}
+
+    campaign = BulkMailCampaign.objects.select_related("season").get(id=campaign_id)
+    chunk_size = getattr(settings, "BULK_MAIL_CHUNK_SIZE", 200)
+    concurrency = getattr(settings, "BULK_MAIL_CONCURRENCY", 4)
+
+    if not campaign.started_at:
+        campaign.started_at = timezone.now()
+        campaign.save(update_fields=["started_at", "modified"])
+
+    # Left SENDING by a run that died mid-chunk: the SMTP outcome is unknown, so they
+    # are not re-sent automatically ("Retry failed recipients" sends them again)
+    interrupted = campaign.recipients.filter(delivery_status=BulkMailRecipientStatusChoices.SENDING).update(
+        delivery_status=BulkMailRecipientStatusChoices.FAILED,
+        error="Interrupted while sending; delivery unknown",
+        modified=timezone.now(),
+    )
+    if interrupted:
+        logger.warning(f"Bulk campaign {campaign_id}: {interrupted} recipient(s) interrupted mid-send marked failed")
+
+    if not campaign.recipients_loaded:
+        created = _load_recipients(campaign, chunk_size)
+        campaign.recipients_loaded = True
+        campaign.save(update_fields=["recipients_loaded", "modified"])
+        logger.info(f"Bulk campaign {campaign_id}: {created} recipient(s) loaded")
+
+    body_template = Template(campaign.body)
+    try:
+        with open(settings.LOGO, "rb") as logo_file:
+            logo = logo_file.read()
+    except OSError as e:
+        logger.warning(f"Bulk campaign {campaign_id}: logo not attached: {e}")
+        logo = None
+
+    sent = failed = 0
+    try:
+        with AsyncBulkMailer(concurrency=concurrency) as mailer:
+            while True:
+                chunk = _claim_chunk(campaign, chunk_size)
+                if not chunk:
+                    break
+
+                details = _application_details(campaign, [recipient.user_id for recipient in chunk])
+                errors = mailer.send(
+                    (recipient.id, _build_message(campaign, body_template, recipient, details, logo))
+                    for recipient in chunk
+                )
+
+                now = timezone.now()
+                for recipient in chunk:
+                    error = errors.get(recipient.id)
+                    if error:
+                        recipient.delivery_status = BulkMailRecipientStatusChoices.FAILED
+                        recipient.error = error
+                        failed += 1
+                    else:
+                        recipient.delivery_status = BulkMailRecipientStatusChoices.SENT
+                        recipient.error = ""
+                        recipient.sent_at = now
+                        sent += 1
+                    recipient.modified = now
+                campaign.recipients.model.objects.bulk_update(
+                    chunk, ["delivery_status", "error", "sent_at", "modified"]
+                )
+                logger.info(f"Bulk campaign {campaign_id}: {sent} sent, {failed} failed so far")
+    except Exception as e:
+        logger.error(f"Bulk campaign {campaign_id} interrupted: {e}", exc_info=True)
+        campaign.campaign_status = BulkMailCampaignStatusChoices.INTERRUPTED
+        campaign.save(update_fields=["campaign_status", "modified"])
+        raise
+
+    campaign.campaign_status = BulkMailCampaignStatusChoices.COMPLETED
+    campaign.finished_at = timezone.now()
+    campaign.save(update_fields=["campaign_status", "finished_at", "modified"])
+    logger.info(f"Bulk campaign {campaign_id} completed: {sent} sent, {failed} failed")
+    return {"sent": sent, "failed": failed}
@@ -9,8 +9,9 @@ from django.core.exceptions import ValidationError
 from django.shortcuts import render
 from django.core.validators import FileExtensionValidator
 from green_up_apps.admission.models import NonEUAdmissionApplication, Program, Campus, Diploma, AdmissionSeason
-from green_up_apps.global_data.enums import ApplicationStatusChoices, CivilityChoices
-from green_up_apps.users.models import User
+from green_up_apps.admission.reference import get_campuses, get_open_seasons, get_programs
+from green_up_apps.global_data.enums import ApplicationStatusChoices, ApplicationTypeChoices, CivilityChoices
+from green_up_apps.global_data.page_cache import PageCacheMixin
 # from green_up_apps.admission.tasks.send_admission_emails import send_admission_emails
 
 # Set up logging
@@ -22,10 +23,10 @@ class NonEUAdmissionApplicationView(View):
 
     def get(self, request, *args, **kwargs):
         """Render the admission form with pre-filled user/profile data and open seasons."""
-        open_seasons = [season for season in AdmissionSeason.objects.filter(is_active=True) if season.is_open()]
+        open_seasons = get_open_seasons()
         context = {
-            'programs': Program.objects.all(),
-            'campuses': Campus.objects.all(),
+            'programs': get_programs(),
+            'campuses': get_campuses(),
             'civility_choices': CivilityChoices.choices,
             'seasons': open_seasons,
         }
@@ -235,33 +236,10 @@ class NonEUAdmissionApplicationView(View):
                     diploma.save()
                     application.diplomas.add(diploma)
                 
-                # Prepare user data for email
-                user_data = {
-                    'first_name': post_data['first_name'],
-                    'last_name': post_data['last_name'],
-                    'email': post_data['email'],
-                    'phone_number': post_data['phone_number'],
-                    'address': post_data['address'],
-                    'zip_code': post_data['zip_code'],
-                    'city': post_data['city'],
-                    'country': post_data['country'],
-                    'nationality': post_data['nationality'],
-                    'date_of_birth': post_data['date_of_birth'],
-                    'place_of_birth': post_data['place_of_birth'],
-                    'passport_number': post_data['passport_number'],
-                    'level_of_studies': post_data['level_of_studies'],
-                    'program_name': program.name,
-                    'campus_name': campus.name,
-                    'season_name': season.name,
-                }
-                
-                # Trigger Celery task to send emails
-                admin_emails = list(
-                    User.objects.filter(is_admin=True, is_active=True).values_list("email", flat=True)
-                )
-                logger.info(f"Triggering Celery task 'send_admission_emails' for application ID {application.id}, user {user.email}, admin emails {admin_emails}")
+                # Trigger Celery task to send emails (only the id travels through the broker)
+                logger.info(f"Triggering Celery task 'send_admission_emails' for application ID {application.id}, user {user.email}")
                 try:
-                    send_admission_emails.delay(application.id, user_data, admin_emails)
+                    send_admission_emails.delay(str(application.id), ApplicationTypeChoices.NON_EU)
                     logger.debug(f"Celery task 'send_admission_emails' dispatched successfully for application ID {application.id}")
                 except Exception as e:
                     logger.error(f"Failed to dispatch Celery task 'send_admission_emails' for application ID {application.id}: {e}")
@@ -283,5 +261,5 @@ class NonEUAdmissionApplicationView(View):
             messages.error(request, _("Une erreur inattendue s'est produite. Veuillez contacter le support."))
             return HttpResponseRedirect(self.request.path)
         
-class ResidentHorsUeView(TemplateView):
+class ResidentHorsUeView(PageCacheMixin, TemplateView):
     template_name = "publics/home/admission/resident_hors/resident_hor_ue.html"
\ No newline at end of file
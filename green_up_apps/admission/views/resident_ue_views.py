@@ -5,13 +5,15 @@ from django.utils.translation import gettext as _
 from django.utils import timezone
 from django.contrib.auth.mixins import LoginRequiredMixin
 from green_up_apps.admission.models import EUAdmissionApplication, Program, Campus, Diploma, AdmissionSeason
+from green_up_apps.admission.reference import get_campuses, get_programs
 from green_up_apps.users.models import User, Profile
-from green_up_apps.global_data.enums import ApplicationStatusChoices, ApprenticeshipChoices, ProgramLevelChoices
+from green_up_apps.global_data.enums import ApplicationStatusChoices, ApplicationTypeChoices, ApprenticeshipChoices, ProgramLevelChoices
+from green_up_apps.global_data.page_cache import PageCacheMixin
 # from green_up_apps.admission.tasks.admission_task import notify_admission_pending
 
 logger = logging.getLogger(__name__)
 
-class ResidentUeView(TemplateView):
+class ResidentUeView(PageCacheMixin, TemplateView):
     template_name = "publics/home/admission/resident_ue/resident_ue.html"
     
 class AdmissionUeView(View):
@@ -19,9 +21,9 @@ class AdmissionUeView(View):
 
     def get(self, request):
         context = {
-            'campuses': Campus.objects.all(),
-            'bachelor_programs': Program.objects.filter(level=ProgramLevelChoices.BACHELOR),
-            'master_programs': Program.objects.filter(level=ProgramLevelChoices.MASTER),
+            'campuses': get_campuses(),
+            'bachelor_programs': get_programs(ProgramLevelChoices.BACHELOR),
+            'master_programs': get_programs(ProgramLevelChoices.MASTER),
             'apprenticeship_choices': ApprenticeshipChoices.choices,
         }
         return TemplateView.as_view(
@@ -140,7 +142,7 @@ class AdmissionUeView(View):
             user.email = email
             user.save()
 
-            profile, created = Profile.objects.get_or_create(user=user)
+            profile, created = Profile.all_objects.get_or_create(user=user)
             profile.phone_number = phone_number
             profile.address = address
             profile.zip_code = zip_code
@@ -191,7 +193,7 @@ class AdmissionUeView(View):
 
             # Trigger Celery task for admin notification
             if application.status == ApplicationStatusChoices.PENDING:
-                notify_admission_pending.delay(str(application.id))
+                notify_admission_pending.delay(str(application.id), ApplicationTypeChoices.EU)
 
             logger.info(f'EU Admission application created by user {request.user.id}: {application.id}')
             return JsonResponse({
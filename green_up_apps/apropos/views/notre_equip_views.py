@@ -1,11 +1,12 @@
 from django.views.generic import TemplateView
 import logging
+from green_up_apps.global_data.prerender import PrerenderedPageMixin
 
 logger = logging.getLogger(__name__)
 
-class NotreEquipeView(TemplateView):
+class NotreEquipeView(PrerenderedPageMixin, TemplateView):
     template_name = "publics/home/apropos/notre_equipe.html"
     
     
-class ReglementView(TemplateView):
+class ReglementView(PrerenderedPageMixin, TemplateView):
     template_name = "publics/home/apropos/reglement.html"
\ No newline at end of file
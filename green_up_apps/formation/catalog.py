@@ -0,0 +1,152 @@
+import logging
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.core.cache import caches
+from django.core.cache.utils import make_template_fragment_key
+from django.db import transaction
+from django.db.models import Prefetch, TextField, Value
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from green_up_apps.admission.models import Campus
+from green_up_apps.global_data.cache import AppCache
+from green_up_apps.global_data.enums import ProgramLevelChoices
+from .models import Formation, FormationOption
+
+logger = logging.getLogger(__name__)
+
+formation_cache = AppCache("formation")
+DETAIL_TIMEOUT = 3600
+DETAIL_TEMPLATE = "publics/home/formations/_formation_detail.html"
+SEARCH_CONFIG = "french"
+MENU_LABELS = {ProgramLevelChoices.BACHELOR: "Bachelor", ProgramLevelChoices.MASTER: "Mastère professionnel"}
+# Paths of the placeholder pages that preceded the catalog, with the program each one announced
+LEGACY_SLUGS = {
+    "bachelor-designer": "Bachelor Conception Designer UI",
+    "bachelor-security": "Bachelor Administrateur d'infrastructure sécurisée",
+    "bachelor-application": "Bachelor Conception et Développement d'applications",
+    "bachelor-industry": "Bachelor en Performance Énergétique",
+    "master-development": "Mastère en performance énergétique, IA et développement durable",
+    "master-ai": "Mastère Intelligence Artificielle",
+}
+
+
+def formation_queryset():
+    """Active formations with their program, options and campuses loaded in three queries."""
+    return Formation.objects.filter(is_active=True).select_related("program").prefetch_related(
+        Prefetch("options", queryset=FormationOption.objects.order_by("name")),
+        Prefetch("program__campuses", queryset=Campus.objects.order_by("name")),
+    )
+
+
+def _detail_key(slug: str, language: str) -> str:
+    # The release is part of the key: a deploy may change the template
+    return f"detail:{settings.RELEASE_VERSION}:{slug}:{language}"
+
+
+def render_formation_detail(slug: str, language: str) -> str | None:
+    """Rendered body of a formation page, cached per slug and language; None if no active formation has this slug."""
+
+    def compute():
+        formation = formation_queryset().filter(slug=slug).first()
+        if formation is None:
+            return ""
+        return render_to_string(DETAIL_TEMPLATE, {"formation": formation})
+
+    html = formation_cache.get_or_compute(_detail_key(slug, language), compute, timeout=DETAIL_TIMEOUT)
+    return mark_safe(html) if html else None
+
+
+def formation_menu() -> list[dict]:
+    """Active formations grouped by program level, for the navbar: [{"label", "formations"}]."""
+    formations = (
+        formation_queryset().prefetch_related(None)
+        .filter(program__isnull=False, slug__isnull=False)
+        .exclude(slug="")
+        .order_by("program__name")
+    )
+    groups = {level: [] for level in MENU_LABELS}
+    for formation in formations:
+        groups.setdefault(formation.program.level, []).append(formation)
+    return [
+        {"label": MENU_LABELS.get(level, level), "formations": items}
+        for level, items in groups.items()
+        if items
+    ]
+
+
+def legacy_formation_slug(slug: str) -> str | None:
+    """Current slug of the active formation an old placeholder path announced, if any."""
+    program_name = LEGACY_SLUGS.get(slug)
+    if program_name is None:
+        return None
+    return (
+        formation_queryset().prefetch_related(None)
+        .filter(program__name__iexact=program_name, slug__isnull=False)
+        .exclude(slug=slug)
+        .values_list("slug", flat=True)
+        .first()
+    )
+
+
+def _navbar_fragment_cache():
+    return caches["template_fragments"] if "template_fragments" in settings.CACHES else caches["default"]
+
+
+def invalidate_formation_details(*slugs: str) -> None:
+    """
+    Drop the cached pages of these slugs, in every language, once the transaction commits,
+    with the navbar fragments (base.html) that list the formations.
+    """
+
+    def delete():
+        for slug in set(filter(None, slugs)):
+            for language, _name in settings.LANGUAGES:
+                formation_cache.delete(_detail_key(slug, language))
+        # Same vary_on as the {% cache %} tag in base.html
+        _navbar_fragment_cache().delete_many([
+            make_template_fragment_key("navbar", [settings.RELEASE_VERSION, language, authenticated])
+            for language, _name in settings.LANGUAGES
+            for authenticated in (True, False)
+        ])
+        logger.debug(f"Formation pages invalidated: {sorted(set(filter(None, slugs)))}")
+
+    transaction.on_commit(delete)
+
+
+def _words(*values) -> str:
+    """Text of strings and JSON lists of strings, for to_tsvector()."""
+    words = []
+    for value in values:
+        if isinstance(value, list):
+            words.extend(str(item) for item in value if item)
+        elif value:
+            words.append(str(value))
+    return " ".join(words)
+
+
+def search_document(formation):
+    """
+    Weighted tsvector of a formation (options prefetched): A = program, domain and
+    specialization, B = objectives and competencies, C = options. Built from plain
+    attributes so the 0003 migration can use it on historical models.
+    """
+    options = formation.options.all()
+    weighted = (
+        ("A", _words(formation.program.name if formation.program else "", formation.domain, formation.specialization)),
+        ("B", _words(formation.objectives, formation.competencies)),
+        ("C", _words(*[_words(option.name, option.description, option.competencies) for option in options])),
+    )
+    document = None
+    for weight, text in weighted:
+        vector = SearchVector(Value(text, output_field=TextField()), weight=weight, config=SEARCH_CONFIG)
+        document = vector if document is None else document + vector
+    return document
+
+
+def update_search_vectors(*formation_ids) -> None:
+    """Recompute Formation.search_vector; update() sends no post_save, so this does not recurse."""
+    formations = Formation.all_objects.filter(pk__in=formation_ids).select_related("program").prefetch_related("options")
+    for formation in formations:
+        Formation.all_objects.filter(pk=formation.pk).update(search_vector=search_document(formation))
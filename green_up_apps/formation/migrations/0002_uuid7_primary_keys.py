@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:44
+
+import green_up_apps.global_data.identifiers
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('formation', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='formation',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='formationoption',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+    ]
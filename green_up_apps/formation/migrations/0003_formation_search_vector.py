@@ -0,0 +1,34 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:16
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def backfill_search_vectors(apps, schema_editor):
+    from green_up_apps.formation.catalog import search_document
+
+    Formation = apps.get_model('formation', 'Formation')
+    for formation in Formation.objects.select_related('program').prefetch_related('options'):
+        Formation.objects.filter(pk=formation.pk).update(search_vector=search_document(formation))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0010_live_row_partial_indexes'),
+        ('formation', '0002_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='formation',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text="Full-text document of the program name, objectives and competencies, including the options' (maintained by signals).", null=True),
+        ),
+        migrations.AddIndex(
+            model_name='formation',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='formation_search_gin_idx'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
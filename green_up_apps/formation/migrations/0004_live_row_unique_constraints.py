@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0013_live_row_unique_constraints'),
+        ('formation', '0003_formation_search_vector'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='formationoption',
+            unique_together=set(),
+        ),
+        migrations.AlterField(
+            model_name='formation',
+            name='slug',
+            field=models.SlugField(blank=True, help_text='URL-friendly identifier for the formation, auto-generated from program name.', max_length=255, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='formation',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('slug',), name='formation_slug_live_uniq', violation_error_message='A formation with this slug already exists.'),
+        ),
+        migrations.AddConstraint(
+            model_name='formationoption',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('formation', 'name'), name='formation_option_name_live_uniq', violation_error_message='This formation already has an option with this name.'),
+        ),
+    ]
@@ -1,5 +1,8 @@
 import uuid
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import FileExtensionValidator
 from django.utils.text import slugify
@@ -21,7 +24,6 @@ class Formation(GreenUpBaseModel):
     )
     slug = models.SlugField(
         max_length=255,
-        unique=True,
         null=True,
         blank=True,
         help_text=_("URL-friendly identifier for the formation, auto-generated from program name.")
@@ -62,27 +64,47 @@ class Formation(GreenUpBaseModel):
         null=True,
         help_text=_("URL for detailed information about the formation.")
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text=_("Full-text document of the program name, objectives and competencies, including the options' (maintained by signals).")
+    )
 
     class Meta:
         verbose_name = _("Formation")
         verbose_name_plural = _("Formations")
+        # Unique among live rows only, like the default manager that validate_unique() uses
+        constraints = [
+            models.UniqueConstraint(
+                fields=['slug'], condition=Q(is_deleted=False), name='formation_slug_live_uniq',
+                violation_error_message=_("A formation with this slug already exists."),
+            ),
+        ]
         indexes = [
             models.Index(fields=['slug']),
             models.Index(fields=['is_deleted']),
+            GinIndex(fields=['search_vector'], name='formation_search_gin_idx'),
         ]
         ordering = ['program__name']
 
     def save(self, *args, **kwargs):
         if not self.slug and self.program:
-            base_slug = slugify(self.program.name)
-            slug = base_slug
-            counter = 1
-            while Formation.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
+            self.slug = self.allocate_slug(slugify(self.program.name))
         super().save(*args, **kwargs)
 
+    @classmethod
+    def allocate_slug(cls, base_slug):
+        """First free slug among base_slug, base_slug-1, base_slug-2... read in one query."""
+        taken = set(
+            cls.all_objects.filter(Q(slug=base_slug) | Q(slug__startswith=f"{base_slug}-"))
+            .values_list("slug", flat=True)
+        )
+        slug, counter = base_slug, 1
+        while slug in taken:
+            slug = f"{base_slug}-{counter}"
+            counter += 1
+        return slug
+
     def __str__(self):
         return f"{self.program.name if self.program else 'Unnamed Formation'} ({self.program.level if self.program else 'No Level'})"
 
@@ -120,7 +142,12 @@ class FormationOption(GreenUpBaseModel):
     class Meta:
         verbose_name = _("Formation Option")
         verbose_name_plural = _("Formation Options")
-        unique_together = ('formation', 'name')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['formation', 'name'], condition=Q(is_deleted=False), name='formation_option_name_live_uniq',
+                violation_error_message=_("This formation already has an option with this name."),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.formation.program.name if self.formation.program else 'Unnamed Formation'}"
\ No newline at end of file
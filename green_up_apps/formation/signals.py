@@ -0,0 +1,75 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from green_up_apps.admission.models import Campus, Program
+from .catalog import invalidate_formation_details, update_search_vectors
+from .models import Formation, FormationOption
+
+
+@receiver(pre_save, sender=Formation)
+def remember_previous_slug(sender, instance, **kwargs):
+    """Keep the stored slug so a renamed formation also drops its old page."""
+    instance._previous_slug = (
+        Formation.all_objects.filter(pk=instance.pk).values_list("slug", flat=True).first()
+        if not instance._state.adding
+        else None
+    )
+
+
+@receiver(post_save, sender=Formation)
+@receiver(post_delete, sender=Formation)
+def invalidate_formation(sender, instance, **kwargs):
+    invalidate_formation_details(instance.slug, getattr(instance, "_previous_slug", None))
+
+
+@receiver(post_save, sender=FormationOption)
+@receiver(post_delete, sender=FormationOption)
+def invalidate_formation_option(sender, instance, **kwargs):
+    invalidate_formation_details(*Formation.all_objects.filter(pk=instance.formation_id).values_list("slug", flat=True))
+
+
+# pre_delete: a hard delete nulls Formation.program and the campus links before post_delete;
+# the pages are only dropped on commit anyway
+@receiver(post_save, sender=Program)
+@receiver(pre_delete, sender=Program)
+def invalidate_program_formations(sender, instance, **kwargs):
+    invalidate_formation_details(*Formation.all_objects.filter(program_id=instance.pk).values_list("slug", flat=True))
+
+
+@receiver(post_save, sender=Campus)
+@receiver(pre_delete, sender=Campus)
+def invalidate_campus_formations(sender, instance, **kwargs):
+    invalidate_formation_details(*Formation.all_objects.filter(program__campuses=instance.pk).values_list("slug", flat=True))
+
+
+@receiver(m2m_changed, sender=Program.campuses.through)
+def invalidate_program_campuses(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Program.campuses changed, from either side.
+    Queryset update()/soft_delete() send no signals: call invalidate_formation_details() after those.
+    """
+    if not reverse and action.startswith("post"):
+        formations = Formation.all_objects.filter(program_id=instance.pk)
+    elif reverse and action in ("post_add", "post_remove"):
+        formations = Formation.all_objects.filter(program_id__in=pk_set)
+    elif reverse and action == "pre_clear":
+        formations = Formation.all_objects.filter(program__campuses=instance.pk)
+    else:
+        return
+    invalidate_formation_details(*formations.values_list("slug", flat=True))
+
+
+@receiver(post_save, sender=Formation)
+def index_formation(sender, instance, **kwargs):
+    update_search_vectors(instance.pk)
+
+
+@receiver(post_save, sender=FormationOption)
+@receiver(post_delete, sender=FormationOption)
+def index_formation_option(sender, instance, **kwargs):
+    update_search_vectors(instance.formation_id)
+
+
+@receiver(post_save, sender=Program)
+def index_program_formations(sender, instance, **kwargs):
+    update_search_vectors(*Formation.all_objects.filter(program_id=instance.pk).values_list("pk", flat=True))
@@ -0,0 +1,11 @@
+from django import template
+
+from green_up_apps.formation.catalog import formation_menu as build_formation_menu
+
+register = template.Library()
+
+
+@register.simple_tag
+def formation_menu():
+    """Navbar groups of the active formations; only runs when the cached navbar fragment is rebuilt."""
+    return build_formation_menu()
@@ -1,3 +1,43 @@
-from django.test import TestCase
+from unittest import skipUnless
 
-# Create your tests here.
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from green_up_apps.admission.models import Program
+from green_up_apps.global_data.enums import EntryLevelChoices, ProgramLevelChoices
+from .models import Formation
+
+
+@skipUnless(connection.vendor == "postgresql", "full-text search needs PostgreSQL")
+@override_settings(ALLOWED_HOSTS=["*"])
+class FormationListApiSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Identical documents: every formation gets the same (non-binary) rank
+        for index in range(5):
+            program = Program.objects.create(
+                name="Mastère Intelligence Artificielle",
+                level=ProgramLevelChoices.MASTER,
+                entry_level=EntryLevelChoices.BAC,
+                tuition_fee=8900,
+            )
+            Formation.objects.create(
+                program=program, slug=f"ia-{index}", domain="Informatique",
+                objectives=["Concevoir des modèles d'apprentissage automatique"],
+            )
+
+    def test_tied_ranks_paginate_without_gaps_or_duplicates(self):
+        expected = list(Formation.objects.order_by("pk").values_list("slug", flat=True))
+        url = f"{reverse('formation:api_formation_list')}?q=intelligence+artificielle&limit=2"
+        slugs = []
+        # Bounded: a cursor that does not advance would otherwise serve the same page forever
+        for _page in range(len(expected)):
+            data = self.client.get(url).json()
+            slugs.extend(formation["slug"] for formation in data["results"])
+            url = data["next"]
+            if not url:
+                break
+
+        self.assertEqual(slugs, expected)
+        self.assertIsNone(url)
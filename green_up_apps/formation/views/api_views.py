@@ -0,0 +1,151 @@
+import base64
+import json
+import logging
+import uuid
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import FloatField, Q
+from django.db.models.functions import Cast
+from django.http import JsonResponse
+from django.urls import reverse
+from django.utils.translation import gettext as _
+from django.views import View
+
+from green_up_apps.formation.catalog import SEARCH_CONFIG, formation_queryset
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+def serialize_formation(formation, request) -> dict:
+    program = formation.program
+    return {
+        "id": str(formation.pk),
+        "slug": formation.slug,
+        "url": request.build_absolute_uri(reverse("formation:formation_detail", args=[formation.slug])) if formation.slug else None,
+        "name": program.name if program else None,
+        "level": program.level if program else None,
+        "entry_level": program.entry_level if program else None,
+        "tuition_fee": str(program.tuition_fee) if program else None,
+        "is_work_study": program.is_work_study if program else None,
+        "campuses": [{"id": str(campus.pk), "name": campus.name} for campus in program.campuses.all()] if program else [],
+        "domain": formation.domain,
+        "specialization": formation.specialization,
+        "objectives": formation.objectives,
+        "competencies": formation.competencies,
+        "options": [
+            {"name": option.name, "description": option.description, "competencies": option.competencies}
+            for option in formation.options.all()
+        ],
+        "image": request.build_absolute_uri(formation.image.url) if formation.image else None,
+        "learn_more_url": formation.learn_more_url,
+        "modified": formation.modified.isoformat(),
+    }
+
+
+def encode_cursor(values: list) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, search: str) -> list:
+    """Sort key of the last row of the previous page: [pk], or [rank, pk] when searching."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if search:
+            rank, pk = values
+            return [float(rank), uuid.UUID(pk)]
+        (pk,) = values
+        return [uuid.UUID(pk)]
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor {cursor!r}") from e
+
+
+class FormationApiMixin:
+    # ETag/Last-Modified from the page generation (ConditionalPageMiddleware): a 304
+    # costs no query until a formation, option, program or campus is saved
+    conditional_get = True
+
+    @staticmethod
+    def error(message, status):
+        return JsonResponse({"success": False, "message": message}, status=status)
+
+
+class FormationListApiView(FormationApiMixin, View):
+    """
+    Name: FormationListApiView
+    Description: Read-only list of the active formations, filtered by level, domain,
+                 specialization and campus (id or name), with full-text search (q) over the
+                 program, objectives and competencies (GIN-indexed Formation.search_vector).
+                 Keyset pagination: "next" carries the last row's sort key, so every page
+                 costs the same whatever its depth.
+    Author: ayemeleelgol@gmail.com
+    """
+
+    def get(self, request):
+        search = request.GET.get("q", "").strip()
+        try:
+            limit = min(max(int(request.GET.get("limit", DEFAULT_LIMIT)), 1), MAX_LIMIT)
+            after = decode_cursor(request.GET["cursor"], search) if request.GET.get("cursor") else None
+        except ValueError:
+            return self.error(_("Invalid limit or cursor."), 400)
+
+        formations = self.filter(formation_queryset(), request.GET)
+        if search:
+            query = SearchQuery(search, config=SEARCH_CONFIG, search_type="websearch")
+            # ts_rank() returns a real: cast to double precision so the cursor's float
+            # compares equal to it. Ties on rank are broken by the time-ordered uuid7 primary key
+            formations = formations.filter(search_vector=query).annotate(
+                rank=Cast(SearchRank("search_vector", query), FloatField())
+            ).order_by("-rank", "pk")
+            if after:
+                rank, pk = after
+                formations = formations.filter(Q(rank__lt=rank) | Q(rank=rank, pk__gt=pk))
+        else:
+            formations = formations.order_by("pk")
+            if after:
+                formations = formations.filter(pk__gt=after[0])
+
+        page = list(formations[:limit + 1])
+        next_url = None
+        if len(page) > limit:
+            page = page[:limit]
+            last = page[-1]
+            params = request.GET.copy()
+            params["cursor"] = encode_cursor([last.rank, str(last.pk)] if search else [str(last.pk)])
+            next_url = request.build_absolute_uri(f"{request.path}?{params.urlencode()}")
+
+        return JsonResponse({
+            "results": [serialize_formation(formation, request) for formation in page],
+            "next": next_url,
+        })
+
+    @staticmethod
+    def filter(formations, params):
+        if params.get("level"):
+            formations = formations.filter(program__level__iexact=params["level"])
+        if params.get("domain"):
+            formations = formations.filter(domain__iexact=params["domain"])
+        if params.get("specialization"):
+            formations = formations.filter(specialization__iexact=params["specialization"])
+        if params.get("campus"):
+            try:
+                formations = formations.filter(program__campuses=uuid.UUID(params["campus"]))
+            except ValueError:
+                formations = formations.filter(program__campuses__name__iexact=params["campus"])
+        return formations
+
+
+class FormationDetailApiView(FormationApiMixin, View):
+    """
+    Name: FormationDetailApiView
+    Description: Read-only JSON of one active formation, by slug.
+    Author: ayemeleelgol@gmail.com
+    """
+
+    def get(self, request, slug):
+        formation = formation_queryset().filter(slug=slug).first()
+        if formation is None:
+            return self.error(_("Formation not found."), 404)
+        return JsonResponse(serialize_formation(formation, request))
@@ -0,0 +1,43 @@
+import logging
+
+from django.http import Http404
+from django.shortcuts import redirect
+from django.utils.translation import get_language
+from django.utils.translation import gettext as _
+from django.views.generic import TemplateView
+
+from green_up_apps.formation.catalog import legacy_formation_slug, render_formation_detail
+
+logger = logging.getLogger(__name__)
+
+
+class FormationDetailView(TemplateView):
+    """
+    Name: FormationDetailView
+    Description: Formation page built from Formation, its options and its program's campuses.
+                 The formation body is rendered once per slug and language and cached until
+                 the formation, an option, the program or a campus is saved; the navbar,
+                 footer and CSRF-dependent parts are still rendered per request.
+    Author: ayemeleelgol@gmail.com
+    """
+    template_name = "publics/home/formations/formation_detail.html"
+    # ETag/Last-Modified from the page generation, bumped when a formation is saved
+    conditional_get = True
+
+    def get(self, request, *args, **kwargs):
+        try:
+            return super().get(request, *args, **kwargs)
+        except Http404:
+            # Old placeholder paths (/formation/master-ai/...) move to the formation they announced
+            slug = legacy_formation_slug(kwargs["slug"])
+            if slug is None:
+                raise
+            return redirect("formation:formation_detail", slug=slug, permanent=True)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        formation_html = render_formation_detail(self.kwargs["slug"], get_language())
+        if formation_html is None:
+            raise Http404(_("Formation not found."))
+        context["formation_html"] = formation_html
+        return context
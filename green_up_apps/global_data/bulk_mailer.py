@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from typing import Any, Hashable, Iterable
+
+from django.core.mail import EmailMessage
+
+from .email import EmailUtil
+from .rate_governor import RateGovernor, email_rate_governor
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBulkMailer:
+    """
+    Send many emails over several concurrent SMTP sessions.
+
+    Each session is a persistent Django SMTP connection; an asyncio loop hands
+    messages to whichever session is free and runs the blocking SMTP exchange in
+    a thread. Every send first waits on the shared rate governor.
+
+    Usage:
+        with AsyncBulkMailer(concurrency=4) as mailer:
+            errors = mailer.send([(key, message), ...])  # {key: None | "error"}
+    """
+
+    def __init__(self, concurrency: int = 4, governor: RateGovernor | None = None) -> None:
+        self.concurrency = max(1, concurrency)
+        self.governor = governor or email_rate_governor()
+        self.connections: list[Any] = []
+
+    def __enter__(self) -> "AsyncBulkMailer":
+        email_util = EmailUtil()
+        for _ in range(self.concurrency):
+            connection = email_util._get_connection()
+            if connection is None:
+                raise RuntimeError("Could not create an SMTP connection for bulk mail")
+            connection.open()
+            self.connections.append(connection)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for connection in self.connections:
+            try:
+                connection.close()
+            except Exception as e:
+                logger.warning(f"Error closing bulk mail SMTP session: {e}")
+        self.connections = []
+
+    def send(self, messages: Iterable[tuple[Hashable, EmailMessage]]) -> dict[Hashable, str | None]:
+        """Send a batch and return the error (or None) for each message key."""
+        return asyncio.run(self._send_all(list(messages)))
+
+    async def _send_all(self, messages: list[tuple[Hashable, EmailMessage]]) -> dict[Hashable, str | None]:
+        sessions: asyncio.Queue = asyncio.Queue()
+        for connection in self.connections:
+            sessions.put_nowait(connection)
+
+        async def send_one(key: Hashable, message: EmailMessage) -> tuple[Hashable, str | None]:
+            await self.governor.acquire_async()
+            connection = await sessions.get()
+            try:
+                message.connection = connection
+                sent = await asyncio.to_thread(connection.send_messages, [message])
+                return key, None if sent else "Message rejected by SMTP server"
+            except Exception as e:
+                # Drop the broken session; send_messages reopens it on next use
+                await asyncio.to_thread(connection.close)
+                return key, str(e) or e.__class__.__name__
+            finally:
+                sessions.put_nowait(connection)
+
+        results = await asyncio.gather(*(send_one(key, message) for key, message in messages))
+        return dict(results)
@@ -0,0 +1,225 @@
+import logging
+import math
+import random
+import threading
+import time
+from collections import Counter
+
+import redis
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class FallbackRedisCache(RedisCache):
+    """
+    Name: FallbackRedisCache
+    Description: Django RedisCache that keeps serving from a per-process LocMem cache
+                 while Redis is unreachable. After a failure Redis is skipped for
+                 OPTIONS['RETRY_AFTER'] seconds (default 30) instead of paying a
+                 connection timeout on every call.
+    Author: ayemeleelgol@gmail.com
+    """
+
+    def __init__(self, server, params):
+        params = dict(params)
+        options = dict(params.get("OPTIONS") or {})
+        self._retry_after = options.pop("RETRY_AFTER", 30)
+        options.setdefault("socket_connect_timeout", 1)
+        options.setdefault("socket_timeout", 1)
+        params["OPTIONS"] = options
+        super().__init__(server, params)
+        self._local = LocMemCache(f"fallback-{server}", {"TIMEOUT": params.get("TIMEOUT", 300), "KEY_PREFIX": self.key_prefix, "VERSION": self.version})
+        self._down_until = 0.0
+
+    def _call(self, method: str, *args, **kwargs):
+        if time.monotonic() >= self._down_until:
+            try:
+                return getattr(super(), method)(*args, **kwargs)
+            except redis.RedisError as e:
+                self._down_until = time.monotonic() + self._retry_after
+                logger.warning(f"Redis cache unavailable, using local fallback for {self._retry_after}s: {e}")
+        return getattr(self._local, method)(*args, **kwargs)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call("add", key, value, timeout, version)
+
+    def get(self, key, default=None, version=None):
+        return self._call("get", key, default, version)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call("set", key, value, timeout, version)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call("touch", key, timeout, version)
+
+    def delete(self, key, version=None):
+        return self._call("delete", key, version)
+
+    def get_many(self, keys, version=None):
+        return self._call("get_many", keys, version)
+
+    def has_key(self, key, version=None):
+        return self._call("has_key", key, version)
+
+    def incr(self, key, delta=1, version=None):
+        return self._call("incr", key, delta, version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call("set_many", data, timeout, version)
+
+    def delete_many(self, keys, version=None):
+        return self._call("delete_many", keys, version)
+
+    def clear(self):
+        self._local.clear()
+        return self._call("clear")
+
+
+# Hit/miss counters are kept per process and flushed to Redis periodically,
+# so counting never adds a round trip to a cache read.
+_stats = Counter()
+_stats_lock = threading.Lock()
+_stats_flushed_at = time.monotonic()
+STATS_FLUSH_INTERVAL = 30
+STATS_KEY = "cache:stats"
+
+
+def record_stat(namespace: str, event: str) -> None:
+    """Count one cache event (hit, miss...) for cache_stats(); cheap enough for every request."""
+    global _stats_flushed_at
+    with _stats_lock:
+        _stats[f"{namespace}:{event}"] += 1
+        if time.monotonic() - _stats_flushed_at < STATS_FLUSH_INTERVAL:
+            return
+        pending = dict(_stats)
+        _stats.clear()
+        _stats_flushed_at = time.monotonic()
+    flush_stats(pending)
+
+
+def flush_stats(pending: dict | None = None) -> None:
+    """Add this process's counters to the shared Redis hash."""
+    if pending is None:
+        with _stats_lock:
+            pending = dict(_stats)
+            _stats.clear()
+    if not pending:
+        return
+    try:
+        pipe = get_redis().pipeline()
+        for field, count in pending.items():
+            pipe.hincrby(STATS_KEY, field, count)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.debug(f"Cache stats not flushed: {e}")
+
+
+def cache_stats() -> dict:
+    """Counters from every process: {namespace: {hit, miss, early, wait}}."""
+    stats = {}
+    try:
+        raw = get_redis().hgetall(STATS_KEY)
+    except redis.RedisError:
+        raw = {}
+    with _stats_lock:
+        local = dict(_stats)
+    for field, count in list(raw.items()) + list(local.items()):
+        namespace, event = field.rsplit(":", 1)
+        stats.setdefault(namespace, Counter())[event] += int(count)
+    return {namespace: dict(counts) for namespace, counts in stats.items()}
+
+
+class AppCache:
+    """
+    Name: AppCache
+    Description: Namespaced view of a Django cache for one app. Keys become
+                 "<namespace>:<key>" and carry the namespace version from
+                 settings.CACHE_NAMESPACE_VERSIONS, so bumping it drops the whole namespace.
+    Author: ayemeleelgol@gmail.com
+    """
+
+    def __init__(self, namespace: str, alias: str = "default") -> None:
+        self.namespace = namespace
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def version(self) -> int:
+        return getattr(settings, "CACHE_NAMESPACE_VERSIONS", {}).get(self.namespace, 1)
+
+    def make_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get(self, key: str, default=None):
+        return self.cache.get(self.make_key(key), default, version=self.version)
+
+    def set(self, key: str, value, timeout=DEFAULT_TIMEOUT) -> None:
+        self.cache.set(self.make_key(key), value, timeout, version=self.version)
+
+    def add(self, key: str, value, timeout=DEFAULT_TIMEOUT) -> bool:
+        """Set the value only if the key is missing; True if it was set."""
+        return self.cache.add(self.make_key(key), value, timeout, version=self.version)
+
+    def delete(self, key: str) -> None:
+        """Drop the value only: the stampede lock stays with the caller recomputing it, if any."""
+        self.cache.delete(self.make_key(key), version=self.version)
+
+    def get_or_compute(self, key: str, compute, timeout: int = 300, beta: float = 1.0, lock_timeout: int = 10, wait: float = 2.0):
+        """
+        Return the cached value or build it with compute(), protecting against
+        thundering herds in two ways:
+          - probabilistic early expiry (XFetch): shortly before expiry one caller,
+            chosen at random weighted by the rebuild cost, refreshes the value
+            while everyone else keeps getting the cached one;
+          - on a real miss only the caller holding the lock rebuilds; others poll
+            for up to `wait` seconds before computing themselves.
+        """
+        full_key = self.make_key(key)
+        lock_key = self.make_key(f"{key}:lock")
+        entry = self.cache.get(full_key, version=self.version)
+
+        if entry is not None:
+            value, cost, expires_at = entry
+            early = time.time() - cost * beta * math.log(random.random() or 1e-12) >= expires_at
+            if not early:
+                record_stat(self.namespace, "hit")
+                return value
+            if not self.cache.add(lock_key, 1, lock_timeout, version=self.version):
+                # Someone else is already refreshing: the current value is still valid
+                record_stat(self.namespace, "hit")
+                return value
+            locked = True
+            record_stat(self.namespace, "early")
+        else:
+            record_stat(self.namespace, "miss")
+            locked = self.cache.add(lock_key, 1, lock_timeout, version=self.version)
+            if not locked:
+                deadline = time.monotonic() + wait
+                while time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    entry = self.cache.get(full_key, version=self.version)
+                    if entry is not None:
+                        record_stat(self.namespace, "wait")
+                        return entry[0]
+
+        try:
+            started = time.time()
+            value = compute()
+            cost = time.time() - started
+            self.cache.set(full_key, (value, cost, time.time() + timeout), timeout, version=self.version)
+        finally:
+            # Only the lock holder releases it: a caller that gave up waiting must not
+            # free the lock of the worker still rebuilding
+            if locked:
+                self.cache.delete(lock_key, version=self.version)
+        return value
@@ -0,0 +1,9 @@
+from django.conf import settings
+
+
+def release(request):
+    """Deploy release and fragment lifetime, used to key the {% cache %} fragments in base.html."""
+    return {
+        "RELEASE_VERSION": settings.RELEASE_VERSION,
+        "TEMPLATE_FRAGMENT_TIMEOUT": settings.TEMPLATE_FRAGMENT_TIMEOUT,
+    }
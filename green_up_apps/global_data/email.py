@@ -6,6 +6,7 @@ from django.template.loader import render_to_string
 from django.core.mail import EmailMessage, get_connection
 from decouple import config  # If you're using python-decouple for env vars
 from email.mime.image import MIMEImage
+from .rate_governor import email_rate_governor
 
 
 logger = logging.getLogger(__name__)
@@ -92,6 +93,8 @@ class EmailUtil:
                         logger.warning(f"Could not attach inline image {path}: {e}")
 
             email_message.send(fail_silently=False)
+            # Transactional mail never waits, but counts against the shared SMTP budget
+            email_rate_governor().record()
             logger.info("Generic email sent successfully.")
             return True
 
@@ -29,4 +29,27 @@ class EntryLevelChoices(models.TextChoices):
     BAC_PLUS_2 = "BAC+2", _("BAC +2")
     BAC_PLUS_3 = "BAC+3", _("BAC +3")
     BAC_PLUS_4 = "BAC+4", _("BAC +4")
-    BAC_PLUS_5 = "BAC+5", _("BAC +5")
\ No newline at end of file
+    BAC_PLUS_5 = "BAC+5", _("BAC +5")
+
+class ApplicationTypeChoices(models.TextChoices):
+    EU = "eu", _("EU resident")
+    NON_EU = "non_eu", _("Non-EU resident")
+
+
+class AdminNotificationModeChoices(models.TextChoices):
+    PER_EVENT = "per_event", _("One email per event")
+    DIGEST = "digest", _("Periodic digest")
+
+
+class BulkMailCampaignStatusChoices(models.TextChoices):
+    DRAFT = "draft", _("Draft")
+    RUNNING = "running", _("Running")
+    COMPLETED = "completed", _("Completed")
+    INTERRUPTED = "interrupted", _("Interrupted")
+
+
+class BulkMailRecipientStatusChoices(models.TextChoices):
+    PENDING = "pending", _("Pending")
+    SENDING = "sending", _("Sending")
+    SENT = "sent", _("Sent")
+    FAILED = "failed", _("Failed")
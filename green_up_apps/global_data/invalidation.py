@@ -0,0 +1,92 @@
+import json
+import logging
+import os
+import socket
+import threading
+import time
+
+import redis
+from django.conf import settings
+from django.db import transaction
+
+from .local_cache import clear_local_caches, get_local_cache
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache:invalidate"
+
+_listener_pid = None
+_listener_lock = threading.Lock()
+
+
+def _origin() -> str:
+    """Identifies this process, so it skips its own messages (it already evicted locally)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def publish_invalidation(namespace: str, key=None) -> None:
+    """
+    Evict a local cache entry (or a whole namespace when key is None) in every
+    process: gunicorn workers and Celery workers. Sent after the current
+    transaction commits so no process can re-read the old rows.
+    """
+    def send():
+        local_cache = get_local_cache(namespace)
+        if local_cache is not None:
+            local_cache.evict(key)
+        try:
+            get_redis().publish(CHANNEL, json.dumps({"namespace": namespace, "key": key, "origin": _origin()}))
+        except redis.RedisError as e:
+            logger.warning(f"Cache invalidation for '{namespace}' not published: {e}")
+
+    transaction.on_commit(send)
+
+
+def _handle(message) -> None:
+    try:
+        payload = json.loads(message["data"])
+    except (TypeError, ValueError):
+        return
+    if payload.get("origin") == _origin():
+        return
+    local_cache = get_local_cache(payload.get("namespace", ""))
+    if local_cache is not None:
+        local_cache.evict(payload.get("key"))
+
+
+def _listen() -> None:
+    backoff = 1
+    while True:
+        try:
+            pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(CHANNEL)
+            # Messages may have been missed while disconnected: start from empty caches
+            clear_local_caches()
+            backoff = 1
+            while True:
+                message = pubsub.get_message(timeout=1.0)
+                if message is not None:
+                    _handle(message)
+        except redis.RedisError as e:
+            logger.warning(f"Cache invalidation listener disconnected, retrying in {backoff}s: {e}")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+        except Exception as e:
+            logger.error(f"Cache invalidation listener error: {e}", exc_info=True)
+            time.sleep(backoff)
+
+
+def ensure_listener() -> None:
+    """
+    Start the subscriber thread in this process if it is not running yet.
+    Checked by pid so forked gunicorn/Celery children start their own.
+    """
+    global _listener_pid
+    if _listener_pid == os.getpid() or not getattr(settings, "CACHE_INVALIDATION_BUS", True):
+        return
+    with _listener_lock:
+        if _listener_pid == os.getpid():
+            return
+        threading.Thread(target=_listen, name="cache-invalidation-listener", daemon=True).start()
+        _listener_pid = os.getpid()
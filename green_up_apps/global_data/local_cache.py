@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+# Every LocalLRUCache in the process by namespace, so the invalidation bus can reach them
+_registry: dict[str, "LocalLRUCache"] = {}
+
+
+class LocalLRUCache:
+    """
+    Name: LocalLRUCache
+    Description: Per-process LRU cache for small, hot reference data (programs, campuses,
+                 seasons, company settings). Reads are plain dict lookups; entries are
+                 evicted across processes by the invalidation bus (global_data/invalidation.py),
+                 with a TTL as a safety net for missed messages.
+    Author: ayemeleelgol@gmail.com
+    """
+
+    def __init__(self, namespace: str, maxsize: int = 128, ttl: float = 600) -> None:
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        _registry[namespace] = self
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key, compute):
+        """Return the cached value (None included) or store and return compute()."""
+        from .invalidation import ensure_listener
+
+        ensure_listener()
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def evict(self, key=None) -> None:
+        """Drop one key, or the whole namespace when key is None."""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+
+def get_local_cache(namespace: str) -> LocalLRUCache | None:
+    return _registry.get(namespace)
+
+
+def clear_local_caches() -> None:
+    for local_cache in list(_registry.values()):
+        local_cache.evict()
@@ -0,0 +1,118 @@
+import json
+
+from django.db import NotSupportedError, models
+from django.db.models import F, Func
+from django.utils import timezone
+
+
+class JSONSet(Func):
+    """
+    Set one top-level key of a JSON column in SQL (jsonb_set on PostgreSQL),
+    leaving the other keys untouched. Nest calls to set several keys.
+    """
+    output_field = models.JSONField()
+
+    def __init__(self, expression, key: str, value, **extra):
+        self.key = key
+        self.value = value
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f"JSONSet is not supported on {connection.vendor}.")
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        return (
+            f"jsonb_set(COALESCE({sql}, '{{}}'::jsonb), %s::text[], %s::jsonb, true)",
+            (*params, [self.key], json.dumps(self.value)),
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        return f"json_set(COALESCE({sql}, '{{}}'), %s, json(%s))", (*params, f'$."{self.key}"', json.dumps(self.value))
+
+
+class JSONRemove(Func):
+    """Remove top-level keys from a JSON column in SQL (the jsonb '-' operator on PostgreSQL)."""
+    output_field = models.JSONField()
+
+    def __init__(self, expression, *keys: str, **extra):
+        self.keys = list(keys)
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f"JSONRemove is not supported on {connection.vendor}.")
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        return f"(COALESCE({sql}, '{{}}'::jsonb) - %s::text[])", (*params, self.keys)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        paths = ", ".join(["%s"] * len(self.keys))
+        return f"json_remove(COALESCE({sql}, '{{}}'), {paths})", (*params, *[f'$."{key}"' for key in self.keys])
+
+
+class MetadataKey:
+    """
+    Typed accessor for one key of a model's metadata JSON column.
+    Declared on the model class; reads return the default when the key is
+    missing, writes only change the in-memory document (save or use
+    set_metadata() to persist).
+    """
+
+    def __init__(self, cast=str, default=None, help_text: str = ""):
+        self.cast = cast
+        self.default = default
+        self.help_text = help_text
+        self.key = None
+
+    def __set_name__(self, owner, name):
+        self.key = name
+
+    def get_default(self):
+        return self.default() if callable(self.default) else self.default
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = (instance.metadata or {}).get(self.key)
+        return self.get_default() if value is None else self.cast(value)
+
+    def __set__(self, instance, value):
+        if instance.metadata is None:
+            instance.metadata = {}
+        instance.metadata[self.key] = value
+
+
+def declared_metadata_keys(model) -> dict:
+    """MetadataKey accessors declared on a model (and its parents), by key."""
+    return {
+        name: attr
+        for klass in reversed(model.__mro__)
+        for name, attr in vars(klass).items()
+        if isinstance(attr, MetadataKey)
+    }
+
+
+class MetadataQuerySet(models.QuerySet):
+    """Atomic partial updates of the metadata column, one UPDATE per call."""
+
+    def set_metadata(self, **values) -> int:
+        """
+        Set metadata keys on every row without rewriting the rest of the document.
+        Models that declare MetadataKey accessors only accept declared keys.
+        """
+        declared = declared_metadata_keys(self.model)
+        unknown = set(values) - set(declared)
+        if declared and unknown:
+            raise ValueError(f"Undeclared metadata keys for {self.model.__name__}: {', '.join(sorted(unknown))}")
+
+        expression = F("metadata")
+        for key, value in values.items():
+            expression = JSONSet(expression, key, value)
+        return self.update(metadata=expression, modified=timezone.now())
+
+    def remove_metadata(self, *keys: str) -> int:
+        """Drop metadata keys from every row in a single UPDATE."""
+        return self.update(metadata=JSONRemove(F("metadata"), *keys), modified=timezone.now())
@@ -0,0 +1,151 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+from .page_cache import page_state, pages_cache
+
+try:
+    import brotli
+except ImportError:  # optional: responses are only gzipped without it
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+# When this process first saw the current release; cluster-wide via the shared cache
+_release_started_at = None
+
+
+def release_started_at() -> float:
+    global _release_started_at
+    if _release_started_at is None:
+        key = f"release:{settings.RELEASE_VERSION}"
+        pages_cache.add(key, time.time(), timeout=None)
+        _release_started_at = pages_cache.get(key) or time.time()
+    return _release_started_at
+
+
+def page_validators(request) -> tuple[str, float]:
+    """
+    Strong ETag and Last-Modified of a static content page for anonymous visitors,
+    computed without rendering it: release (templates), page generation (CMS-like
+    models), language and path.
+    """
+    generation, changed_at = page_state()
+    parts = (
+        settings.RELEASE_VERSION,
+        generation,
+        getattr(request, "LANGUAGE_CODE", settings.LANGUAGE_CODE),
+        request.get_full_path(),
+    )
+    etag = '"%s"' % hashlib.md5("|".join(parts).encode()).hexdigest()
+    return etag, max(changed_at or 0, release_started_at())
+
+
+class ConditionalPageMiddleware:
+    """
+    Name: ConditionalPageMiddleware
+    Description: Adds ETag/Last-Modified to views declaring conditional_get = True
+                 (PageCacheMixin) and answers If-None-Match/If-Modified-Since with 304
+                 before the view runs, so nothing is rendered for a revalidation.
+                 Anonymous requests only, like the page cache: an authenticated body
+                 differs per user under the same page generation.
+                 Must come after the auth, messages and locale middleware.
+    Author: ayemeleelgol@gmail.com
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        validators = getattr(request, "_page_validators", None)
+        if validators is not None and response.status_code == 200 and not response.has_header("ETag"):
+            self.set_validators(response, *validators)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "view_class", None)
+        if (
+            not getattr(view_class, "conditional_get", False)
+            or request.method not in ("GET", "HEAD")
+            or request.user.is_authenticated
+            or len(get_messages(request))
+        ):
+            return None
+
+        etag, last_modified = page_validators(request)
+        response = get_conditional_response(request, etag=etag, last_modified=int(last_modified))
+        if response is None:
+            request._page_validators = (etag, last_modified)
+            return None
+        self.set_validators(response, etag, last_modified)
+        return response
+
+    @staticmethod
+    def set_validators(response, etag, last_modified):
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        # Always revalidate: a changed model or a deploy must show up immediately
+        patch_cache_control(response, public=True, max_age=0, must_revalidate=True)
+
+
+def accepted_encodings(header: str) -> set[str]:
+    """Content codings of an Accept-Encoding header, without those refused with q=0."""
+    encodings = set()
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        try:
+            quality = float(params.strip().removeprefix("q=")) if params else 1.0
+        except ValueError:
+            quality = 1.0
+        if coding.strip() and quality > 0:
+            encodings.add(coding.strip().lower())
+    return encodings
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Name: CompressionMiddleware
+    Description: Compresses dynamic text responses with brotli when the client accepts it
+                 and the brotli package is installed, otherwise with gzip (Django's
+                 GZipMiddleware, with its BREACH length randomisation). Pages carrying a
+                 CSRF token (forms, which may also echo submitted input) always take the
+                 gzip path, since brotli output has no such padding. Static files never
+                 reach it: whitenoise, above it, serves them precompressed.
+                 RESPONSE_COMPRESSION['BROTLI_QUALITY'] trades CPU for size (default 5).
+    Author: ayemeleelgol@gmail.com
+    """
+
+    def process_response(self, request, response):
+        content_type = response.get("Content-Type", "")
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return response
+        if (
+            brotli is None
+            # get_token() was called while rendering: a CSRF token is in the body. The key
+            # stays set (to False) once CsrfViewMiddleware has written the cookie
+            or "CSRF_COOKIE_NEEDS_UPDATE" in request.META
+            or response.streaming
+            or len(response.content) < 200
+            or response.has_header("Content-Encoding")
+            or "br" not in accepted_encodings(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        ):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        quality = getattr(settings, "RESPONSE_COMPRESSION", {}).get("BROTLI_QUALITY", 5)
+        compressed = brotli.compress(response.content, mode=brotli.MODE_TEXT, quality=quality)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+        return response
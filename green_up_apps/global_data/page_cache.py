@@ -0,0 +1,115 @@
+import hashlib
+import logging
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpResponse
+
+from .cache import AppCache, record_stat
+from .identifiers import uuid7
+
+logger = logging.getLogger(__name__)
+
+pages_cache = AppCache("pages")
+# (generation, changed_at) tuple; the "generation" key of the first version held a bare string
+PAGE_STATE_KEY = "state"
+
+
+def page_state() -> tuple[str, float | None]:
+    """
+    (generation, changed_at): the token changed by invalidate_pages(), part of every
+    page key and ETag, and the time of that change (None until the first change).
+    """
+    return pages_cache.get(PAGE_STATE_KEY) or ("0", None)
+
+
+def page_generation() -> str:
+    return page_state()[0]
+
+
+def invalidate_pages(**kwargs) -> None:
+    """Drop every cached page (after the current transaction commits)."""
+    transaction.on_commit(lambda: pages_cache.set(PAGE_STATE_KEY, (uuid7().hex, time.time()), timeout=None))
+
+
+def invalidate_pages_on_m2m(action, **kwargs) -> None:
+    """m2m_changed receiver: only the post_* actions change what a page shows."""
+    if action.startswith("post_"):
+        invalidate_pages()
+
+
+def connect_page_cache_invalidation() -> None:
+    """
+    Invalidate pages on save/delete of the models listed in settings.PAGE_CACHE_INVALIDATED_BY,
+    and on changes to their many-to-many links (e.g. Program.campuses), which send neither.
+    """
+    for label in getattr(settings, "PAGE_CACHE_INVALIDATED_BY", []):
+        model = apps.get_model(label)
+        post_save.connect(invalidate_pages, sender=model, dispatch_uid=f"page_cache_save_{label}")
+        post_delete.connect(invalidate_pages, sender=model, dispatch_uid=f"page_cache_delete_{label}")
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(
+                invalidate_pages_on_m2m,
+                sender=field.remote_field.through,
+                dispatch_uid=f"page_cache_m2m_{label}.{field.name}",
+            )
+
+
+class PageCacheMixin:
+    """
+    Name: PageCacheMixin
+    Description: Full-page cache for anonymous GET/HEAD requests of static TemplateViews.
+                 Pages are keyed by path, language (set by LocaleMiddleware), the deploy
+                 release and a generation token bumped when CMS-like models change.
+                 Authenticated users, pending flash messages and pages that issue a CSRF
+                 token are always rendered.
+    Author: ayemeleelgol@gmail.com
+    """
+    page_cache_timeout = 60 * 10
+    # Also answered with 304 by ConditionalPageMiddleware (global_data/middleware.py)
+    conditional_get = True
+
+    def page_cache_key(self, request) -> str:
+        path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+        language = getattr(request, "LANGUAGE_CODE", settings.LANGUAGE_CODE)
+        return f"{settings.RELEASE_VERSION}:{page_generation()}:{language}:{path}"
+
+    def page_cache_allowed(self, request) -> bool:
+        return (
+            getattr(settings, "PAGE_CACHE_ENABLED", True)
+            and request.method in ("GET", "HEAD")
+            and not request.user.is_authenticated
+            and not len(get_messages(request))
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self.page_cache_allowed(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        key = self.page_cache_key(request)
+        cached = pages_cache.get(key)
+        if cached is not None:
+            record_stat("pages", "hit")
+            content, content_type = cached
+            response = HttpResponse(content, content_type=content_type)
+            response["X-Page-Cache"] = "hit"
+            return response
+
+        record_stat("pages", "miss")
+        response = super().dispatch(request, *args, **kwargs)
+
+        def store(response):
+            # A page that rendered {% csrf_token %} must not be shared between visitors
+            if response.status_code == 200 and not response.cookies and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE"):
+                pages_cache.set(key, (response.content, response["Content-Type"]), self.page_cache_timeout)
+            response["X-Page-Cache"] = "miss"
+
+        if hasattr(response, "add_post_render_callback"):
+            response.add_post_render_callback(store)
+        else:
+            store(response)
+        return response
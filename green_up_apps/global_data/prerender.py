@@ -0,0 +1,99 @@
+import json
+import logging
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.http import HttpResponse
+
+from .cache import record_stat
+from .page_cache import PageCacheMixin, page_state
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+_pages: dict[str, bytes] = {}
+_pages_lock = threading.Lock()
+
+
+def prerender_root() -> Path:
+    return Path(getattr(settings, "PRERENDER_ROOT", Path(settings.BASE_DIR) / "build" / "prerendered"))
+
+
+@lru_cache(maxsize=1)
+def load_manifest() -> dict:
+    """
+    {"release": ..., "built_at": ..., "pages": {view_name: {language: file}}} written by
+    render_static_site. Ignored (empty) when it was built for another release than the one running.
+    """
+    try:
+        manifest = json.loads((prerender_root() / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("release") != settings.RELEASE_VERSION:
+        logger.warning(f"Pre-rendered pages built for release {manifest.get('release')}, running {settings.RELEASE_VERSION}: not served")
+        return {}
+    return manifest
+
+
+def prerendered_is_current() -> bool:
+    """
+    False once a model in PAGE_CACHE_INVALIDATED_BY changed after the build: the pages
+    embed the navbar's formation menu. Rendering (and the page cache) takes over until
+    render_static_site runs again.
+    """
+    changed_at = page_state()[1]
+    return changed_at is None or changed_at <= load_manifest().get("built_at", 0)
+
+
+def prerendered_page(view_name: str, language: str) -> bytes | None:
+    """Bytes of the pre-rendered page, read from disk once per process."""
+    name = load_manifest().get("pages", {}).get(view_name, {}).get(language)
+    if name is None:
+        return None
+    content = _pages.get(name)
+    if content is None:
+        try:
+            content = (prerender_root() / name).read_bytes()
+        except OSError:
+            return None
+        with _pages_lock:
+            _pages[name] = content
+    return content
+
+
+class PrerenderedPageMixin(PageCacheMixin):
+    """
+    Name: PrerenderedPageMixin
+    Description: Serves the HTML written by "manage.py render_static_site" for anonymous
+                 GET/HEAD requests without a query string, so those requests never render a
+                 template. Falls back to the page cache, then to rendering, when no file was
+                 built for the view and language, or when the data they embed (the navbar's
+                 formation menu) changed after the build. Only for pages with no per-request
+                 data and no database data outside PAGE_CACHE_INVALIDATED_BY.
+    Author: ayemeleelgol@gmail.com
+    """
+
+    def prerendered_allowed(self, request) -> bool:
+        return (
+            getattr(settings, "PRERENDERED_PAGES_ENABLED", True)
+            and request.method in ("GET", "HEAD")
+            and not request.GET
+            and not request.user.is_authenticated
+            and not len(get_messages(request))
+            and prerendered_is_current()
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.prerendered_allowed(request) and request.resolver_match is not None:
+            language = getattr(request, "LANGUAGE_CODE", settings.LANGUAGE_CODE)
+            content = prerendered_page(request.resolver_match.view_name, language)
+            if content is not None:
+                record_stat("pages", "prerendered")
+                response = HttpResponse(content, content_type="text/html; charset=utf-8")
+                response["X-Page-Cache"] = "prerendered"
+                return response
+        return super().dispatch(request, *args, **kwargs)
@@ -0,0 +1,68 @@
+import asyncio
+import logging
+import time
+
+import redis
+from django.conf import settings
+
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class RateGovernor:
+    """
+    Fixed-window rate limiter shared by every process through Redis.
+
+    Bulk senders call ``acquire()`` / ``acquire_async()`` and wait for a free slot;
+    transactional senders only ``record()`` their usage, so they are never delayed
+    but still consume the shared budget that bulk senders wait on.
+    When Redis is unreachable the governor fails open and logs a warning.
+    """
+
+    def __init__(self, name: str, limit: int, period: int = 60) -> None:
+        self.name = name
+        self.limit = limit
+        self.period = period
+
+    def _window(self):
+        now = time.time()
+        window = int(now // self.period)
+        return f"rate:{self.name}:{window}", (window + 1) * self.period - now
+
+    def _incr(self) -> tuple[int, float]:
+        key, remaining = self._window()
+        pipe = get_redis().pipeline()
+        pipe.incr(key)
+        pipe.expire(key, self.period * 2)
+        count, _ = pipe.execute()
+        return count, remaining
+
+    def try_acquire(self) -> float:
+        """Take a slot if one is free. Return 0 on success, else the seconds to wait."""
+        try:
+            count, remaining = self._incr()
+        except redis.RedisError as e:
+            logger.warning(f"Rate governor '{self.name}' unavailable, allowing send: {e}")
+            return 0
+        return 0 if count <= self.limit else remaining
+
+    def acquire(self) -> None:
+        while (wait := self.try_acquire()) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        while (wait := self.try_acquire()) > 0:
+            await asyncio.sleep(wait)
+
+    def record(self) -> None:
+        """Count a send that must not wait (e.g. a 2FA code)."""
+        try:
+            self._incr()
+        except redis.RedisError as e:
+            logger.warning(f"Rate governor '{self.name}' unavailable, send not recorded: {e}")
+
+
+def email_rate_governor() -> RateGovernor:
+    """Governor for outgoing SMTP traffic, shared by transactional and bulk mail."""
+    return RateGovernor("smtp", getattr(settings, "EMAIL_RATE_LIMIT_PER_MINUTE", 120), period=60)
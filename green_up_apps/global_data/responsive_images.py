@@ -0,0 +1,141 @@
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.finders import BaseFinder
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.files.storage import FileSystemStorage
+
+logger = logging.getLogger(__name__)
+
+SOURCE_SUFFIXES = {".jpg", ".jpeg", ".png"}
+MANIFEST_NAME = "responsive/manifest.json"
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+
+
+def responsive_settings() -> dict:
+    options = {
+        "SOURCE_PREFIX": "images/",
+        "WIDTHS": [480, 960, 1600],
+        "FORMATS": ["avif", "webp"],
+        "QUALITY": {"avif": 50, "webp": 75},
+        "BUILD_DIR": Path(settings.BASE_DIR) / "build" / "static",
+    }
+    options.update(getattr(settings, "RESPONSIVE_IMAGES", {}))
+    options["BUILD_DIR"] = Path(options["BUILD_DIR"])
+    return options
+
+
+def _source_images():
+    """(static path, absolute file path) of every source image found by the regular finders."""
+    options = responsive_settings()
+    seen = set()
+    for finder in finders.get_finders():
+        if isinstance(finder, ResponsiveImageFinder):
+            continue
+        for path, storage in finder.list([]):
+            path = path.replace("\\", "/")
+            if path in seen or not path.startswith(options["SOURCE_PREFIX"]) or Path(path).suffix.lower() not in SOURCE_SUFFIXES:
+                continue
+            seen.add(path)
+            yield path, storage.path(path)
+
+
+def _target_widths(width: int, widths: list[int]) -> list[int]:
+    targets = [w for w in sorted(widths) if w < width]
+    targets.append(min(width, max(widths)))
+    return targets
+
+
+def build_image(path: str, source: str, options: dict) -> dict:
+    """Write the AVIF/WebP variants of one image (skipping those already built) and describe them."""
+    from PIL import Image, ImageOps
+
+    data = Path(source).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    stem = Path(path).with_suffix("").as_posix()
+    entry = {"bytes": len(data), "variants": []}
+
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("RGBA" if "A" in image.getbands() or image.mode == "P" else "RGB")
+        entry["width"], entry["height"] = image.size
+
+        for width in _target_widths(image.width, options["WIDTHS"]):
+            height = round(image.height * width / image.width)
+            resized = None
+            for fmt in options["FORMATS"]:
+                name = f"responsive/{stem}.{digest}.{width}w.{fmt}"
+                target = options["BUILD_DIR"] / name
+                if not target.exists():
+                    if resized is None:
+                        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    resized.save(target, fmt.upper(), quality=options["QUALITY"].get(fmt, 75))
+                entry["variants"].append({"format": fmt, "width": width, "height": height, "path": name, "bytes": target.stat().st_size})
+    return entry
+
+
+def build_responsive_images() -> dict:
+    """Build every variant and write the manifest read by {% responsive_image %}."""
+    options = responsive_settings()
+    manifest = {}
+    for path, source in _source_images():
+        try:
+            manifest[path] = build_image(path, source, options)
+        except OSError as e:
+            logger.warning(f"Responsive variants not built for {path}: {e}")
+    target = options["BUILD_DIR"] / MANIFEST_NAME
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    load_manifest.cache_clear()
+    return manifest
+
+
+@lru_cache(maxsize=1)
+def load_manifest() -> dict:
+    """The build manifest, from the build dir or the collected static files; empty if never built."""
+    path = finders.find(MANIFEST_NAME)
+    try:
+        if path:
+            return json.loads(Path(path).read_text())
+        with staticfiles_storage.open(MANIFEST_NAME) as manifest:
+            return json.loads(manifest.read())
+    except (OSError, ValueError):
+        return {}
+
+
+class ResponsiveImageFinder(BaseFinder):
+    """
+    Name: ResponsiveImageFinder
+    Description: Static files finder exposing the AVIF/WebP variants of the images under
+                 RESPONSIVE_IMAGES['SOURCE_PREFIX']. collectstatic lists it, which builds the
+                 missing variants first; variant names carry a hash of the source content.
+    Author: ayemeleelgol@gmail.com
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.location = responsive_settings()["BUILD_DIR"]
+        self.storage = FileSystemStorage(location=self.location)
+
+    def check(self, **kwargs):
+        return []
+
+    def find(self, path, find_all=False, **kwargs):
+        match = self.location / path
+        if not path.startswith("responsive/") or not match.is_file():
+            return []
+        return [str(match)] if find_all else str(match)
+
+    def list(self, ignore_patterns):
+        # Only the current variants: those of replaced images stay out of STATIC_ROOT
+        manifest = build_responsive_images()
+        yield MANIFEST_NAME, self.storage
+        for entry in manifest.values():
+            for variant in entry["variants"]:
+                yield variant["path"], self.storage
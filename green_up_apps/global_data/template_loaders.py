@@ -0,0 +1,52 @@
+import re
+
+from django.template.loaders import app_directories, filesystem
+
+# Content where whitespace is significant, or is a translation msgid, kept as written
+PRESERVED = re.compile(
+    r"<(pre|textarea|script)\b.*?</\1\s*>"
+    r"|{%\s*(blocktrans|blocktranslate)\b(?![^%]*\btrimmed\b).*?{%\s*end\2\s*%}"
+    r"|{%\s*verbatim\b.*?{%\s*endverbatim\s*%}",
+    re.S | re.I,
+)
+# Indentation, trailing spaces and blank lines: a run of whitespace holding a newline
+# renders like a single newline everywhere else in HTML
+LINE_BREAK = re.compile(r"[ \t\r\f\v]*\n\s*")
+
+
+def strip_whitespace(source: str) -> str:
+    """Collapse every whitespace run containing a newline to one newline, outside PRESERVED blocks."""
+    parts, position = [], 0
+    for match in PRESERVED.finditer(source):
+        parts.append(LINE_BREAK.sub("\n", source[position:match.start()]))
+        parts.append(match.group(0))
+        position = match.end()
+    parts.append(LINE_BREAK.sub("\n", source[position:]))
+    return "".join(parts)
+
+
+class WhitespaceStrippingMixin:
+    """Strips insignificant whitespace from .html template sources before they are compiled."""
+
+    def get_contents(self, origin):
+        contents = super().get_contents(origin)
+        if not origin.name.endswith(".html"):
+            return contents
+        return strip_whitespace(contents)
+
+
+class FilesystemLoader(WhitespaceStrippingMixin, filesystem.Loader):
+    """
+    Name: FilesystemLoader
+    Description: filesystem.Loader compiling whitespace-stripped .html templates.
+                 Wrapped by the cached loader, so stripping runs once per template and process.
+    Author: ayemeleelgol@gmail.com
+    """
+
+
+class AppDirectoriesLoader(WhitespaceStrippingMixin, app_directories.Loader):
+    """
+    Name: AppDirectoriesLoader
+    Description: app_directories.Loader compiling whitespace-stripped .html templates.
+    Author: ayemeleelgol@gmail.com
+    """
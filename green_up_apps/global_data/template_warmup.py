@@ -0,0 +1,42 @@
+import logging
+import time
+from pathlib import Path
+
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_SUFFIXES = {".html", ".txt", ".xml"}
+
+
+def _template_dirs(engine):
+    """Directories searched by the engine's loaders, including those wrapped by the cached loader."""
+    for loader in engine.engine.template_loaders:
+        for inner in getattr(loader, "loaders", [loader]):
+            yield from inner.get_dirs()
+
+
+def warm_template_cache() -> int:
+    """
+    Compile every template found in the template directories (project and app
+    dirs) into the cached loader of this process, so the first requests after
+    a deploy don't parse templates from disk. Returns the number compiled.
+    """
+    started = time.perf_counter()
+    compiled = 0
+    for engine in engines.all():
+        for directory in _template_dirs(engine):
+            root = Path(directory)
+            if not root.is_dir():
+                continue
+            for path in root.rglob("*"):
+                if path.suffix not in TEMPLATE_SUFFIXES or not path.is_file():
+                    continue
+                name = path.relative_to(root).as_posix()
+                try:
+                    engine.get_template(name)
+                    compiled += 1
+                except (TemplateDoesNotExist, TemplateSyntaxError) as e:
+                    logger.warning(f"Template warmup skipped {name}: {e}")
+    logger.info(f"Template warmup compiled {compiled} templates in {time.perf_counter() - started:.2f}s")
+    return compiled
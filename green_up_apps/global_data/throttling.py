@@ -0,0 +1,127 @@
+import hashlib
+import logging
+import math
+import time
+import uuid
+
+import redis
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.utils.translation import gettext_lazy as _
+
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+# Sliding window log: drop entries older than the window, count the rest and
+# record this hit only when it is allowed. Returns {allowed, retry_after_ms}.
+_SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) >= limit then
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    return {0, tonumber(oldest[2]) + window - now}
+end
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('PEXPIRE', key, window)
+return {1, 0}
+"""
+
+
+class SlidingWindowThrottle:
+    """
+    Redis sliding-window rate limit for one scope and dimension (ip, email, global).
+    """
+
+    def __init__(self, scope: str, dimension: str, limit: int, window: int) -> None:
+        self.scope = scope
+        self.dimension = dimension
+        self.limit = limit
+        self.window_ms = window * 1000
+
+    def hit(self, identity: str) -> float:
+        """Count a request; return 0 if allowed, else the seconds until a slot frees up."""
+        digest = hashlib.sha256(identity.encode()).hexdigest()[:32]
+        key = f"throttle:{self.scope}:{self.dimension}:{digest}"
+        now_ms = int(time.time() * 1000)
+        allowed, retry_after_ms = get_redis().eval(
+            _SLIDING_WINDOW_SCRIPT, 1, key, now_ms, self.window_ms, self.limit, f"{now_ms}-{uuid.uuid4().hex[:8]}"
+        )
+        return 0 if allowed else max(int(retry_after_ms), 0) / 1000
+
+
+def get_client_ip(request) -> str:
+    """
+    Client IP as seen by the trusted proxies. Each of the settings.NUM_PROXIES proxies
+    appends the address it received the request from to X-Forwarded-For, so the
+    client's address is the NUM_PROXIES-th entry from the right; anything to its left
+    was sent by the client and cannot be trusted.
+    """
+    num_proxies = getattr(settings, "NUM_PROXIES", 1)
+    forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if num_proxies and forwarded_for:
+        hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+        if hops:
+            return hops[-min(num_proxies, len(hops))]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+class ThrottleMixin:
+    """
+    Name: ThrottleMixin
+    Description: Rejects throttled POST requests with a 429 and Retry-After before the
+                 view runs, so no password hashing or database access happens.
+                 Limits come from settings.THROTTLE_RATES[throttle_scope] and are
+                 applied per client IP, per submitted email and globally.
+    Author: ayemeleelgol@gmail.com
+    """
+    throttle_scope: str = ""
+    throttle_methods = ("POST",)
+
+    def get_throttle_identities(self, request, **kwargs) -> dict:
+        email = kwargs.get("email") or request.POST.get("email", "")
+        return {
+            "ip": get_client_ip(request),
+            "email": email.strip().lower(),
+            "global": "all",
+        }
+
+    def check_throttle(self, request, **kwargs) -> float:
+        rates = getattr(settings, "THROTTLE_RATES", {}).get(self.throttle_scope, {})
+        identities = self.get_throttle_identities(request, **kwargs)
+        retry_after = 0
+        try:
+            for dimension, (limit, window) in rates.items():
+                identity = identities.get(dimension)
+                if not identity:
+                    continue
+                wait = SlidingWindowThrottle(self.throttle_scope, dimension, limit, window).hit(identity)
+                retry_after = max(retry_after, wait)
+                if wait:
+                    break
+        except redis.RedisError as e:
+            logger.warning(f"Throttle '{self.throttle_scope}' unavailable, allowing request: {e}")
+            return 0
+        return retry_after
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in self.throttle_methods and self.throttle_scope:
+            retry_after = self.check_throttle(request, **kwargs)
+            if retry_after:
+                return self.throttled_response(request, retry_after)
+        return super().dispatch(request, *args, **kwargs)
+
+    def throttled_response(self, request, retry_after: float) -> HttpResponse:
+        retry_after = math.ceil(retry_after)
+        message = _("Too many attempts. Please try again in %(seconds)s seconds.") % {"seconds": retry_after}
+        logger.warning(f"Throttled '{self.throttle_scope}' request from {get_client_ip(request)}")
+        if request.headers.get("X-Requested-With") == "XMLHttpRequest":
+            response = JsonResponse({"success": False, "message": message}, status=429)
+        else:
+            response = HttpResponse(message, status=429, content_type="text/plain; charset=utf-8")
+        response["Retry-After"] = str(retry_after)
+        return response
@@ -18,6 +18,7 @@ class UserAdmin(BaseUserAdmin):
         (None, {"fields": ("email", "password")}),
         (_("Personal info"), {"fields": ("fullname", "first_name", "last_name", "profile_picture")}),
         (_("Permissions"), {"fields": ("is_active", "is_staff", "is_superuser", "is_admin", "groups", "user_permissions")}),
+        (_("Notifications"), {"fields": ("admin_notification_mode",)}),
         (_("Important dates"), {"fields": ("last_login", "date_joined")}),
         (_("Other"), {"fields": ("ip_address", "has_accepted_terms", "is_manually_deleted")}),
     )
@@ -33,7 +34,7 @@ class UserAdmin(BaseUserAdmin):
     )
 
     list_display = ("email", "fullname", "is_staff", "is_superuser", "is_admin", "is_active", "date_joined")
-    list_filter = ("is_staff", "is_superuser", "is_admin", "is_active")
+    list_filter = ("is_staff", "is_superuser", "is_admin", "is_active", "admin_notification_mode")
     search_fields = ("email", "fullname", "first_name", "last_name")
     ordering = ("-date_joined",)
     filter_horizontal = ("groups", "user_permissions")
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'green_up_apps.users'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from green_up_apps.global_data.page_cache import connect_page_cache_invalidation
+
+        connect_page_cache_invalidation()
@@ -0,0 +1,20 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    Name: CachedModelBackend
+    Description: ModelBackend that resolves the session user from a cached snapshot
+                 (see UserManager.get_cached), so authenticated requests skip the
+                 user query. Snapshots are dropped by the User signals on save/delete.
+    Author: ayemeleelgol@gmail.com
+    """
+
+    def get_user(self, user_id):
+        UserModel = get_user_model()
+        try:
+            user = UserModel.objects.get_cached(user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,194 @@
+import gzip
+import json
+import re
+import statistics
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import NoReverseMatch, URLPattern, get_resolver, reverse
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip sizes are reported without it
+    brotli = None
+
+NAMESPACES = ("users", "admission", "formation", "apropos")
+TEXT_SUFFIXES = {".css", ".js", ".svg", ".json", ".html", ".txt", ".map"}
+# Sample values for URL converters, e.g. verify-2fa/<str:email>/
+SAMPLE_KWARGS = {"str": "audit@example.com", "slug": "audit", "int": 1, "uuid": "00000000-0000-7000-8000-000000000000", "path": "audit"}
+
+PICTURE = re.compile(r"<picture\b.*?</picture>", re.S | re.I)
+SOURCE_SRCSET = re.compile(r"<source\b[^>]*\bsrcset=\"([^\"]+)\"", re.I)
+ASSET_URL = re.compile(r"""(?:src|href)=["']([^"']+)["']""", re.I)
+# Metrics compared with --baseline; a higher value is a regression
+COMPARED_METRICS = ("html_bytes", "html_gzip_bytes", "asset_compressed_bytes", "queries", "render_ms")
+RENDER_NOISE_MS = 5
+
+
+def formation_kwargs():
+    """Slug of the first active formation, or None when there is none."""
+    from green_up_apps.formation.models import Formation
+
+    slug = (
+        Formation.objects.filter(is_active=True, slug__isnull=False)
+        .exclude(slug="")
+        .order_by("slug")
+        .values_list("slug", flat=True)
+        .first()
+    )
+    return {"slug": slug} if slug else None
+
+
+# Pages that 404 on a made-up sample value: URL kwargs taken from the database
+OBJECT_KWARGS = {
+    "formation:formation_detail": formation_kwargs,
+    "formation:api_formation_detail": formation_kwargs,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Render every named page of the users, admission, formation and apropos namespaces "
+        "with the test client and report HTML size, referenced static assets with their "
+        "compressed sizes, DB queries and render time. Use --baseline to fail on regressions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=5, help="Renders per page; the median time is reported.")
+        parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+        parser.add_argument("--output", help="Also write the JSON report to this file.")
+        parser.add_argument("--baseline", help="Previous JSON report: exit with an error when a page changed status or got heavier or slower.")
+        parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed growth over the baseline (default 10%%).")
+        parser.add_argument("--with-page-cache", action="store_true", help="Keep the full-page cache on (measures cache hits).")
+
+    def handle(self, *args, **options):
+        self._asset_sizes = {}
+        pages = []
+        with override_settings(ALLOWED_HOSTS=["*"], PAGE_CACHE_ENABLED=options["with_page_cache"]):
+            client = Client()
+            for name, url in self.page_urls():
+                pages.append(self.audit(client, name, url, options["repeat"]))
+
+        report = {"generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "release": settings.RELEASE_VERSION, "pages": pages}
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps(report, indent=2))
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.print_table(pages)
+
+        if options["baseline"]:
+            regressions = self.compare(pages, json.loads(Path(options["baseline"]).read_text()), options["tolerance"])
+            if regressions:
+                raise CommandError("Page regressions:\n" + "\n".join(regressions))
+            self.stderr.write(self.style.SUCCESS("No regression against the baseline."))
+
+    def page_urls(self):
+        resolver = get_resolver()
+        for namespace in NAMESPACES:
+            _prefix, sub_resolver = resolver.namespace_dict[namespace]
+            for pattern in sub_resolver.url_patterns:
+                if not isinstance(pattern, URLPattern) or not pattern.name:
+                    continue
+                name = f"{namespace}:{pattern.name}"
+                if name in OBJECT_KWARGS:
+                    kwargs = OBJECT_KWARGS[name]()
+                    if kwargs is None:
+                        self.stderr.write(f"Skipped {name}: no object in the database to audit it with.")
+                        continue
+                else:
+                    kwargs = {
+                        key: SAMPLE_KWARGS.get(type(converter).__name__.replace("Converter", "").lower(), "audit")
+                        for key, converter in pattern.pattern.converters.items()
+                    }
+                try:
+                    yield name, reverse(name, kwargs=kwargs or None)
+                except NoReverseMatch:
+                    self.stderr.write(f"Skipped {name}: cannot build a sample URL.")
+
+    def audit(self, client, name, url, repeat):
+        timings = []
+        for _ in range(max(repeat, 1)):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = client.get(url, HTTP_ACCEPT_LANGUAGE=settings.LANGUAGE_CODE)
+                timings.append((time.perf_counter() - started) * 1000)
+
+        html = response.content if response.status_code == 200 else b""
+        assets = [self.asset_size(asset) for asset in self.referenced_assets(html.decode("utf-8", "replace"))]
+        return {
+            "name": name,
+            "url": url,
+            "status": response.status_code,
+            "html_bytes": len(html),
+            "html_gzip_bytes": len(gzip.compress(html, 6)),
+            "html_brotli_bytes": len(brotli.compress(html)) if brotli else None,
+            "asset_count": len(assets),
+            "asset_bytes": sum(asset["bytes"] for asset in assets),
+            "asset_compressed_bytes": sum(asset["compressed_bytes"] for asset in assets),
+            "assets": assets,
+            "queries": len(queries),
+            "render_ms": round(statistics.median(timings), 2),
+        }
+
+    def referenced_assets(self, html):
+        """Static URLs a browser downloads: for <picture>, the widest candidate of the first <source>."""
+        urls = []
+        for picture in PICTURE.findall(html):
+            source = SOURCE_SRCSET.search(picture)
+            if source:
+                candidates = [candidate.strip().rsplit(" ", 1) for candidate in source.group(1).split(",")]
+                urls.append(max(candidates, key=lambda candidate: int(candidate[-1].rstrip("w") or 0))[0])
+        html = PICTURE.sub("", html)
+        urls += ASSET_URL.findall(html)
+        return sorted({url for url in urls if url.startswith(settings.STATIC_URL)})
+
+    def asset_size(self, url):
+        if url not in self._asset_sizes:
+            path = url[len(settings.STATIC_URL):].split("?")[0]
+            file = finders.find(path) or (staticfiles_storage.path(path) if staticfiles_storage.exists(path) else None)
+            data = Path(file).read_bytes() if file else b""
+            compressed = len(gzip.compress(data, 9)) if Path(path).suffix in TEXT_SUFFIXES else len(data)
+            self._asset_sizes[url] = {"url": url, "found": bool(file), "bytes": len(data), "compressed_bytes": compressed}
+        return self._asset_sizes[url]
+
+    def print_table(self, pages):
+        self.stdout.write(f"{'page':<38}{'status':>7}{'HTML KB':>9}{'gzip KB':>9}{'assets':>8}{'assets KB':>11}{'queries':>9}{'ms':>9}")
+        for page in pages:
+            self.stdout.write(
+                f"{page['name']:<38}{page['status']:>7}{page['html_bytes'] / 1024:>9.1f}{page['html_gzip_bytes'] / 1024:>9.1f}"
+                f"{page['asset_count']:>8}{page['asset_compressed_bytes'] / 1024:>11.1f}{page['queries']:>9}{page['render_ms']:>9.1f}"
+            )
+        missing = sorted({asset["url"] for page in pages for asset in page["assets"] if not asset["found"]})
+        for url in missing:
+            self.stderr.write(f"Referenced asset not found: {url}")
+
+    @staticmethod
+    def compare(pages, baseline, tolerance):
+        previous = {page["name"]: page for page in baseline.get("pages", [])}
+        regressions = []
+        for page in pages:
+            before = previous.get(page["name"])
+            if before is None:
+                continue
+            # A page that now errors renders no HTML and would look lighter than before
+            if page["status"] != before.get("status"):
+                regressions.append(f"{page['name']}: status {before.get('status')} -> {page['status']}")
+                continue
+            for metric in COMPARED_METRICS:
+                old, new = before.get(metric) or 0, page[metric] or 0
+                # Query counts must not grow at all; sizes and times get the tolerance,
+                # plus a few milliseconds so sub-10ms pages don't fail on timer noise
+                limit = old if metric == "queries" else old * (1 + tolerance)
+                if metric == "render_ms":
+                    limit = max(limit, old + RENDER_NOISE_MS)
+                if new > limit:
+                    regressions.append(f"{page['name']}: {metric} {old} -> {new}")
+        return regressions
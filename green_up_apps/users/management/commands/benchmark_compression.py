@@ -0,0 +1,86 @@
+import copy
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.urls import reverse
+from django.utils.text import compress_string
+
+from green_up_apps.global_data.middleware import brotli
+
+PAGES = ("users:home", "admission:admission_ue", "admission:admission_hors_ue")
+PLAIN_LOADERS = {
+    "green_up_apps.global_data.template_loaders.FilesystemLoader": "django.template.loaders.filesystem.Loader",
+    "green_up_apps.global_data.template_loaders.AppDirectoriesLoader": "django.template.loaders.app_directories.Loader",
+}
+
+
+def plain_templates():
+    """TEMPLATES with the stock loaders instead of the whitespace-stripping ones."""
+    templates = copy.deepcopy(settings.TEMPLATES)
+    for engine in templates:
+        for index, (loader, children) in enumerate(engine["OPTIONS"].get("loaders", [])):
+            engine["OPTIONS"]["loaders"][index] = (loader, [PLAIN_LOADERS.get(child, child) for child in children])
+    return templates
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare HTML size, render time and gzip/brotli size and CPU time of the home and "
+        "admission_process pages, rendered with the stock and the whitespace-stripping loaders."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=20, help="Runs per measure; medians are reported.")
+        parser.add_argument("--page", action="append", help="URL name to measure (repeatable, default: home and both admission_process pages).")
+
+    def handle(self, *args, **options):
+        repeat = max(options["repeat"], 1)
+        quality = getattr(settings, "RESPONSE_COMPRESSION", {}).get("BROTLI_QUALITY", 5)
+        if brotli is None:
+            self.stderr.write("brotli is not installed: only gzip is measured.")
+
+        self.stdout.write(
+            f"{'page':<30}{'loader':>10}{'HTML KB':>9}{'render ms':>11}"
+            f"{'gzip KB':>9}{'gzip ms':>9}{'br KB':>8}{'br ms':>8}"
+        )
+        for name in options["page"] or PAGES:
+            url = reverse(name)
+            for label, templates in (("stock", plain_templates()), ("stripped", settings.TEMPLATES)):
+                with override_settings(TEMPLATES=templates, ALLOWED_HOSTS=["*"], PAGE_CACHE_ENABLED=False, PRERENDERED_PAGES_ENABLED=False):
+                    html, render_ms = self.render(url, repeat)
+                gzip_bytes, gzip_ms = self.measure(lambda: compress_string(html, max_random_bytes=0), repeat)
+                if brotli is not None:
+                    br_bytes, br_ms = self.measure(lambda: brotli.compress(html, mode=brotli.MODE_TEXT, quality=quality), repeat)
+                    br = f"{br_bytes / 1024:>8.1f}{br_ms:>8.2f}"
+                else:
+                    br = f"{'-':>8}{'-':>8}"
+                self.stdout.write(
+                    f"{name:<30}{label:>10}{len(html) / 1024:>9.1f}{render_ms:>11.2f}"
+                    f"{gzip_bytes / 1024:>9.1f}{gzip_ms:>9.2f}{br}"
+                )
+
+    @staticmethod
+    def render(url, repeat):
+        client = Client()
+        response = client.get(url)  # warm-up: compiles and caches the templates
+        if response.status_code != 200:
+            raise CommandError(f"GET {url} returned {response.status_code}.")
+        timings = []
+        for _ in range(repeat):
+            started = time.process_time()
+            response = client.get(url, HTTP_ACCEPT_ENCODING="identity")
+            timings.append((time.process_time() - started) * 1000)
+        return response.content, statistics.median(timings)
+
+    @staticmethod
+    def measure(compress, repeat):
+        """Compressed size and median CPU milliseconds of compress()."""
+        timings = []
+        for _ in range(repeat):
+            started = time.process_time()
+            compressed = compress()
+            timings.append((time.process_time() - started) * 1000)
+        return len(compressed), statistics.median(timings)
@@ -0,0 +1,57 @@
+import statistics
+import time
+
+from django.contrib.auth.hashers import get_hasher, get_hashers
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Measure password hash and verify cost for each configured hasher on this machine."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rounds", type=int, default=5, help="Timed runs per hasher (median is reported).")
+        parser.add_argument(
+            "--algorithm",
+            action="append",
+            dest="algorithms",
+            help="Only benchmark this algorithm (e.g. pbkdf2_sha256, argon2). Repeatable.",
+        )
+
+    def handle(self, *args, **options):
+        rounds = max(options["rounds"], 1)
+        algorithms = options["algorithms"]
+        preferred = get_hasher("default").algorithm
+        password = "correct horse battery staple"
+
+        self.stdout.write(f"{'algorithm':<24}{'hash ms':>10}{'verify ms':>11}{'logins/s/core':>15}  params")
+        for hasher in get_hashers():
+            if algorithms and hasher.algorithm not in algorithms:
+                continue
+            try:
+                encoded = hasher.encode(password, hasher.salt())
+            except ValueError as e:
+                # Optional backends (argon2-cffi, bcrypt) that are not installed
+                self.stdout.write(f"{hasher.algorithm:<24}{'-':>10}{'-':>11}{'-':>15}  unavailable: {e}")
+                continue
+
+            hash_times, verify_times = [], []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                encoded = hasher.encode(password, hasher.salt())
+                hash_times.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                hasher.verify(password, encoded)
+                verify_times.append(time.perf_counter() - start)
+
+            hash_ms = statistics.median(hash_times) * 1000
+            verify_ms = statistics.median(verify_times) * 1000
+            params = {k: v for k, v in hasher.decode(encoded).items() if k not in ("algorithm", "hash", "salt")}
+            marker = " (default)" if hasher.algorithm == preferred else ""
+            self.stdout.write(
+                f"{hasher.algorithm:<24}{hash_ms:>10.1f}{verify_ms:>11.1f}{1000 / verify_ms:>15.1f}  {params}{marker}"
+            )
+
+        self.stdout.write(
+            "logins/s/core is the login rate one sync gunicorn worker can sustain. Move a hasher first in "
+            "PASSWORD_HASHERS to adopt it; existing users are rehashed in the background on their next login."
+        )
@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure anonymous requests per second on a page through the full middleware "
+        "stack, with the full-page cache disabled and then enabled."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/new-admission/", help="Page to request (default: the home page).")
+        parser.add_argument("--requests", type=int, default=500, help="Requests per run.")
+        parser.add_argument("--language", default="fr", help="Accept-Language sent with every request.")
+
+    def handle(self, *args, **options):
+        path, count = options["path"], options["requests"]
+        headers = {"HTTP_ACCEPT_LANGUAGE": options["language"]}
+
+        results = {}
+        for label, enabled in (("uncached", False), ("cached", True)):
+            with override_settings(PAGE_CACHE_ENABLED=enabled, ALLOWED_HOSTS=["*"]):
+                client = Client()
+                response = client.get(path, **headers)  # warm-up: fills the page and template caches
+                if response.status_code != 200:
+                    raise CommandError(f"GET {path} returned {response.status_code}.")
+                start = time.perf_counter()
+                for _ in range(count):
+                    client.get(path, **headers)
+                elapsed = time.perf_counter() - start
+            results[label] = count / elapsed
+            self.stdout.write(f"{label:<10}{count / elapsed:>10,.0f} req/s{elapsed / count * 1000:>10.2f} ms/req")
+
+        self.stdout.write(f"speed-up   {results['cached'] / results['uncached']:>10.1f}x")
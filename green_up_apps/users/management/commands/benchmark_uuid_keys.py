@@ -0,0 +1,57 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from green_up_apps.global_data.identifiers import uuid7
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare uuid4 and uuid7 primary keys on PostgreSQL: insert throughput "
+        "and primary-key index size, using temporary tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=3_000_000, help="Rows inserted per key type.")
+        parser.add_argument("--batch-size", type=int, default=10_000, help="Rows per INSERT statement.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("This benchmark needs PostgreSQL (index sizes come from pg_relation_size).")
+
+        rows, batch_size = options["rows"], options["batch_size"]
+        self.stdout.write(f"Inserting {rows:,} rows per key type in batches of {batch_size:,}...")
+        self.stdout.write(f"{'key':<8}{'seconds':>10}{'rows/s':>12}{'index MB':>11}{'table MB':>11}{'index/row B':>13}")
+
+        for label, generate in (("uuid4", uuid.uuid4), ("uuid7", uuid7)):
+            table = f"bench_pk_{label}"
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+                # Same shape as a GreenUpBaseModel row header: uuid key plus a small payload
+                cursor.execute(f"CREATE TEMPORARY TABLE {table} (id uuid PRIMARY KEY, created timestamptz NOT NULL DEFAULT now(), payload text)")
+
+                start = time.perf_counter()
+                inserted = 0
+                while inserted < rows:
+                    count = min(batch_size, rows - inserted)
+                    keys = [str(generate()) for _ in range(count)]
+                    cursor.execute(
+                        f"INSERT INTO {table} (id, payload) SELECT k, 'x' FROM unnest(%s::uuid[]) AS k",
+                        [keys],
+                    )
+                    inserted += count
+                elapsed = time.perf_counter() - start
+
+                cursor.execute(
+                    "SELECT pg_relation_size(%s), pg_relation_size(%s)",
+                    [f"{table}_pkey", table],
+                )
+                index_bytes, table_bytes = cursor.fetchone()
+                cursor.execute(f"DROP TABLE {table}")
+
+            self.stdout.write(
+                f"{label:<8}{elapsed:>10.1f}{rows / elapsed:>12,.0f}"
+                f"{index_bytes / 2**20:>11.1f}{table_bytes / 2**20:>11.1f}{index_bytes / rows:>13.1f}"
+            )
@@ -0,0 +1,76 @@
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand
+
+from green_up_apps.global_data.responsive_images import build_responsive_images
+
+IMAGE_REFERENCE = re.compile(r"""{%\s*(static|responsive_image)\s+["']/?([^"']+\.(?:jpe?g|png))["']""", re.IGNORECASE)
+TEMPLATE_REFERENCE = re.compile(r"""{%\s*(?:include|extends)\s+["']([^"']+)["']""")
+PAGES_DIR = "publics/home"
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the AVIF/WebP variants of the static images (collectstatic also does it) "
+        "and report the bytes saved per page."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--report", action="store_true", help="Only print the per-page report after building.")
+
+    def handle(self, *args, **options):
+        manifest = build_responsive_images()
+        if not options["report"]:
+            for path, entry in sorted(manifest.items()):
+                best = min(entry["variants"], key=lambda variant: (-variant["width"], variant["bytes"]))
+                self.stdout.write(
+                    f"{path:<45}{entry['bytes'] / 1024:>9,.0f} KB -> {best['bytes'] / 1024:>7,.0f} KB "
+                    f"({best['format']} {best['width']}w, {len(entry['variants'])} variants)"
+                )
+
+        self.stdout.write(f"\n{'page':<60}{'images':>7}{'original KB':>13}{'served KB':>11}{'saved':>8}")
+        for page, images in self.page_images().items():
+            original = served = 0
+            for tag, image in images:
+                entry = manifest.get(image)
+                source = finders.find(image)
+                size = entry["bytes"] if entry else (Path(source).stat().st_size if source else 0)
+                original += size
+                if tag == "responsive_image" and entry:
+                    # Desktop worst case: the widest variant, in its smallest format
+                    widest = max(variant["width"] for variant in entry["variants"])
+                    size = min(variant["bytes"] for variant in entry["variants"] if variant["width"] == widest)
+                served += size
+            saved = f"{1 - served / original:.0%}" if original else "-"
+            self.stdout.write(f"{page:<60}{len(images):>7}{original / 1024:>13,.0f}{served / 1024:>11,.0f}{saved:>8}")
+
+    def page_images(self) -> dict[str, set[tuple[str, str]]]:
+        """(tag, image) pairs referenced by each page template, following {% include %} and {% extends %}."""
+        roots = [Path(directory) for directory in settings.TEMPLATES[0]["DIRS"]]
+
+        def read(name):
+            for root in roots:
+                if (root / name).is_file():
+                    return (root / name).read_text(encoding="utf-8")
+            return ""
+
+        def images(name, seen):
+            if name in seen:
+                return set()
+            seen.add(name)
+            source = read(name)
+            found = set(IMAGE_REFERENCE.findall(source))
+            for child in TEMPLATE_REFERENCE.findall(source):
+                found |= images(child, seen)
+            return found
+
+        pages = {}
+        for root in roots:
+            for file in sorted((root / PAGES_DIR).rglob("*.html")):
+                name = file.relative_to(root).as_posix()
+                if not file.name.startswith("_") and "/base" not in name:
+                    pages[name] = images(name, set())
+        return pages
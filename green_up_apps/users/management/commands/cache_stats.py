@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from green_up_apps.global_data.cache import STATS_KEY, cache_stats, flush_stats
+from green_up_apps.global_data.redis_client import get_redis
+
+
+class Command(BaseCommand):
+    help = "Show shared cache hit/miss counters per namespace (aggregated over every process)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Clear the counters after printing them.")
+
+    def handle(self, *args, **options):
+        flush_stats()
+        stats = cache_stats()
+        if not stats:
+            self.stdout.write("No cache activity recorded yet.")
+        self.stdout.write(f"{'namespace':<16}{'hit':>10}{'miss':>10}{'early':>10}{'wait':>10}{'hit rate':>10}")
+        for namespace, counts in sorted(stats.items()):
+            hits = counts.get("hit", 0) + counts.get("wait", 0)
+            total = hits + counts.get("miss", 0) + counts.get("early", 0)
+            rate = f"{hits / total:.1%}" if total else "-"
+            self.stdout.write(
+                f"{namespace:<16}{counts.get('hit', 0):>10}{counts.get('miss', 0):>10}"
+                f"{counts.get('early', 0):>10}{counts.get('wait', 0):>10}{rate:>10}"
+            )
+        if options["reset"]:
+            get_redis().delete(STATS_KEY)
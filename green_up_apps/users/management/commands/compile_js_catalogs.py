@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from django.utils import translation
+from django.views.i18n import JavaScriptCatalog
+
+# Written into the app static dir so collectstatic hashes and compresses them
+CATALOG_DIR = Path(settings.BASE_DIR) / "green_up_apps" / "static" / "jsi18n"
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the JavaScript translation catalog of every language to static/jsi18n/<lang>/djangojs.js. "
+        "Run before collectstatic; {% js_catalog %} then serves them as hashed static files."
+    )
+
+    def handle(self, *args, **options):
+        view = JavaScriptCatalog.as_view()
+        request = RequestFactory().get("/jsi18n/")
+        for code, _name in settings.LANGUAGES:
+            with translation.override(code):
+                response = view(request)
+            path = CATALOG_DIR / code / "djangojs.js"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(response.content)
+            self.stdout.write(f"{code}: {path.relative_to(settings.BASE_DIR)} ({len(response.content):,} bytes)")
@@ -0,0 +1,61 @@
+import hashlib
+import json
+import shutil
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.urls import URLPattern, get_resolver, reverse
+
+from green_up_apps.global_data.prerender import MANIFEST_NAME, PrerenderedPageMixin, load_manifest, prerender_root
+
+NAMESPACES = ("apropos",)
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the à-propos pages for every language into content-hashed HTML "
+        "files (PRERENDER_ROOT), served as-is to anonymous visitors by PrerenderedPageMixin."
+    )
+
+    def handle(self, *args, **options):
+        root = prerender_root()
+        build = root.with_name(f"{root.name}.tmp")
+        shutil.rmtree(build, ignore_errors=True)
+        build.mkdir(parents=True)
+
+        pages = {}
+        # Pages show the data as of now: a later change to it stops them being served
+        built_at = time.time()
+        with override_settings(ALLOWED_HOSTS=["*"], PRERENDERED_PAGES_ENABLED=False, PAGE_CACHE_ENABLED=False):
+            for view_name, url in self.prerendered_urls():
+                for language, _name in settings.LANGUAGES:
+                    # A fresh anonymous client per page: no session, no CSRF cookie
+                    response = Client().get(url, HTTP_ACCEPT_LANGUAGE=language)
+                    if response.status_code != 200 or response.cookies:
+                        raise CommandError(f"{url} ({language}) cannot be pre-rendered: status {response.status_code}, cookies {list(response.cookies)}")
+                    digest = hashlib.sha256(response.content).hexdigest()[:12]
+                    name = f"{language}/{view_name.replace(':', '-')}.{digest}.html"
+                    (build / name).parent.mkdir(parents=True, exist_ok=True)
+                    (build / name).write_bytes(response.content)
+                    pages.setdefault(view_name, {})[language] = name
+                    self.stdout.write(f"{url:<32}{language:>4}  {name} ({len(response.content):,} bytes)")
+
+        manifest = {"release": settings.RELEASE_VERSION, "built_at": built_at, "pages": pages}
+        (build / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        # Swap the whole directory so workers never read a half-written site (missing files fall back to rendering)
+        shutil.rmtree(root, ignore_errors=True)
+        build.rename(root)
+        load_manifest.cache_clear()
+        self.stdout.write(self.style.SUCCESS(f"{sum(len(languages) for languages in pages.values())} pages written to {root}"))
+
+    def prerendered_urls(self):
+        resolver = get_resolver()
+        for namespace in NAMESPACES:
+            _prefix, sub_resolver = resolver.namespace_dict[namespace]
+            for pattern in sub_resolver.url_patterns:
+                view_class = getattr(pattern.callback, "view_class", None) if isinstance(pattern, URLPattern) else None
+                if view_class and issubclass(view_class, PrerenderedPageMixin) and not pattern.pattern.converters:
+                    view_name = f"{namespace}:{pattern.name}"
+                    yield view_name, reverse(view_name)
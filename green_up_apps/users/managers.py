@@ -1,13 +1,69 @@
 from typing import TYPE_CHECKING
 
+from django.conf import settings
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import UserManager as DjangoUserManager
+from django.core.cache import caches
+from django.db import models
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django_extensions.db.models import ActivatorQuerySet
+
+from green_up_apps.global_data.cache import AppCache
+from green_up_apps.global_data.metadata import MetadataQuerySet
 
 if TYPE_CHECKING:
     from .models import User  # noqa: F401
 
+# Admin recipients are read on every admission notification; the list is
+# cached and dropped by the User signals in users/signals.py.
+users_cache = AppCache("users")
+ADMIN_EMAILS_CACHE_KEY = "admin_emails"
+ADMIN_EMAILS_CACHE_TIMEOUT = 60 * 60
+
+# Authenticated users are served from a snapshot kept next to the sessions.
+# Bump the version whenever User fields change so stale pickles are ignored.
+USER_SNAPSHOT_CACHE_ALIAS = "sessions"
+USER_SNAPSHOT_CACHE_KEY = "users:snapshot:{user_id}"
+USER_SNAPSHOT_VERSION = 1
+
+
+class SoftDeleteQuerySet(ActivatorQuerySet, MetadataQuerySet):
+    """
+    QuerySet with bulk soft-delete/restore for GreenUpBaseModel subclasses.
+    Keeps ActivatorModel's active()/inactive() filters and adds metadata updates.
+    """
+
+    def alive(self):
+        return self.filter(is_deleted=False)
+
+    def deleted(self):
+        return self.filter(is_deleted=True)
+
+    def soft_delete(self) -> int:
+        """Flag every row as deleted in one UPDATE; returns the number of rows."""
+        return self.update(is_deleted=True, modified=timezone.now())
+
+    def restore(self) -> int:
+        """
+        Clear the deleted flag in one UPDATE; use through all_objects to reach deleted rows.
+        Unique constraints only cover live rows, so this fails if a live row took a restored row's value.
+        """
+        return self.update(is_deleted=False, modified=timezone.now())
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """Default manager: soft-deleted rows are excluded from every query."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
 
-class UserManager(DjangoUserManager["User"]):
+class AllObjectsManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """Escape hatch including soft-deleted rows (restores, audits, uniqueness checks)."""
+
+
+class UserManager(DjangoUserManager.from_queryset(MetadataQuerySet)):
     """Custom manager for the User model."""
 
     def _create_user(self, email: str, password: str | None, **extra_fields):
@@ -26,6 +82,26 @@ class UserManager(DjangoUserManager["User"]):
         return user
 
 
+    @staticmethod
+    def normalize_lookup_email(email: str | None) -> str:
+        """Lookup form of an email: emails are unique regardless of case."""
+        return (email or "").strip().lower()
+
+    def filter_by_email(self, email: str | None):
+        """
+        Case-insensitive email lookup. Filters on LOWER(email) so the query is
+        served by the users_user_email_lower_uniq functional index.
+        """
+        return self.alias(email_lower=Lower("email")).filter(email_lower=self.normalize_lookup_email(email))
+
+    def get_by_email(self, email: str | None):
+        """Return the user with this email in any case; raises DoesNotExist like get()."""
+        return self.filter_by_email(email).get()
+
+    def get_by_natural_key(self, username):
+        # Used by authenticate(): logins match the email regardless of case
+        return self.get_by_email(username)
+
     def create_user(self, email: str, password: str | None = None, **extra_fields):  # type: ignore[override]
         extra_fields.setdefault("is_staff", False)
         extra_fields.setdefault("is_superuser", False)
@@ -43,3 +119,45 @@ class UserManager(DjangoUserManager["User"]):
             raise ValueError(msg)
 
         return self._create_user(email, password, **extra_fields)
+
+    def get_admin_emails(self, notification_mode: str | None = None) -> list[str]:
+        """
+        Return the emails of active admins, served from the shared cache when possible.
+        :param notification_mode: Restrict to admins using this AdminNotificationModeChoices value.
+        """
+        def load_emails_by_mode():
+            emails_by_mode = {}
+            admins = self.filter(is_admin=True, is_active=True).values_list("email", "admin_notification_mode")
+            for email, mode in admins:
+                emails_by_mode.setdefault(mode, []).append(email)
+            return emails_by_mode
+
+        emails_by_mode = users_cache.get_or_compute(ADMIN_EMAILS_CACHE_KEY, load_emails_by_mode, ADMIN_EMAILS_CACHE_TIMEOUT)
+        if notification_mode is not None:
+            return list(emails_by_mode.get(notification_mode, []))
+        return [email for emails in emails_by_mode.values() for email in emails]
+
+    @staticmethod
+    def invalidate_admin_emails() -> None:
+        users_cache.delete(ADMIN_EMAILS_CACHE_KEY)
+
+    def get_cached(self, user_id):
+        """
+        Return the user with this pk from its cached snapshot, loading and
+        caching it on a miss. Raises DoesNotExist like get().
+        """
+        snapshot_cache = caches[USER_SNAPSHOT_CACHE_ALIAS]
+        key = USER_SNAPSHOT_CACHE_KEY.format(user_id=user_id)
+        user = snapshot_cache.get(key, version=USER_SNAPSHOT_VERSION)
+        if user is None:
+            user = self.get(pk=user_id)
+            snapshot_cache.set(
+                key, user, getattr(settings, "USER_SNAPSHOT_TIMEOUT", 60 * 15), version=USER_SNAPSHOT_VERSION
+            )
+        return user
+
+    @staticmethod
+    def invalidate_cached(user_id) -> None:
+        caches[USER_SNAPSHOT_CACHE_ALIAS].delete(
+            USER_SNAPSHOT_CACHE_KEY.format(user_id=user_id), version=USER_SNAPSHOT_VERSION
+        )
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='admin_notification_mode',
+            field=models.CharField(choices=[('per_event', 'One email per event'), ('digest', 'Periodic digest')], default='per_event', help_text='How an admin receives new application notifications: one email per event or a periodic digest.', max_length=20, verbose_name='admin notification mode'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:39
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def report_email_case_collisions(apps, schema_editor):
+    """
+    List accounts whose emails differ only in case. They cannot be merged
+    automatically (each may own applications), so stop before the unique
+    index is created and let an operator resolve them.
+    """
+    User = apps.get_model('users', 'User')
+    collisions = (
+        User.objects.annotate(email_lower=Lower('email'))
+        .values('email_lower')
+        .annotate(total=Count('id'))
+        .filter(total__gt=1)
+        .values_list('email_lower', flat=True)
+    )
+    report = []
+    for email_lower in collisions:
+        accounts = User.objects.annotate(email_lower=Lower('email')).filter(email_lower=email_lower)
+        details = ", ".join(
+            f"{account.email} (id={account.id}, active={account.is_active}, joined={account.date_joined:%Y-%m-%d})"
+            for account in accounts.order_by('date_joined')
+        )
+        report.append(f"  {email_lower}: {details}")
+
+    if report:
+        raise RuntimeError(
+            f"{len(report)} email(s) are used by several accounts differing only in case. "
+            "Merge or rename them, then run migrate again:\n" + "\n".join(report)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_admin_notification_mode'),
+    ]
+
+    operations = [
+        migrations.RunPython(report_email_case_collisions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='users_user_email_lower_uniq', violation_error_message='A user with that email already exists.'),
+        ),
+    ]
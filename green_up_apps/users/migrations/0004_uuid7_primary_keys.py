@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:44
+
+import green_up_apps.global_data.identifiers
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_email_lower_uniq'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='companysettings',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='contactus',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='partners',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='profile',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='id',
+            field=models.UUIDField(default=green_up_apps.global_data.identifiers.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactus',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['-created'], name='contact_created_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactus',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_read', '-created'], name='contact_unread_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='partners',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_active', 'name'], name='partner_active_live_idx'),
+        ),
+    ]
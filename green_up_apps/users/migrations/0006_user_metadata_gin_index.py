@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:49
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0005_live_row_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['metadata'], name='user_metadata_gin_idx'),
+        ),
+    ]
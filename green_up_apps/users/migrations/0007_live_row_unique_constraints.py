@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_user_metadata_gin_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='partners',
+            name='name',
+            field=models.CharField(help_text='Name of the partner organization.', max_length=255, verbose_name='Name'),
+        ),
+        migrations.AlterField(
+            model_name='partners',
+            name='slug',
+            field=models.SlugField(blank=True, help_text='URL-friendly identifier for the partner.', max_length=255, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='partners',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('name',), name='partner_name_live_uniq', violation_error_message='A partner with this name already exists.'),
+        ),
+        migrations.AddConstraint(
+            model_name='partners',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('slug',), name='partner_slug_live_uniq', violation_error_message='A partner with this slug already exists.'),
+        ),
+    ]
@@ -1,23 +1,31 @@
 import uuid
+from django.contrib.auth.hashers import check_password
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from django_extensions.db.models import TimeStampedModel, ActivatorModel
 from phonenumber_field.modelfields import PhoneNumberField
 
-from .managers import UserManager
+from green_up_apps.global_data.enums import AdminNotificationModeChoices
+from green_up_apps.global_data.identifiers import uuid7
+from green_up_apps.global_data.local_cache import LocalLRUCache
+from green_up_apps.global_data.metadata import MetadataKey
+from .managers import AllObjectsManager, SoftDeleteManager, UserManager
 
 
 class GreenUpBaseModel(TimeStampedModel, ActivatorModel):
     """
     Name: GreenUpBaseModel
     Description: Abstract base model providing a UUID primary key, soft deletion, and metadata for all models.
+                 Primary keys are time-ordered UUIDv7 so inserts stay at the end of the index.
     Author: ayemeleelgol@gmail.com
     """
     id = models.UUIDField(
-        default=uuid.uuid4,
+        default=uuid7,
         null=False,
         blank=False,
         unique=True,
@@ -36,9 +44,30 @@ class GreenUpBaseModel(TimeStampedModel, ActivatorModel):
         blank=True,
         help_text=_("IP address associated with the record creation or update.")
     )
+
+    objects = SoftDeleteManager()
+    all_objects = AllObjectsManager()
+
     class Meta:
         abstract = True
 
+    def set_metadata(self, **values):
+        """Persist metadata keys with a partial JSON update and mirror them on this instance."""
+        type(self).all_objects.filter(pk=self.pk).set_metadata(**values)
+        if self.metadata is None:
+            self.metadata = {}
+        self.metadata.update(values)
+
+    def soft_delete(self):
+        """Flag this row as deleted; it disappears from objects but stays in all_objects."""
+        self.is_deleted = True
+        self.save(update_fields=["is_deleted", "modified"])
+
+    def restore(self):
+        """Bring the row back; raises IntegrityError if a live row took one of its unique values meanwhile."""
+        self.is_deleted = False
+        self.save(update_fields=["is_deleted", "modified"])
+
 
 class User(GreenUpBaseModel, PermissionsMixin, AbstractBaseUser):
     """
@@ -81,6 +110,13 @@ class User(GreenUpBaseModel, PermissionsMixin, AbstractBaseUser):
         default=False, 
         help_text=_("User is an admin.")
     )
+    admin_notification_mode = models.CharField(
+        _("admin notification mode"),
+        max_length=20,
+        choices=AdminNotificationModeChoices.choices,
+        default=AdminNotificationModeChoices.PER_EVENT,
+        help_text=_("How an admin receives new application notifications: one email per event or a periodic digest.")
+    )
     is_manually_deleted = models.BooleanField(
         _("is manually deleted"),
         default=False,
@@ -104,6 +140,13 @@ class User(GreenUpBaseModel, PermissionsMixin, AbstractBaseUser):
     )
 
 
+    # Typed metadata keys (see global_data/metadata.py)
+    session_auth = MetadataKey(
+        dict,
+        default=dict,
+        help_text="Session auth hash kept across background password rehashes (users/password_upgrade.py).",
+    )
+
     # Authentication settings
     username = None
     EMAIL_FIELD = "email"
@@ -115,11 +158,43 @@ class User(GreenUpBaseModel, PermissionsMixin, AbstractBaseUser):
     class Meta:
         verbose_name = _("User")
         verbose_name_plural = _("Users")
+        constraints = [
+            models.UniqueConstraint(
+                Lower("email"),
+                name="users_user_email_lower_uniq",
+                violation_error_message=_("A user with that email already exists."),
+            ),
+        ]
+        indexes = [
+            # Backs metadata__has_key / has_any_keys / contains filters
+            GinIndex(fields=['metadata'], name='user_metadata_gin_idx'),
+        ]
 
     def has_perm(self, perm, obj=None):
         """Check if the user has a specific permission."""
         return True  # Simplified for superusers; adjust based on your needs
 
+    def check_password(self, raw_password):
+        """
+        Check the password without Django's inline rehash: outdated hashes are
+        upgraded in a background thread so logins don't pay the new hasher's cost.
+        """
+        from green_up_apps.users.password_upgrade import schedule_password_upgrade
+
+        return check_password(raw_password, self.password, lambda raw: schedule_password_upgrade(self, raw))
+
+    def get_session_auth_hash(self):
+        """
+        Keep sessions alive across background rehashes: the pre-upgrade hash is
+        returned while the password is still the upgraded one, and ignored as
+        soon as the password really changes.
+        """
+        session_hash = self._get_session_auth_hash()
+        session_auth = self.session_auth
+        if session_auth.get("password") == session_hash:
+            return session_auth.get("session", session_hash)
+        return session_hash
+
     def clean(self):
         """Normalize email before saving."""
         super().clean()
@@ -187,12 +262,10 @@ class Partners(GreenUpBaseModel):
     name = models.CharField(
         _("Name"),
         max_length=255,
-        unique=True,
         help_text=_("Name of the partner organization.")
     )
     slug = models.SlugField(
         max_length=255,
-        unique=True,
         null=True,
         blank=True,
         help_text=_("URL-friendly identifier for the partner.")
@@ -225,9 +298,21 @@ class Partners(GreenUpBaseModel):
     class Meta:
         verbose_name = _('Partner')
         verbose_name_plural = _('Partners')
+        # Unique among live rows only, like the default manager that validate_unique() uses
+        constraints = [
+            models.UniqueConstraint(
+                fields=['name'], condition=models.Q(is_deleted=False), name='partner_name_live_uniq',
+                violation_error_message=_("A partner with this name already exists."),
+            ),
+            models.UniqueConstraint(
+                fields=['slug'], condition=models.Q(is_deleted=False), name='partner_slug_live_uniq',
+                violation_error_message=_("A partner with this slug already exists."),
+            ),
+        ]
         indexes = [
             models.Index(fields=['slug']),
             models.Index(fields=['is_deleted']),
+            models.Index(fields=['is_active', 'name'], name='partner_active_live_idx', condition=models.Q(is_deleted=False)),
         ]
 
     def save(self, *args, **kwargs):
@@ -290,6 +375,8 @@ class ContactUs(GreenUpBaseModel):
             models.Index(fields=['email']),
             models.Index(fields=['is_deleted']),
             models.Index(fields=['created']),
+            models.Index(fields=['-created'], name='contact_created_live_idx', condition=models.Q(is_deleted=False)),
+            models.Index(fields=['is_read', '-created'], name='contact_unread_live_idx', condition=models.Q(is_deleted=False)),
         ]
         ordering = ['-created']
 
@@ -297,6 +384,10 @@ class ContactUs(GreenUpBaseModel):
         return f"{self.subject} - {self.email}"
 
 
+COMPANY_SETTINGS_CACHE_NAMESPACE = "users.company_settings"
+company_settings_cache = LocalLRUCache(COMPANY_SETTINGS_CACHE_NAMESPACE, maxsize=4, ttl=900)
+
+
 class CompanySettings(GreenUpBaseModel):
     """
     Company-wide configuration settings
@@ -447,8 +538,8 @@ class CompanySettings(GreenUpBaseModel):
 
     @classmethod
     def get_active(cls):
-        """Get the active configuration"""
-        return cls.objects.filter(is_active=True).first()
+        """Get the active configuration (cached per process, evicted by the invalidation bus)"""
+        return company_settings_cache.get_or_set("active", lambda: cls.objects.filter(is_active=True).first())
 
     @classmethod
     def get_solo(cls):
@@ -0,0 +1,93 @@
+import hashlib
+import hmac
+from enum import Enum
+
+from django.conf import settings
+from django.utils.crypto import constant_time_compare, get_random_string
+
+from green_up_apps.global_data.redis_client import get_redis
+
+
+class OTPResult(Enum):
+    VALID = "valid"
+    INVALID = "invalid"
+    EXPIRED = "expired"
+    LOCKED = "locked"
+
+
+# Atomically count an attempt on an existing code and return (attempts, digest).
+# Returns nil when the code has expired or was never issued, without recreating the key.
+_ATTEMPT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+return {attempts, redis.call('HGET', KEYS[1], 'digest')}
+"""
+
+
+class OTPStore:
+    """
+    Name: OTPStore
+    Description: One-time codes (2FA, password reset) kept in Redis with a native TTL,
+                 an atomic attempt counter and constant-time comparison.
+                 Only an HMAC of each code is stored, keyed by a hash of the email,
+                 so neither codes nor addresses appear in Redis in clear text.
+    Author: ayemeleelgol@gmail.com
+    """
+
+    def __init__(self, purpose: str, ttl: int | None = None, max_attempts: int | None = None, length: int = 6) -> None:
+        self.purpose = purpose
+        self.ttl = ttl or getattr(settings, "OTP_TTL_SECONDS", 600)
+        self.max_attempts = max_attempts or getattr(settings, "OTP_MAX_ATTEMPTS", 5)
+        self.length = length
+
+    def _digest(self, value: str) -> str:
+        return hmac.new(settings.SECRET_KEY.encode(), value.encode(), hashlib.sha256).hexdigest()
+
+    def _key(self, identifier: str, suffix: str = "code") -> str:
+        return f"otp:{self.purpose}:{suffix}:{self._digest(identifier.strip().lower())}"
+
+    def issue(self, identifier: str) -> str:
+        """Generate a new code for the identifier, replacing any previous one."""
+        code = get_random_string(self.length, allowed_chars="0123456789")
+        key = self._key(identifier)
+        pipe = get_redis().pipeline()
+        pipe.delete(key)
+        pipe.hset(key, mapping={"digest": self._digest(code), "attempts": 0})
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+        return code
+
+    def verify(self, identifier: str, code: str) -> OTPResult:
+        """Check a code; a valid code is consumed, too many attempts revoke it."""
+        key = self._key(identifier)
+        client = get_redis()
+        result = client.eval(_ATTEMPT_SCRIPT, 1, key)
+        if result is None:
+            return OTPResult.EXPIRED
+
+        attempts, digest = int(result[0]), result[1]
+        if attempts > self.max_attempts:
+            client.delete(key)
+            return OTPResult.LOCKED
+        if not code or not constant_time_compare(digest, self._digest(code)):
+            return OTPResult.INVALID
+
+        client.delete(key)
+        return OTPResult.VALID
+
+    def revoke(self, identifier: str) -> None:
+        get_redis().delete(self._key(identifier))
+
+    def mark_verified(self, identifier: str) -> None:
+        """Record that the identifier passed verification (e.g. before choosing a new password)."""
+        get_redis().set(self._key(identifier, "verified"), 1, ex=self.ttl)
+
+    def pop_verified(self, identifier: str) -> bool:
+        """Consume the verification mark; True if it was present."""
+        return bool(get_redis().delete(self._key(identifier, "verified")))
+
+
+two_factor_otp = OTPStore("2fa")
+password_reset_otp = OTPStore("reset")
@@ -0,0 +1,84 @@
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F
+
+from green_up_apps.global_data.metadata import JSONSet
+
+logger = logging.getLogger(__name__)
+
+# One rehash at a time per process, off the request thread. The raw password only
+# lives in this process's memory: it never goes through the broker.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="password-upgrade")
+
+
+def password_fingerprint(encoded: str) -> str:
+    """Short digest of a stored hash, used to detect concurrent password changes."""
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def needs_rehash(encoded: str) -> bool:
+    """True if the stored hash is not on the configured hasher or its current cost."""
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False
+    preferred = get_hasher("default")
+    return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+def upgrade_password_hash(user_id: str, raw_password: str, fingerprint: str) -> bool:
+    """
+    Rehash a password to the configured hasher after a successful login.
+    The update only applies if the stored hash is still the one seen at login,
+    and the user's sessions stay valid across the rehash.
+    """
+    from green_up_apps.users.models import User
+
+    user = User.objects.filter(id=user_id).only("id", "password", "metadata").first()
+    if not user or password_fingerprint(user.password) != fingerprint or not needs_rehash(user.password):
+        logger.info(f"Password upgrade for user {user_id} skipped: hash changed or already current")
+        return False
+    if not check_password(raw_password, user.password):
+        logger.warning(f"Password upgrade for user {user_id} skipped: password does not match")
+        return False
+
+    # Keep existing sessions valid: they were signed with the hash being replaced
+    encoded = make_password(raw_password)
+    session_auth = {
+        "session": user.get_session_auth_hash(),
+        "password": User(password=encoded)._get_session_auth_hash(),
+    }
+
+    updated = User.objects.filter(id=user_id, password=user.password).update(
+        password=encoded, metadata=JSONSet(F("metadata"), "session_auth", session_auth)
+    )
+    User.objects.invalidate_cached(user_id)
+    logger.info(f"Password hash for user {user_id} upgraded: {bool(updated)}")
+    return bool(updated)
+
+
+def _run_upgrade(user_id: str, raw_password: str, fingerprint: str) -> None:
+    close_old_connections()
+    try:
+        upgrade_password_hash(user_id, raw_password, fingerprint)
+    except Exception as e:
+        logger.error(f"Password upgrade for user {user_id} failed: {e}")
+    finally:
+        # The worker thread keeps no connection open between upgrades
+        connection.close()
+
+
+def schedule_password_upgrade(user, raw_password: str) -> None:
+    """
+    Rehash the user's password to the configured hasher in a background thread,
+    once the current transaction commits. Replaces Django's inline rehash in
+    check_password, which runs the new (slower) hasher before the login response.
+    """
+    if not user.pk or not needs_rehash(user.password):
+        return
+    user_id, fingerprint = str(user.pk), password_fingerprint(user.password)
+    transaction.on_commit(lambda: _executor.submit(_run_upgrade, user_id, raw_password, fingerprint))
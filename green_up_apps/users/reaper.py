@@ -0,0 +1,119 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# One-time code keys stored in User.metadata before codes moved to Redis (users/otp.py)
+STALE_METADATA_KEYS = ("two_factor_code", "two_factor_code_created_at", "reset_code", "reset_code_created_at")
+
+
+def _owned_data_filters():
+    """
+    Exists() filters for every row that would be deleted with (or block deleting)
+    a user, except its Profile. Users owning any such data are never reaped.
+    """
+    from green_up_apps.users.models import Profile, User
+
+    filters = []
+    for relation in User._meta.related_objects:
+        if relation.many_to_many or relation.related_model is Profile:
+            continue
+        if relation.on_delete in (models.CASCADE, models.PROTECT):
+            owned = relation.related_model._base_manager.filter(**{relation.field.name: OuterRef("pk")})
+            filters.append(Exists(owned))
+    return filters
+
+
+def unverified_users(grace: timedelta):
+    """Accounts that registered but never completed 2FA within the grace period."""
+    from green_up_apps.users.models import User
+
+    queryset = User.objects.filter(
+        is_active=False,
+        last_login__isnull=True,
+        is_staff=False,
+        is_superuser=False,
+        is_admin=False,
+        date_joined__lt=timezone.now() - grace,
+    )
+    for owned in _owned_data_filters():
+        queryset = queryset.exclude(owned)
+    return queryset
+
+
+def reap_unverified_users(grace: timedelta | None = None, batch_size: int | None = None, dry_run: bool = False) -> dict:
+    """
+    Delete unverified accounts (and their profiles) past the grace period.
+    Walks the candidates by primary key in batches; each batch is its own short
+    transaction that locks only its rows and skips rows locked by live requests.
+    """
+    from green_up_apps.users.models import Profile, User
+
+    grace = grace or timedelta(hours=getattr(settings, "UNVERIFIED_USER_GRACE_HOURS", 72))
+    batch_size = batch_size or getattr(settings, "USER_REAPER_BATCH_SIZE", 500)
+    report = {"users": 0, "profiles": 0, "batches": 0, "dry_run": dry_run}
+    last_id = None
+
+    while True:
+        candidates = unverified_users(grace).order_by("id")
+        if last_id is not None:
+            candidates = candidates.filter(id__gt=last_id)
+        batch = list(candidates.values_list("id", flat=True)[:batch_size])
+        if not batch:
+            break
+        last_id = batch[-1]
+        report["batches"] += 1
+
+        if dry_run:
+            report["users"] += len(batch)
+            report["profiles"] += Profile.all_objects.filter(user_id__in=batch).count()
+            continue
+
+        with transaction.atomic():
+            # Re-check under lock: a user may have verified since the batch was read
+            locked = list(
+                unverified_users(grace).filter(id__in=batch).select_for_update(skip_locked=True).values_list("id", flat=True)
+            )
+            profiles, _ = Profile.all_objects.filter(user_id__in=locked).delete()
+            users = User.objects.filter(id__in=locked).delete()[1].get(User._meta.label, 0)
+        report["profiles"] += profiles
+        report["users"] += users
+        logger.info(f"Reaper batch {report['batches']}: removed {users} unverified user(s), {profiles} profile(s)")
+
+    return report
+
+
+def strip_stale_codes(batch_size: int | None = None, dry_run: bool = False) -> dict:
+    """
+    Remove legacy one-time code keys from User.metadata in primary-key batches.
+    Each batch is a single partial JSON UPDATE, so other metadata keys written
+    concurrently are preserved.
+    """
+    from green_up_apps.users.models import User
+
+    batch_size = batch_size or getattr(settings, "USER_REAPER_BATCH_SIZE", 500)
+    report = {"users": 0, "batches": 0, "dry_run": dry_run}
+    last_id = None
+
+    while True:
+        candidates = User.objects.filter(metadata__has_any_keys=STALE_METADATA_KEYS).order_by("id")
+        if last_id is not None:
+            candidates = candidates.filter(id__gt=last_id)
+        batch = list(candidates.values_list("id", flat=True)[:batch_size])
+        if not batch:
+            break
+        last_id = batch[-1]
+        report["batches"] += 1
+        report["users"] += len(batch)
+
+        if not dry_run:
+            User.objects.filter(id__in=batch).remove_metadata(*STALE_METADATA_KEYS)
+            for user_id in batch:
+                User.objects.invalidate_cached(user_id)
+
+    return report
@@ -0,0 +1,35 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from green_up_apps.global_data.invalidation import publish_invalidation
+from .models import COMPANY_SETTINGS_CACHE_NAMESPACE, CompanySettings, User
+
+# Saves touching any of these fields can change the admin recipient list.
+ADMIN_RECIPIENT_FIELDS = {"email", "is_active", "is_admin", "admin_notification_mode"}
+
+
+@receiver(post_save, sender=User)
+def invalidate_admin_emails_on_save(sender, instance, update_fields=None, **kwargs):
+    """Drop the cached admin recipients when an admin-relevant field may have changed."""
+    if instance.is_admin or update_fields is None or ADMIN_RECIPIENT_FIELDS.intersection(update_fields):
+        User.objects.invalidate_admin_emails()
+
+
+@receiver(post_delete, sender=User)
+def invalidate_admin_emails_on_delete(sender, instance, **kwargs):
+    if instance.is_admin:
+        User.objects.invalidate_admin_emails()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_snapshot(sender, instance, **kwargs):
+    """Drop the cached session user so the next request reloads it."""
+    User.objects.invalidate_cached(instance.pk)
+
+
+@receiver(post_save, sender=CompanySettings)
+@receiver(post_delete, sender=CompanySettings)
+def invalidate_company_settings(sender, **kwargs):
+    """Drop the cached active configuration in every process."""
+    publish_invalidation(COMPANY_SETTINGS_CACHE_NAMESPACE)
@@ -0,0 +1,3 @@
+# green_up_apps/users/tasks/__init__.py
+from .auth_email_task import *
+from .maintenance import *
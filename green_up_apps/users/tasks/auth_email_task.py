@@ -0,0 +1,55 @@
+import logging
+from celery import shared_task
+from django.utils.translation import gettext as _
+from green_up_apps.global_data.email import EmailUtil
+
+logger = logging.getLogger(__name__)
+
+
+def _send_code_email(user_id: str, template: str, subject: str, code_key: str, code: str) -> bool:
+    """Render and send a one-time code email to the given user."""
+    from green_up_apps.users.models import User
+
+    user = User.objects.filter(id=user_id).only("id", "email", "first_name").first()
+    if not user:
+        logger.error(f"User {user_id} not found, code email '{template}' not sent")
+        return False
+
+    return EmailUtil(prod=True).send_email_with_template(
+        template=template,
+        context={"user": user, code_key: code, "site_name": "Green Up Academy"},
+        receivers=[user.email],
+        subject=subject,
+    )
+
+
+@shared_task(name="green_up_apps.users.tasks.auth_email_task.send_two_factor_code")
+def send_two_factor_code(user_id: str, code: str):
+    """
+    Task to send the registration 2FA code. Routed to the transactional queue.
+    """
+    sent = _send_code_email(
+        user_id,
+        template="publics/emails/two_factor_email.html",
+        subject=_("Your 2-Factor Authentication Code"),
+        code_key="two_factor_code",
+        code=code,
+    )
+    logger.info(f"2FA code email for user {user_id} sent: {sent}")
+    return sent
+
+
+@shared_task(name="green_up_apps.users.tasks.auth_email_task.send_password_reset_code")
+def send_password_reset_code(user_id: str, code: str):
+    """
+    Task to send a password reset code. Routed to the transactional queue.
+    """
+    sent = _send_code_email(
+        user_id,
+        template="publics/emails/password_reset_email.html",
+        subject=_("Your Password Reset Code"),
+        code_key="reset_code",
+        code=code,
+    )
+    logger.info(f"Password reset code email for user {user_id} sent: {sent}")
+    return sent
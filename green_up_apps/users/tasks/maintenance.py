@@ -0,0 +1,20 @@
+import logging
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="green_up_apps.users.tasks.maintenance.reap_unverified_users")
+def reap_unverified_users(dry_run: bool = False):
+    """
+    Periodic task (celery beat) removing registrations that never completed 2FA
+    and legacy one-time codes left in User.metadata. Returns what was removed.
+    """
+    from green_up_apps.users import reaper
+
+    report = {
+        "unverified_users": reaper.reap_unverified_users(dry_run=dry_run),
+        "stale_codes": reaper.strip_stale_codes(dry_run=dry_run),
+    }
+    logger.info(f"Unverified user reaper finished: {report}")
+    return report
@@ -0,0 +1,63 @@
+from functools import lru_cache
+
+from django import template
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.templatetags.static import static
+from django.urls import reverse
+from django.utils.html import format_html, format_html_join
+from django.utils.translation import get_language, get_supported_language_variant
+
+from green_up_apps.global_data.responsive_images import MIME_TYPES, load_manifest
+
+register = template.Library()
+
+
+@lru_cache(maxsize=None)
+def js_catalog_url(language: str) -> str:
+    """
+    URL of the precompiled catalog (compile_js_catalogs + collectstatic), or the
+    dynamic JavaScriptCatalog view when it was not built. Resolved once per process.
+    """
+    path = f"jsi18n/{language}/djangojs.js"
+    if finders.find(path) or staticfiles_storage.exists(path):
+        try:
+            return static(path)
+        except ValueError:
+            # Built after the last collectstatic: not in the manifest yet
+            pass
+    return reverse("javascript_catalog")
+
+
+@register.simple_tag
+def js_catalog():
+    """<script> tag loading the JavaScript translation catalog of the active language."""
+    language = get_supported_language_variant(get_language())
+    return format_html('<script src="{}"></script>', js_catalog_url(language))
+
+
+@register.simple_tag
+def responsive_image(path, alt="", sizes="100vw", loading="lazy", **attrs):
+    """
+    <picture> with AVIF/WebP srcsets built by ResponsiveImageFinder, falling back to
+    the original file. Pass loading="eager" for above-the-fold images; other
+    keyword arguments (class, fetchpriority, ...) go on the <img>.
+    The <picture> uses display:contents so existing CSS/JS targeting the <img> keeps working.
+    """
+    entry = load_manifest().get(path)
+    img_attrs = {"src": static(path), "alt": alt, "loading": loading, "decoding": "async", **attrs}
+    if entry is None:
+        return format_html("<img{}>", format_html_join("", ' {}="{}"', img_attrs.items()))
+
+    img_attrs.update(width=entry["width"], height=entry["height"])
+    sources = []
+    for fmt, mime_type in MIME_TYPES.items():
+        variants = [variant for variant in entry["variants"] if variant["format"] == fmt]
+        if variants:
+            srcset = ", ".join(f"{static(variant['path'])} {variant['width']}w" for variant in variants)
+            sources.append(format_html('<source type="{}" srcset="{}" sizes="{}">', mime_type, srcset, sizes))
+    return format_html(
+        '<picture style="display: contents">{}<img{}></picture>',
+        format_html_join("", "{}", ((source,) for source in sources)),
+        format_html_join("", ' {}="{}"', img_attrs.items()),
+    )
@@ -1,7 +1,8 @@
 from django.views.generic import TemplateView
 import logging
+from green_up_apps.global_data.page_cache import PageCacheMixin
 
 logger = logging.getLogger(__name__)
 
-class HomeView(TemplateView):
+class HomeView(PageCacheMixin, TemplateView):
     template_name = "publics/home/home.html"
\ No newline at end of file
@@ -9,9 +9,11 @@ from django.utils.translation import gettext_lazy as _
 from django.contrib import messages
 from django.urls import reverse
 
+from green_up_apps.global_data.throttling import ThrottleMixin
+
 logger = logging.getLogger(__name__)
 
-class LoginView(TemplateView):
+class LoginView(ThrottleMixin, TemplateView):
     """
     Name: LoginView
     Description: Handles user login via AJAX form submission.
@@ -20,6 +22,7 @@ class LoginView(TemplateView):
     Author: ayemeleelgol@gmail.com
     """
     template_name = 'publics/auth/login.html'
+    throttle_scope = 'login'
 
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         return render(request, self.template_name, {'error': None, 'email': ''})
@@ -58,7 +61,7 @@ class LoginView(TemplateView):
                 messages.error(request, error_message)
                 return render(request, self.template_name, fields)
 
-            login(request, user, backend='django.contrib.auth.backends.ModelBackend')
+            login(request, user, backend='green_up_apps.users.backends.CachedModelBackend')
             if remember_me != "on":
                 request.session.set_expiry(0)  # Session expires when browser closes
 
@@ -6,20 +6,18 @@ from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.views.generic import TemplateView
 from django.shortcuts import render, redirect
 from django.urls import reverse
-from django.utils import timezone
-from django.utils.crypto import get_random_string
-from django.template.loader import render_to_string
 from django.utils.translation import gettext_lazy as _
-from django.core.mail import EmailMessage, get_connection
 from django.db import transaction
 from django.contrib import messages
-from decouple import config
 
+from green_up_apps.global_data.throttling import ThrottleMixin
 from green_up_apps.users.models import User
+from green_up_apps.users.otp import OTPResult, password_reset_otp
+from green_up_apps.users.tasks.auth_email_task import send_password_reset_code
 
 logger = logging.getLogger(__name__)
 
-class PasswordResetRequestView(TemplateView):
+class PasswordResetRequestView(ThrottleMixin, TemplateView):
     """
     Name: PasswordResetRequestView
     Description: Handles password reset requests via AJAX.
@@ -28,6 +26,7 @@ class PasswordResetRequestView(TemplateView):
     Author: ayemeleelgol@gmail.com
     """
     template_name = 'publics/auth/password_reset_request.html'
+    throttle_scope = 'password_reset_request'
 
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         return render(request, self.template_name, {'error': None, 'email': ''})
@@ -53,7 +52,7 @@ class PasswordResetRequestView(TemplateView):
                 messages.error(request, error_message)
                 return render(request, self.template_name, fields)
 
-            user = User.objects.filter(email=email).first()
+            user = User.objects.filter_by_email(email).first()
             if not user:
                 error_message = _("No user found with this email.")
                 if is_ajax:
@@ -61,41 +60,11 @@ class PasswordResetRequestView(TemplateView):
                 messages.error(request, error_message)
                 return render(request, self.template_name, fields)
 
-            with transaction.atomic():
-                if not isinstance(user.metadata, dict):
-                    user.metadata = {}
-                reset_code = get_random_string(6, allowed_chars='0123456789')
-                user.metadata["reset_code"] = reset_code
-                user.metadata["reset_code_created_at"] = timezone.now().isoformat()
-                user.save()
+            # The reset code lives in Redis with a TTL; the user row is not written
+            reset_code = password_reset_otp.issue(email)
 
-                html_content = render_to_string(
-                    template_name="publics/emails/password_reset_email.html",
-                    context={
-                        "user": user,
-                        "reset_code": reset_code,
-                        "site_name": "Green Up Academy"
-                    }
-                )
-
-                email_message = EmailMessage(
-                    subject="Your Password Reset Code",
-                    body=html_content,
-                    from_email=f"Green Up Academy <{config('EMAIL_HOST_USER')}>",
-                    to=[email],
-                )
-                email_message.content_subtype = "html"
-
-                connection = get_connection(
-                    backend="django.core.mail.backends.smtp.EmailBackend",
-                    host="smtp.gmail.com",
-                    port=587,
-                    username=config('EMAIL_HOST_USER'),
-                    password=config('EMAIL_HOST_PASSWORD'),
-                    use_tls=True
-                )
-                email_message.connection = connection
-                email_message.send()
+            # Send the reset email from the transactional queue
+            send_password_reset_code.delay(str(user.id), reset_code)
 
             logger.info(f"✅ Password reset code sent to {email} (ID: {user.id})")
             success_message = _("Password reset code sent! Please check your email.")
@@ -118,7 +87,7 @@ class PasswordResetRequestView(TemplateView):
             return render(request, self.template_name, fields)
 
 
-class PasswordResetVerifyView(TemplateView):
+class PasswordResetVerifyView(ThrottleMixin, TemplateView):
     """
     Name: PasswordResetVerifyView
     Description: Handles verification of password reset code via AJAX.
@@ -126,6 +95,7 @@ class PasswordResetVerifyView(TemplateView):
     Author: ayemeleelgol@gmail.com
     """
     template_name = 'publics/auth/password_reset_verify.html'
+    throttle_scope = 'password_reset_verify'
 
     def get(self, request: HttpRequest, email: str, *args: Any, **kwargs: Any) -> HttpResponse:
         return render(request, self.template_name, {'email': email, 'error': None})
@@ -135,47 +105,24 @@ class PasswordResetVerifyView(TemplateView):
         is_ajax = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
 
         try:
-            user = User.objects.filter(email=email).first()
-            if not user:
-                error_message = _("No user found with this email.")
-                if is_ajax:
-                    return JsonResponse({'success': False, 'message': error_message})
-                messages.error(request, error_message)
-                return render(request, self.template_name, {'email': email})
-
-            if not isinstance(user.metadata, dict) or "reset_code" not in user.metadata:
-                error_message = _("Invalid or expired reset code. Please request a new one.")
+            # Codes are checked in Redis only; no users table access or write
+            result = password_reset_otp.verify(email, code)
+            if result != OTPResult.VALID:
+                error_messages = {
+                    OTPResult.EXPIRED: _("Reset code has expired. Please request a new one."),
+                    OTPResult.LOCKED: _("Too many invalid attempts. Please request a new code."),
+                    OTPResult.INVALID: _("Invalid reset code."),
+                }
+                error_message = error_messages[result]
                 if is_ajax:
                     return JsonResponse({'success': False, 'message': error_message})
                 messages.error(request, error_message)
                 return render(request, self.template_name, {'email': email})
 
-            stored_code = user.metadata.get("reset_code")
-            code_created_at = user.metadata.get("reset_code_created_at")
-            if not stored_code or not code_created_at:
-                error_message = _("Invalid or expired reset code. Please request a new one.")
-                if is_ajax:
-                    return JsonResponse({'success': False, 'message': error_message})
-                messages.error(request, error_message)
-                return render(request, self.template_name, {'email': email})
+            # Allow the next step (choosing a new password) for this email only
+            password_reset_otp.mark_verified(email)
 
-            from datetime import datetime
-            created_at = datetime.fromisoformat(code_created_at)
-            if (timezone.now() - created_at).total_seconds() > 600:
-                error_message = _("Reset code has expired. Please request a new one.")
-                if is_ajax:
-                    return JsonResponse({'success': False, 'message': error_message})
-                messages.error(request, error_message)
-                return render(request, self.template_name, {'email': email})
-
-            if code != stored_code:
-                error_message = _("Invalid reset code.")
-                if is_ajax:
-                    return JsonResponse({'success': False, 'message': error_message})
-                messages.error(request, error_message)
-                return render(request, self.template_name, {'email': email})
-
-            logger.info(f"✅ Password reset code verified for {email} (ID: {user.id})")
+            logger.info(f"✅ Password reset code verified for {email}")
             success_message = _("Code verified! Please set your new password.")
             if is_ajax:
                 return JsonResponse({
@@ -236,7 +183,7 @@ class PasswordResetView(TemplateView):
                 messages.error(request, error_message)
                 return render(request, self.template_name, {'email': email})
 
-            user = User.objects.filter(email=email).first()
+            user = User.objects.filter_by_email(email).first()
             if not user:
                 error_message = _("No user found with this email.")
                 if is_ajax:
@@ -244,13 +191,18 @@ class PasswordResetView(TemplateView):
                 messages.error(request, error_message)
                 return render(request, self.template_name, {'email': email})
 
+            if not password_reset_otp.pop_verified(email):
+                error_message = _("Invalid or expired reset code. Please request a new one.")
+                if is_ajax:
+                    return JsonResponse({'success': False, 'message': error_message})
+                messages.error(request, error_message)
+                return render(request, self.template_name, {'email': email})
+
             with transaction.atomic():
                 user.set_password(password)
-                user.metadata.pop("reset_code", None)
-                user.metadata.pop("reset_code_created_at", None)
                 user.save()
                 from django.contrib.auth import login
-                login(request, user, backend='django.contrib.auth.backends.ModelBackend')
+                login(request, user, backend='green_up_apps.users.backends.CachedModelBackend')
 
             logger.info(f"✅ Password reset successfully for {email} (ID: {user.id})")
             success_message = _("Password reset successful! You are now logged in.")
@@ -6,20 +6,18 @@ from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.views.generic import TemplateView
 from django.shortcuts import redirect, render
 from django.urls import reverse
-from django.utils import timezone
-from django.utils.crypto import get_random_string
-from django.template.loader import render_to_string
 from django.utils.translation import gettext_lazy as _
-from django.core.mail import EmailMessage, get_connection
 from django.db import transaction
 from django.contrib import messages
-from decouple import config
 
+from green_up_apps.global_data.throttling import ThrottleMixin
 from green_up_apps.users.models import User, Profile
+from green_up_apps.users.otp import OTPResult, two_factor_otp
+from green_up_apps.users.tasks.auth_email_task import send_two_factor_code
 
 logger = logging.getLogger(__name__)
 
-class RegisterView(TemplateView):
+class RegisterView(ThrottleMixin, TemplateView):
     """
     Name: RegisterView
     Description: Handles user registration via AJAX form submission.
@@ -29,6 +27,7 @@ class RegisterView(TemplateView):
     Author: ayemeleelgol@gmail.com
     """
     template_name = 'publics/auth/register.html'
+    throttle_scope = 'register'
 
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         return render(request, self.template_name, {'error': None})
@@ -90,7 +89,7 @@ class RegisterView(TemplateView):
                 messages.error(request, error_message)
                 return render(request, self.template_name, fields)
 
-            if User.objects.filter(email=email).exists():
+            if User.objects.filter_by_email(email).exists():
                 error_message = _("A user with this email already exists.")
                 if is_ajax:
                     return JsonResponse({'success': False, 'message': error_message, 'fields': fields})
@@ -112,47 +111,12 @@ class RegisterView(TemplateView):
                 # Create user profile
                 Profile.objects.create(user=user)
 
-                # Ensure metadata is a dictionary
-                if not isinstance(user.metadata, dict):
-                    user.metadata = {}
+                # Generate the 2FA code (kept in Redis with a TTL, not on the user row)
+                two_factor_code = two_factor_otp.issue(email)
 
-                # Generate and store 2FA code
-                two_factor_code = get_random_string(6, allowed_chars='0123456789')
-                user.metadata["two_factor_code"] = two_factor_code
-                user.metadata["two_factor_code_created_at"] = timezone.now().isoformat()
-                user.save()
-
-                # Build 2FA email
-                html_content = render_to_string(
-                    template_name="publics/emails/two_factor_email.html",
-                    context={
-                        "user": user,
-                        "two_factor_code": two_factor_code,
-                        "site_name": "Green Up Academy"
-                    }
-                )
-
-                email_message = EmailMessage(
-                    subject="Your 2-Factor Authentication Code",
-                    body=html_content,
-                    from_email=f"Green Up Academy <{config('EMAIL_HOST_USER')}>",
-                    to=[email],
-                )
-                email_message.content_subtype = "html"
-
-                # Gmail SMTP settings from .env
-                connection = get_connection(
-                    backend="django.core.mail.backends.smtp.EmailBackend",
-                    host="smtp.gmail.com",
-                    port=587,
-                    username=config('EMAIL_HOST_USER'),
-                    password=config('EMAIL_HOST_PASSWORD'),
-                    use_tls=True
-                )
-                email_message.connection = connection
-
-                # Send email
-                email_message.send()
+                # Send the 2FA email from the transactional queue once the user row is committed
+                user_id = str(user.id)
+                transaction.on_commit(lambda: send_two_factor_code.delay(user_id, two_factor_code))
 
             logger.info(f"✅ User registered and 2FA code sent to {email} (ID: {user.id})")
             success_message = _("Registration successful! Please check your email for the 2FA code.")
@@ -175,7 +139,7 @@ class RegisterView(TemplateView):
             return render(request, self.template_name, fields)
 
 
-class Verify2FAView(TemplateView):
+class Verify2FAView(ThrottleMixin, TemplateView):
     """
     Name: Verify2FAView
     Description: Handles 2FA code verification via AJAX.
@@ -184,6 +148,7 @@ class Verify2FAView(TemplateView):
     Author: ayemeleelgol@gmail.com
     """
     template_name = 'publics/auth/verify_2fa.html'
+    throttle_scope = 'verify_2fa'
 
     def get(self, request: HttpRequest, email: str, *args: Any, **kwargs: Any) -> HttpResponse:
         return render(request, self.template_name, {'email': email, 'error': None})
@@ -193,56 +158,35 @@ class Verify2FAView(TemplateView):
         is_ajax = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
 
         try:
-            user = User.objects.filter(email=email).first()
-            if not user:
-                error_message = _("No user found with this email.")
-                if is_ajax:
-                    return JsonResponse({'success': False, 'message': error_message})
-                messages.error(request, error_message)
-                return render(request, self.template_name, {'email': email})
-
-            if not isinstance(user.metadata, dict) or "two_factor_code" not in user.metadata:
-                error_message = _("Invalid or expired 2FA code. Please register again.")
+            # Check the code first: invalid guesses never reach the users table
+            result = two_factor_otp.verify(email, code)
+            if result != OTPResult.VALID:
+                error_messages = {
+                    OTPResult.EXPIRED: _("2FA code has expired. Please register again."),
+                    OTPResult.LOCKED: _("Too many invalid attempts. Please register again."),
+                    OTPResult.INVALID: _("Invalid 2FA code."),
+                }
+                error_message = error_messages[result]
                 if is_ajax:
                     return JsonResponse({'success': False, 'message': error_message})
                 messages.error(request, error_message)
                 return render(request, self.template_name, {'email': email})
 
-            stored_code = user.metadata.get("two_factor_code")
-            code_created_at = user.metadata.get("two_factor_code_created_at")
-            if not stored_code or not code_created_at:
-                error_message = _("Invalid or expired 2FA code. Please register again.")
-                if is_ajax:
-                    return JsonResponse({'success': False, 'message': error_message})
-                messages.error(request, error_message)
-                return render(request, self.template_name, {'email': email})
-
-            # Check if code is expired (10 minutes)
-            from datetime import datetime
-            created_at = datetime.fromisoformat(code_created_at)
-            if (timezone.now() - created_at).total_seconds() > 600:
-                error_message = _("2FA code has expired. Please register again.")
-                if is_ajax:
-                    return JsonResponse({'success': False, 'message': error_message})
-                messages.error(request, error_message)
-                return render(request, self.template_name, {'email': email})
-
-            if code != stored_code:
-                error_message = _("Invalid 2FA code.")
+            user = User.objects.filter_by_email(email).first()
+            if not user:
+                error_message = _("No user found with this email.")
                 if is_ajax:
                     return JsonResponse({'success': False, 'message': error_message})
                 messages.error(request, error_message)
                 return render(request, self.template_name, {'email': email})
 
-            # Activate user and clear 2FA code
+            # Activate user
             with transaction.atomic():
                 user.is_active = True
-                user.metadata.pop("two_factor_code", None)
-                user.metadata.pop("two_factor_code_created_at", None)
-                user.save()
+                user.save(update_fields=["is_active", "modified"])
 
                 from django.contrib.auth import login
-                login(request, user, backend='django.contrib.auth.backends.ModelBackend')
+                login(request, user, backend='green_up_apps.users.backends.CachedModelBackend')
 
             logger.info(f"✅ User {email} verified 2FA and logged in (ID: {user.id})")
             success_message = _("2FA verification successful! You are now logged in.")
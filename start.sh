@@ -6,16 +6,34 @@ echo "Starting startup script..."
 # Optional: wait for Redis to be available (quick pause)
 sleep 2
 
-# Start Celery worker in the background
-echo "Starting Celery worker..."
-celery -A green_up worker --loglevel=info --concurrency=1 &
-CELERY_PID=$!
+# Start one Celery worker per queue class in the background.
+# Override CELERY_WORKER_POOLS (space separated) to run a subset, e.g. when
+# bulk/maintenance workers live in a dedicated service.
+CELERY_WORKER_POOLS="${CELERY_WORKER_POOLS:-transactional notifications bulk maintenance}"
+CELERY_PIDS=()
+for pool in $CELERY_WORKER_POOLS; do
+  echo "Starting Celery worker pool '$pool'..."
+  python -m green_up.workers "$pool" &
+  CELERY_PIDS+=($!)
+done
+
+# Start the beat scheduler (periodic tasks such as the admin digest).
+# Only one beat may run per deployment; set CELERY_BEAT=0 on extra instances.
+if [ "${CELERY_BEAT:-1}" = "1" ]; then
+  echo "Starting Celery beat..."
+  celery -A green_up beat --loglevel=info &
+  CELERY_PIDS+=($!)
+fi
 
 # Handle shutdown signals to stop Celery properly
 function _term() {
-  echo "Shutting down Celery (PID $CELERY_PID)..."
-  kill -TERM "$CELERY_PID" 2>/dev/null || true
-  wait "$CELERY_PID" || true
+  echo "Shutting down Celery (PIDs ${CELERY_PIDS[*]})..."
+  for pid in "${CELERY_PIDS[@]}"; do
+    kill -TERM "$pid" 2>/dev/null || true
+  done
+  for pid in "${CELERY_PIDS[@]}"; do
+    wait "$pid" || true
+  done
   exit 0
 }
 trap _term SIGTERM